@@ -4,21 +4,58 @@
 # In[ ]:
 import re
 import time
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup, Comment # Keep Comment import just in case
-from selenium import webdriver
+import asyncio
+import gzip
+import json
+import hashlib
+import importlib
+import functools
+import argparse
+import contextlib
+import random
+import email.utils
 # from selenium.webdriver.chrome.service import Service # Original code did not pass Service explicitly, assuming chromedriver in PATH
-from urllib.parse import urljoin
-from datetime import datetime, timedelta
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox, LabelFrame # Added messagebox for errors and LabelFrame
+from urllib.parse import urljoin, urlparse
+from html import unescape as unescape_html
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, date, timezone
 import os # Added os for path manipulation
 import multiprocessing # Added multiprocessing for concurrent execution
 import threading # Added threading for single scrape types to keep UI responsive
 import sys # Added sys to check platform for multiprocessing support message
+import queue
+import csv
+import heapq
+import zoneinfo
+import sqlite3
+import atexit
+import glob
 
 
+class LazyModule:
+    """
+    Stands in for a heavy module and imports it on first attribute access. pandas, bs4, requests, selenium and
+    tkinter are only loaded by the code paths that use them, so headless/cron runs start quickly and never need a display.
+    """
+
+    def __init__(self, module_name):
+        self._module_name = module_name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._module_name)
+        return getattr(self._module, attr)
+
+
+requests = LazyModule("requests")
+pd = LazyModule("pandas")
+bs4 = LazyModule("bs4")
+webdriver = LazyModule("selenium.webdriver")
+tk = LazyModule("tkinter")
+filedialog = LazyModule("tkinter.filedialog")
+
 # Global variables for UI state and dynamically created widgets
 year_entries = []
 output_dir_path = ""
@@ -28,6 +65,8 @@ year_entries_frame = None # Frame to hold year entries
 
 # Global references to buttons to allow disabling/enabling
 scrape_all_season_button = None
+update_season_button = None
+redrive_button = None
 scrape_range_button = None
 create_fields_button = None
 start_multi_year_button = None
@@ -37,68 +76,1418 @@ num_years_spinbox = None
 season_entry = None
 start_date_entry = None
 end_date_entry = None
+use_selenium_var = None
+use_proxies_var = None
+output_format_vars = {}
+progress_label = None
+cancel_button = None
+cancel_event = None # Event of the run in progress; set by the Cancel button
+last_status_color = None # Colour of the last update_status call; the CLI turns "red" into a non-zero exit code.
+
+# HTML parsing. Pages are parsed once, restricted to the subtrees the extractors read, with HTML_PARSER
+# ("lxml" is several times faster than "html.parser"; we fall back to html.parser when lxml is not installed).
+HTML_PARSER = "lxml"
+# Strainers match on the raw class attribute, so the patterns accept the class among others ("gamelink right").
+SCOREBOX_CLASS_PATTERN = re.compile(r'(?:^|\s)scorebox(?:\s|$)')
+DAILY_BOXES_CLASS_PATTERN = re.compile(r'(?:^|\s)(?:gamelink|game_summaries)(?:\s|$)')
+WEATHER_MARKER = "Start Time Weather:"
+
+# Output backends selected per run. "excel" and "text" are the original outputs; "csv" is the same table as plain text;
+# "parquet" and "feather" (need pyarrow) are written per season under games_<format>/season=<year>/.
+# Every backend appends chunk by chunk, so a run's outputs are never built in memory in one piece.
+# "sqlite" upserts every game into one database in the output directory (see SQLITE_* below).
+OUTPUT_FORMATS = ("excel", "text")
+OUTPUT_CHUNK_ROWS = 1000 # rows handed to the output backends per write
+# Start times are normalized column-wise for frames of at least this many rows. Smaller ones (the last chunk of a
+# streamed run, a short date range) are converted row by row, which is faster there: the column-wise path has a
+# fixed cost of several milliseconds in pandas calls, whatever the row count.
+DATETIME_COLUMNWISE_MIN_ROWS = 400
+
+# SQLite backend ("sqlite" output format): one database per output directory, upserted by Game Link.
+SQLITE_DB_FILENAME = "mlb_games.sqlite"
+SQLITE_TABLE = "games"
+SQLITE_BATCH_SIZE = 500
+SQLITE_BUSY_TIMEOUT = 30
+SQLITE_INDEXES = {
+    "idx_games_date": ("Date",),
+    "idx_games_venue": ("Venue",),
+    "idx_games_teams": ("Home Team", "Away Team"),
+    "idx_games_season": ("Season",),
+}
+
+# Box score tables (BOX_TABLES_ENABLED, or --box-tables on the command line): the line score and both teams' batting
+# and pitching tables are read from the same box score HTML, in one pass over the comment blocks baseball-reference
+# hides most tables in. Each table is written per season to <output dir>/<table>_<BOX_TABLE_FORMAT>/season=<year>/
+# <year_identifier>.<format>, one row per team or player, and joins to the games outputs on 'Game Link'.
+BOX_TABLES_ENABLED = False
+BOX_TABLE_FORMAT = "parquet" # "parquet" or "feather" (needs pyarrow)
+# Play-by-play events (PLAY_BY_PLAY_ENABLED, or --play-by-play): read in the same pass as the box score tables, but
+# never held on the games or the checkpoint. Events are buffered column-wise and every PLAY_BY_PLAY_CHUNK_ROWS of them
+# are written as one complete part file, <output dir>/play_by_play_<BOX_TABLE_FORMAT>/season=<year>/
+# <year_identifier>.part<NNNNN>.<format>, one row per event keyed by 'Game Link' and 'Event'.
+PLAY_BY_PLAY_ENABLED = False
+PLAY_BY_PLAY_CHUNK_ROWS = 20000
+
+# Scrape configuration
+# HTTP-only mode downloads each box score page once and reuses that HTML for metadata, scores and weather.
+# Selenium is only used when explicitly requested or as a per-link fallback when the HTTP fetch fails.
+BASE_SITE = "https://www.baseball-reference.com" # the offline benchmark points this at its local fixture server
+USE_SELENIUM = False
+SELENIUM_FALLBACK = True
+REQUEST_TIMEOUT = 15 # seconds
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+}
+# Concurrent fetch engine limits. MAX_IN_FLIGHT bounds the total number of box score requests running at once;
+# per host, the RateGovernor allows at most PER_HOST_LIMIT of them, started PER_HOST_MIN_INTERVAL apart.
+MAX_IN_FLIGHT = 8
+PER_HOST_LIMIT = 4
+PER_HOST_MIN_INTERVAL = 0.25 # seconds between request starts against the same host
+
+# On-disk HTTP response cache. Pages for finished seasons never change, so they are kept forever;
+# current-season schedule and daily /boxes/ pages expire quickly. HTTP_CACHE_DIR=None stores the
+# cache in "<output dir>/.http_cache"; HTTP_CACHE_ENABLED=False turns it off.
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = None
+HTTP_CACHE_MAX_BYTES = 2 * 1024 ** 3
+CURRENT_SEASON_CACHE_TTL = 60 * 60 # seconds
+DEFAULT_CACHE_TTL = 24 * 60 * 60 # seconds, for pages the policy does not recognise
+
+# Headless Chrome pool used by the Selenium path. Drivers load pages with the "eager" strategy and wait for
+# the .scorebox_meta element instead of sleeping, and are restarted after WEBDRIVER_RECYCLE_AFTER pages.
+WEBDRIVER_POOL_SIZE = 2
+WEBDRIVER_RECYCLE_AFTER = 150 # pages
+WEBDRIVER_WAIT_TIMEOUT = 15 # seconds
+WEBDRIVER_WAIT_SELECTOR = ".scorebox_meta"
+
+# Multi-year scheduler. Game links of every requested year go into one shared task queue that a fixed-size
+# process pool drains. MAX_SCRAPE_WORKERS=None sizes the pool from CPU count and available memory.
+MAX_SCRAPE_WORKERS = None
+WORKER_MEMORY_ESTIMATE = 250 * 1024 ** 2 # bytes per HTTP worker process
+SELENIUM_WORKER_MEMORY_ESTIMATE = 600 * 1024 ** 2 # bytes per worker process running Chrome
+SCHEDULER_BATCH_SIZE = 8 # links per task pulled from the shared queue
+PROGRESS_UPDATE_INTERVAL = 2 # seconds between progress refreshes (status area, or console when headless)
+SCRAPE_CANCELLED = "Cancelled" # error reported for links skipped because the run was cancelled
+
+# Failed links are buffered and appended to {year_identifier}_failed_links.csv in batches. A redrive run reads the
+# file back, scrapes only those links and merges the recovered games into the existing season output. It runs
+# at the normal concurrency: every box score is on one host, so the rate governor's per-host limit applies anyway.
+FAILED_LINK_FLUSH_SIZE = 50 # failures buffered before they are written
+
+# Streaming pipeline: links are discovered, fetched, extracted, enriched and written as they flow through, so
+# memory stays flat however long the run is. Finished games wait in a bounded queue for the writer; fetching
+# pauses when it is full. Games are passed on in link order, so no link is started more than STREAM_REORDER_WINDOW
+# links past the oldest one still unfinished (for example waiting out a retry backoff): that bounds the games
+# held back for reordering. Enrichment and writes happen OUTPUT_CHUNK_ROWS games at a time.
+STREAM_QUEUE_SIZE = 256
+STREAM_REORDER_WINDOW = 128
+
+# Proxy manager. The proxy list is cached on disk for PROXY_LIST_TTL, health-checked concurrently and ranked by
+# success rate and latency. Proxies that fail PROXY_QUARANTINE_AFTER times in a row are benched for a while.
+USE_PROXIES = False
+PROXY_SOURCE_URL = "https://proxylist.geonode.com/api/proxy-list?limit=500&page=1&sort_by=lastChecked&sort_type=desc"
+PROXY_CHECK_URL = "https://www.gstatic.com/generate_204"
+PROXY_CHECK_TIMEOUT = 5 # seconds
+PROXY_CHECK_WORKERS = 50
+PROXY_LIST_TTL = 30 * 60 # seconds
+PROXY_TOP_CANDIDATES = 10 # requests rotate across this many of the best proxies
+PROXY_QUARANTINE_AFTER = 3 # consecutive failures
+PROXY_QUARANTINE_SECONDS = 120 # doubled for every further failure, capped at an hour
+PROXY_ATTEMPTS = 2 # proxies tried per request before giving up on proxies for it
+PROXY_DIRECT_FALLBACK = True
+
+# Run metrics: per-stage timings and event counters, exported at the end of every run as
+# <output dir>/<run>_metrics.json and a Prometheus textfile (point METRICS_TEXTFILE_DIR at node_exporter's
+# --collector.textfile.directory to scrape it; defaults to the output dir).
+# Stages: proxy_selection, page_load (includes proxy_selection when proxies are on), parse, weather,
+# box_tables (with play-by-play), lookup_merge, datetime_normalize, save_<output format> and save_<table>.
+# Events: games, failures, retries, proxy_changes, cache_hits.
+METRICS_ENABLED = True
+METRICS_TEXTFILE_DIR = None
+
+# Adaptive rate governor (RateGovernor) and retry scheduling. Throttle responses halve a host's concurrency
+# limit and pause it (Retry-After, or GOVERNOR_BASE_COOLDOWN doubled per consecutive throttle); healthy
+# responses add it back gradually up to GOVERNOR_MAX_CONCURRENCY. With GOVERNOR_ENABLED=False the governor
+# still enforces the per-host limits above, but never adapts them. Links that fail with a retryable error are
+# rescheduled up to LINK_MAX_RETRIES times with exponential backoff and jitter before being logged as failed.
+GOVERNOR_ENABLED = True
+GOVERNOR_MAX_CONCURRENCY = PER_HOST_LIMIT
+GOVERNOR_MIN_CONCURRENCY = 1
+GOVERNOR_DECREASE_FACTOR = 0.5
+GOVERNOR_BASE_COOLDOWN = 5 # seconds
+GOVERNOR_MAX_COOLDOWN = 300 # seconds
+THROTTLE_STATUS_CODES = (403, 429, 503)
+RETRYABLE_STATUS_CODES = (403, 408, 429, 500, 502, 503, 504)
+LINK_MAX_RETRIES = 3
+LINK_RETRY_BASE_DELAY = 2 # seconds, doubled for every further retry
+LINK_RETRY_MAX_DELAY = 120 # seconds
+
+# Settings copied into multi-year worker processes. Spawned workers re-import this file, so without this
+# any value changed at runtime (for example by the benchmark suite) would silently revert to the default there.
+WORKER_SETTING_NAMES = ("BASE_SITE", "SELENIUM_FALLBACK", "REQUEST_TIMEOUT", "PER_HOST_LIMIT", "PER_HOST_MIN_INTERVAL",
+                        "HTTP_CACHE_ENABLED", "HTTP_CACHE_DIR", "HTML_PARSER", "METRICS_ENABLED", "GOVERNOR_ENABLED",
+                        "GOVERNOR_MAX_CONCURRENCY", "LINK_MAX_RETRIES", "LINK_RETRY_BASE_DELAY", "BOX_TABLES_ENABLED",
+                        "PLAY_BY_PLAY_ENABLED")
+
+
+_resolved_html_parser = None
+
+
+def resolve_html_parser():
+    """Returns the configured BeautifulSoup parser, falling back to html.parser if it is not installed."""
+    global _resolved_html_parser
+    if _resolved_html_parser is None:
+        try:
+            bs4.BeautifulSoup("<p></p>", HTML_PARSER)
+            _resolved_html_parser = HTML_PARSER
+        except Exception:
+            print(f"Process {os.getpid()}: HTML parser '{HTML_PARSER}' is not available. Falling back to 'html.parser'.")
+            _resolved_html_parser = "html.parser"
+    return _resolved_html_parser
+
+
+@functools.lru_cache(maxsize=None)
+def soup_strainer(name):
+    """Builds (once) the SoupStrainer that limits parsing to the subtree an extractor reads."""
+    if name == "scorebox":
+        return bs4.SoupStrainer("div", class_=SCOREBOX_CLASS_PATTERN)
+    if name == "schedule_links":
+        return bs4.SoupStrainer("em")
+    if name == "daily_boxes":
+        return bs4.SoupStrainer(["td", "div"], class_=DAILY_BOXES_CLASS_PATTERN)
+    raise ValueError(f"Unknown strainer: {name}")
+
+
+def find_weather_text(html):
+    """
+    Returns the text node that contains the weather line, matching what
+    soup.find(string=lambda text: WEATHER_MARKER in text) returns, without parsing the page.
+    """
+    marker_index = html.find(WEATHER_MARKER)
+    if marker_index == -1:
+        return None
+    comment_start = html.rfind("<!--", 0, marker_index)
+    if comment_start != -1 and html.rfind("-->", comment_start, marker_index) == -1:
+        # Inside a comment: the node is the whole comment body.
+        comment_end = html.find("-->", marker_index)
+        return html[comment_start + 4:comment_end if comment_end != -1 else len(html)].strip()
+    # Plain markup: the node is the text between the surrounding tags.
+    text_start = html.rfind(">", 0, marker_index) + 1
+    text_end = html.find("<", marker_index)
+    return html[text_start:text_end if text_end != -1 else len(html)].strip()
+
+
+BOX_TABLE_ID_PATTERN = re.compile(r'<table[^>]*\bid="[^"]*?(batting|pitching|play_by_play)"')
+BOX_TABLE_NAMES = ("line_score", "batting", "pitching")
+# Rows of the play-by-play table that are not events: inning summaries, repeated headers and substitution notes.
+PLAY_BY_PLAY_SKIPPED_ROW_CLASSES = {"thead", "spacer", "pbp_summary_top", "pbp_summary_bottom", "ingame_substitution"}
+# The stats tables are machine generated, so rows and cells are read with str.find and patterns instead of building
+# a tree per table.
+BOX_TABLE_CELL_PATTERN = re.compile(r'<(th|td)\b([^>]*)>(.*?)</\1>', re.DOTALL)
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def _line_score_table_start(html):
+    """Returns where the <table> tag with the linescore class starts (not its linescore_wrap container), or -1."""
+    position = html.find("linescore")
+    while position != -1:
+        tag_start = html.rfind("<", 0, position)
+        if html.startswith("<table", tag_start) and html.find(">", tag_start) > position:
+            return tag_start
+        position = html.find("linescore", position + 9)
+    return -1
+
+
+def box_table_fragments(html):
+    """
+    Yields (table name, HTML fragment) for the line score, every batting/pitching table and the play-by-play table,
+    in one left-to-right walk over the page's comment blocks. The line score is normally left uncommented and is
+    picked up on the way.
+    """
+    line_score_start = _line_score_table_start(html)
+    position = 0
+    while True:
+        comment_start = html.find("<!--", position)
+        if line_score_start != -1 and (comment_start == -1 or line_score_start < comment_start):
+            line_score_end = html.find("</table>", line_score_start)
+            if line_score_end != -1:
+                yield "line_score", html[line_score_start:line_score_end + 8]
+            line_score_start = -1
+        if comment_start == -1:
+            return
+        comment_end = html.find("-->", comment_start + 4)
+        if comment_end == -1:
+            comment_end = len(html)
+        if comment_start < line_score_start < comment_end:
+            line_score_start = -1 # commented out as well; read below with the other comments
+        comment = html[comment_start + 4:comment_end]
+        table_match = BOX_TABLE_ID_PATTERN.search(comment)
+        if table_match:
+            yield table_match.group(1), comment
+        elif _line_score_table_start(comment) != -1:
+            yield "line_score", comment
+        position = comment_end + 3
+
+
+def _box_table_rows(fragment, section):
+    """Yields (row attributes, [(cell attributes, cell text)]) for the rows of one <thead>/<tbody> section of a table."""
+    section_start = fragment.find(f"<{section}")
+    section_end = fragment.find(f"</{section}>", section_start)
+    if section_start == -1 or section_end == -1:
+        return
+    position = section_start
+    while True:
+        row_start = fragment.find("<tr", position, section_end)
+        if row_start == -1:
+            return
+        attributes_end = fragment.find(">", row_start, section_end)
+        row_end = fragment.find("</tr>", attributes_end, section_end)
+        if attributes_end == -1 or row_end == -1:
+            return
+        position = row_end + 5
+        if fragment[row_start + 3] not in " \t\r\n>":
+            position = row_start + 3 # a longer tag name such as <track>
+            continue
+        cells = [(cell_attributes, _cell_text(cell_html))
+                 for _, cell_attributes, cell_html in BOX_TABLE_CELL_PATTERN.findall(fragment, attributes_end + 1, row_end)]
+        yield fragment[row_start + 3:attributes_end], cells
+
+
+def _cell_text(cell_html):
+    """The cell's text with tags removed, entities decoded and whitespace collapsed (most cells are a bare number)."""
+    if "<" in cell_html:
+        cell_html = HTML_TAG_PATTERN.sub(" ", cell_html)
+    if "&" in cell_html:
+        cell_html = unescape_html(cell_html)
+    return " ".join(cell_html.split())
+
+
+@functools.lru_cache(maxsize=4096)
+def _html_attribute(attributes, name):
+    """
+    Returns the decoded value of a double-quoted attribute, or None. name must start an attribute (follow whitespace),
+    so "class" is not found in data-class="...". Cached: the stats tables repeat the same few attribute strings on every row.
+    """
+    key = f'{name}="'
+    start = attributes.find(key)
+    while start > 0 and not attributes[start - 1].isspace():
+        start = attributes.find(key, start + 1)
+    if start == -1:
+        return None
+    start += len(key)
+    end = attributes.find('"', start)
+    if end == -1:
+        return None
+    value = attributes[start:end]
+    return unescape_html(value) if "&" in value else value
+
+
+def parse_line_score(fragment):
+    """Returns the line score rows (away team first): Team, Innings (runs per inning, None for an unplayed "X"), R, H, E."""
+    header = next(([text for _, text in cells] for _, cells in _box_table_rows(fragment, "thead")), [])
+    line_score = []
+    for _, cells in _box_table_rows(fragment, "tbody"):
+        if len(cells) != len(header):
+            continue
+        values = dict(zip(header, (text for _, text in cells)))
+        line_score.append({"Team": cells[1][1], "Innings": [leading_number(values[label]) for label in header if label.isdigit()],
+                           "R": leading_number(values.get("R")), "H": leading_number(values.get("H")), "E": leading_number(values.get("E"))})
+    return line_score
+
+
+def parse_stats_table(fragment):
+    """Returns one row per player of a batting or pitching table: Team, Player, Player ID and every data-stat cell as text."""
+    caption = re.search(r'<caption>(.*?)</caption>', fragment, re.DOTALL)
+    team = unescape_html(caption.group(1)).strip().removesuffix(" Table") if caption else None
+    players = []
+    for row_attributes, cells in _box_table_rows(fragment, "tbody"):
+        # Repeated header rows and spacers sit between the players on long tables.
+        row_classes = (_html_attribute(row_attributes, "class") or "").split()
+        if "thead" in row_classes or "spacer" in row_classes:
+            continue
+        player = None
+        for cell_attributes, text in cells:
+            stat = _html_attribute(cell_attributes, "data-stat")
+            if stat == "player":
+                player = {"Team": team, "Player": text, "Player ID": _html_attribute(cell_attributes, "data-append-csv")}
+            elif stat and player is not None:
+                player[stat] = text or None
+        if player is not None:
+            players.append(player)
+    return players
+
+
+def parse_play_by_play(fragment):
+    """
+    Returns the events of a play-by-play table column-wise: Event (its order in the game), Inning, Half ("top" or
+    "bottom") and every data-stat cell as text. Built straight into columns so a game never exists as row dicts.
+    """
+    events = {"Event": [], "Inning": [], "Half": []}
+    for row_attributes, cells in _box_table_rows(fragment, "tbody"):
+        if not PLAY_BY_PLAY_SKIPPED_ROW_CLASSES.isdisjoint((_html_attribute(row_attributes, "class") or "").split()):
+            continue
+        values = {_html_attribute(cell_attributes, "data-stat"): text or None for cell_attributes, text in cells}
+        inning = values.get("inning")
+        if not inning:
+            continue
+        row_index = len(events["Event"])
+        for stat, value in values.items():
+            if stat and stat not in events:
+                events[stat] = [None] * row_index
+        for column, column_values in events.items():
+            column_values.append(values.get(column))
+        events["Event"][-1] = row_index
+        events["Inning"][-1] = leading_number(inning[1:])
+        events["Half"][-1] = {"t": "top", "b": "bottom"}.get(inning[0])
+    return events if events["Event"] else {}
+
+
+def extract_box_tables(html, names=BOX_TABLE_NAMES):
+    """
+    Reads the line score and both teams' batting and pitching tables from a box score page, or only the tables in
+    names; "play_by_play" in names adds the events from parse_play_by_play() in the same walk.
+    Returns {table name: {column: values}}, one entry per row; teams appear away first, with Side set to "away"/"home".
+    """
+    rows = {table: [] for table in names if table != "play_by_play"}
+    tables_seen = dict.fromkeys(rows, 0)
+    play_by_play = {}
+    for table, fragment in box_table_fragments(html):
+        if table == "play_by_play":
+            if "play_by_play" in names:
+                play_by_play = parse_play_by_play(fragment)
+            continue
+        if table not in rows:
+            continue
+        if table == "line_score":
+            table_rows = parse_line_score(fragment)
+            for side, row in zip(("away", "home"), table_rows):
+                row["Side"] = side
+        else:
+            table_rows = parse_stats_table(fragment)
+            side = "away" if tables_seen[table] == 0 else "home"
+            for row in table_rows:
+                row["Side"] = side
+        tables_seen[table] += 1
+        rows[table].extend(table_rows)
+    # Column-wise, so a checkpoint line stores each column name once.
+    tables = {}
+    for table, table_rows in rows.items():
+        columns = list(dict.fromkeys(column for row in table_rows for column in row))
+        tables[table] = {column: [row.get(column) for row in table_rows] for column in columns}
+    if "play_by_play" in names:
+        tables["play_by_play"] = play_by_play
+    return tables
+
+
+BOX_SCORE_LINK_PATTERN = re.compile(r'/boxes/[A-Z]{3}/[A-Z]{3}(\d{4})(\d{2})(\d{2})\d\.shtml$')
+SCHEDULE_LINK_PATTERN = re.compile(r'/leagues/majors/(\d{4})-schedule\.shtml$')
+
+
+def box_score_date(link):
+    """Returns the game date encoded in a box score link (e.g. /boxes/NYA/NYA202304050.shtml), or None."""
+    match = BOX_SCORE_LINK_PATTERN.search(urlparse(link).path)
+    if not match:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def cache_ttl_for_url(url):
+    """Returns how long (in seconds) a cached page stays valid, or None if it never expires."""
+    current_year = date.today().year
+    parsed = urlparse(url)
+
+    box_score_match = BOX_SCORE_LINK_PATTERN.search(parsed.path)
+    if box_score_match:
+        # A box score only gets a link once the game is final, after that the page does not change.
+        return None
+
+    schedule_match = SCHEDULE_LINK_PATTERN.search(parsed.path)
+    if schedule_match:
+        return None if int(schedule_match.group(1)) < current_year else CURRENT_SEASON_CACHE_TTL
+
+    if parsed.path.rstrip("/") == "/boxes":
+        year_match = re.search(r'(?:^|&)year=(\d{4})', parsed.query)
+        if year_match and int(year_match.group(1)) < current_year:
+            return None
+        return CURRENT_SEASON_CACHE_TTL
+
+    return DEFAULT_CACHE_TTL
+
+
+class ResponseCache:
+    """
+    Gzip-compressed page cache on disk, keyed by URL. Entries expire according to cache_ttl_for_url
+    and the least recently used entries are evicted once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes or HTTP_CACHE_MAX_BYTES
+        self._total_bytes = None
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path_for(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def get(self, url):
+        """Returns the cached page text, or None on a miss or an expired entry."""
+        path = self._path_for(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Process {os.getpid()}: Discarding unreadable cache entry for {url}: {str(e)}")
+            self._remove(path)
+            return None
+
+        ttl = cache_ttl_for_url(url)
+        if entry.get("url") != url or (ttl is not None and time.time() - entry.get("stored_at", 0) > ttl):
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path) # mtime doubles as the last-access time for LRU eviction
+        except OSError:
+            pass
+        return entry.get("text")
+
+    def put(self, url, text):
+        """Stores a page. Writes go through a temporary file so readers never see a partial entry."""
+        path = self._path_for(url)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as cache_file:
+                json.dump({"url": url, "stored_at": time.time(), "text": text}, cache_file)
+            os.replace(temp_path, path)
+            self._account(os.path.getsize(path))
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not write cache entry for {url}: {str(e)}")
+            self._remove(temp_path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        entries = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename.endswith(".json.gz"):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _account(self, added_bytes):
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += added_bytes
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Removes least recently used entries until the cache is back under 90% of max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        print(f"Process {os.getpid()}: Evicted {removed} entries from HTTP cache {self.cache_dir}.")
+
+
+_response_caches = {}
+
+
+def get_response_cache(output_dir):
+    """Returns the process-wide ResponseCache for the configured cache directory, or None when caching is off."""
+    if not HTTP_CACHE_ENABLED:
+        return None
+    cache_dir = HTTP_CACHE_DIR or (os.path.join(output_dir, ".http_cache") if output_dir else None)
+    if not cache_dir:
+        return None
+    cache_dir = os.path.abspath(cache_dir)
+    if cache_dir not in _response_caches:
+        try:
+            _response_caches[cache_dir] = ResponseCache(cache_dir)
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not open HTTP cache at {cache_dir}: {str(e)}. Continuing without cache.")
+            return None
+    return _response_caches[cache_dir]
+
+
+class GameCheckpoint:
+    """
+    Append-only JSON-lines store of finished games for one run, keyed by 'Game Link'.
+    Every scraped game is written as soon as it completes, so a crash only loses the games in flight.
+    It only lives until the run's outputs are committed (see stream_game_data_and_save()): a finished season
+    is scraped afresh the next time, with the settings and parser of that run.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._tail_checked = False
+
+    @classmethod
+    def for_run(cls, output_dir, year_identifier):
+        """Returns the checkpoint for a run, or None if the run has no output directory."""
+        if not output_dir or not year_identifier:
+            return None
+        return cls(os.path.join(output_dir, f"{year_identifier}_checkpoint.jsonl"))
+
+    def _iter_entries(self):
+        """Yields (file offset, game_info) for every readable line. A torn last line from a crash is ignored."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                offset = 0
+                for line in checkpoint_file:
+                    try:
+                        game_info = json.loads(line)
+                    except ValueError:
+                        game_info = {}
+                    if game_info.get('Game Link'):
+                        yield offset, game_info
+                    offset += len(line)
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read checkpoint {self.path}: {str(e)}")
+
+    def load(self):
+        """Returns {game_link: game_info} for every checkpointed game."""
+        return {game_info['Game Link']: game_info for _, game_info in self._iter_entries()}
+
+    def index(self):
+        """Returns {game_link: file offset} for every checkpointed game, so long runs can read games back one at a time."""
+        return {game_info['Game Link']: offset for offset, game_info in self._iter_entries()}
+
+    def read(self, offset):
+        """Returns the game_info stored at an offset from index(), or None if it cannot be read."""
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                checkpoint_file.seek(offset)
+                return json.loads(checkpoint_file.readline())
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read checkpoint {self.path} at offset {offset}: {str(e)}")
+            return None
+
+    def append(self, game_info):
+        try:
+            line = json.dumps(game_info, ensure_ascii=False) + "\n"
+            with self._lock:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                if not self._tail_checked and os.path.exists(self.path):
+                    # A torn last line from a crash is ended first, so the next game does not run into it.
+                    with open(self.path, "rb") as checkpoint_file:
+                        if checkpoint_file.seek(0, os.SEEK_END):
+                            checkpoint_file.seek(-1, os.SEEK_END)
+                            if checkpoint_file.read(1) != b"\n":
+                                line = "\n" + line
+                self._tail_checked = True
+                with open(self.path, "a", encoding="utf-8") as checkpoint_file:
+                    checkpoint_file.write(line)
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not checkpoint {game_info.get('Game Link')} to {self.path}: {str(e)}")
+
+    def remove(self):
+        """Deletes the checkpoint once its games are in the committed outputs, so the next run scrapes afresh."""
+        with self._lock:
+            self._tail_checked = False
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not remove checkpoint {self.path}: {str(e)}")
+
+
+class FailedLinkLog:
+    """
+    Buffered {year_identifier}_failed_links.csv writer with FailedLink/Error columns.
+    Failures are held in memory and appended FAILED_LINK_FLUSH_SIZE at a time; flush() writes the rest.
+    """
+
+    COLUMNS = ['FailedLink', 'Error']
+
+    def __init__(self, path):
+        self.path = path
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, output_dir, year_identifier):
+        """Returns the failed-link log for a run, or None if the run has no output directory."""
+        if not output_dir or not year_identifier:
+            return None
+        return cls(os.path.join(output_dir, f"{year_identifier}_failed_links.csv"))
+
+    def add(self, link, error):
+        with self._lock:
+            self._buffer.append((link, error))
+            if len(self._buffer) < FAILED_LINK_FLUSH_SIZE:
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                with open(self.path, "a", newline="", encoding="utf-8") as failed_file:
+                    writer = csv.writer(failed_file)
+                    if write_header:
+                        writer.writerow(self.COLUMNS)
+                    writer.writerows(rows)
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not save {len(rows)} failed links to {self.path}. Reason: {e}")
+
+    def load(self):
+        """Returns {link: error} for every logged failure, keeping the latest error of a link that failed more than once."""
+        failed = {}
+        if not os.path.exists(self.path):
+            return failed
+        try:
+            with open(self.path, "r", newline="", encoding="utf-8") as failed_file:
+                for row in csv.DictReader(failed_file):
+                    if row.get('FailedLink'):
+                        failed[row['FailedLink']] = row.get('Error') or ""
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read failed links {self.path}: {str(e)}")
+        return failed
+
+    def rewrite(self, failed):
+        """Replaces the file with the given {link: error} entries, or removes it when there are none left."""
+        self.flush()
+        with self._lock:
+            if not failed:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", newline="", encoding="utf-8") as failed_file:
+                writer = csv.writer(failed_file)
+                writer.writerow(self.COLUMNS)
+                writer.writerows(failed.items())
+            os.replace(temp_path, self.path)
+
+
+class ScrapeMetrics:
+    """
+    Per-stage timings and event counters for a run, grouped by season. Thread-safe. Worker processes send
+    snapshot() deltas back with their results and the main process merge()s them, so the exported summary
+    covers every process. The season a measurement belongs to comes from season_scope() on the current thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scope = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.stages = {} # (season, stage) -> [count, total seconds, max seconds]
+            self.counters = {} # (season, event) -> count
+
+    @contextlib.contextmanager
+    def season_scope(self, season):
+        """Attributes everything measured on this thread inside the block to `season`."""
+        previous = getattr(self._scope, "season", None)
+        self._scope.season = str(season) if season is not None else previous
+        try:
+            yield
+        finally:
+            self._scope.season = previous
+
+    def _season(self, season):
+        if season is not None:
+            return str(season)
+        return getattr(self._scope, "season", None) or "all"
+
+    @contextlib.contextmanager
+    def time_stage(self, stage, season=None):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start_time, season)
+
+    def observe(self, stage, seconds, season=None):
+        if not METRICS_ENABLED:
+            return
+        key = (self._season(season), stage)
+        with self._lock:
+            entry = self.stages.setdefault(key, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def increment(self, event, season=None, amount=1):
+        if not METRICS_ENABLED:
+            return
+        key = (self._season(season), event)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def snapshot(self, reset=False):
+        """Returns the recorded data as plain picklable dicts (and optionally starts over)."""
+        with self._lock:
+            data = {"stages": {key: list(entry) for key, entry in self.stages.items()}, "counters": dict(self.counters)}
+            if reset:
+                self.stages, self.counters = {}, {}
+        return data
+
+    def merge(self, data):
+        """Adds a snapshot() taken in another process."""
+        if not data:
+            return
+        with self._lock:
+            for key, (count, total_seconds, max_seconds) in data["stages"].items():
+                entry = self.stages.setdefault(key, [0, 0.0, 0.0])
+                entry[0] += count
+                entry[1] += total_seconds
+                entry[2] = max(entry[2], max_seconds)
+            for key, count in data["counters"].items():
+                self.counters[key] = self.counters.get(key, 0) + count
+
+    def summary(self):
+        """Nested {season: {"stages": {...}, "counters": {...}}} summary of the run."""
+        data = self.snapshot()
+        seasons = {}
+        for (season, stage), (count, total_seconds, max_seconds) in sorted(data["stages"].items()):
+            seasons.setdefault(season, {"stages": {}, "counters": {}})["stages"][stage] = {
+                "count": count, "total_seconds": round(total_seconds, 6),
+                "mean_seconds": round(total_seconds / count, 6) if count else 0.0, "max_seconds": round(max_seconds, 6)}
+        for (season, event), count in sorted(data["counters"].items()):
+            seasons.setdefault(season, {"stages": {}, "counters": {}})["counters"][event] = count
+        return {"started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+                "duration_seconds": round(time.time() - self.started_at, 3), "seasons": seasons}
+
+    def prometheus_text(self, run_label):
+        """Renders the run in the Prometheus text exposition format (for node_exporter's textfile collector)."""
+        data = self.snapshot()
+        label = run_label.replace("\\", "\\\\").replace('"', '\\"')
+        lines = [
+            "# HELP mlb_scraper_stage_seconds_total Time spent in each scrape stage.",
+            "# TYPE mlb_scraper_stage_seconds_total counter",
+        ]
+        lines += [f'mlb_scraper_stage_seconds_total{{run="{label}",season="{season}",stage="{stage}"}} {entry[1]:.6f}'
+                  for (season, stage), entry in sorted(data["stages"].items())]
+        lines += ["# HELP mlb_scraper_stage_calls_total Number of times each scrape stage ran.",
+                  "# TYPE mlb_scraper_stage_calls_total counter"]
+        lines += [f'mlb_scraper_stage_calls_total{{run="{label}",season="{season}",stage="{stage}"}} {entry[0]}'
+                  for (season, stage), entry in sorted(data["stages"].items())]
+        lines += ["# HELP mlb_scraper_stage_max_seconds Slowest single run of each scrape stage.",
+                  "# TYPE mlb_scraper_stage_max_seconds gauge"]
+        lines += [f'mlb_scraper_stage_max_seconds{{run="{label}",season="{season}",stage="{stage}"}} {entry[2]:.6f}'
+                  for (season, stage), entry in sorted(data["stages"].items())]
+        lines += ["# HELP mlb_scraper_events_total Games, retries, failures, proxy changes and cache hits.",
+                  "# TYPE mlb_scraper_events_total counter"]
+        lines += [f'mlb_scraper_events_total{{run="{label}",season="{season}",event="{event}"}} {count}'
+                  for (season, event), count in sorted(data["counters"].items())]
+        lines += ["# HELP mlb_scraper_run_duration_seconds Wall-clock duration of the run.",
+                  "# TYPE mlb_scraper_run_duration_seconds gauge",
+                  f'mlb_scraper_run_duration_seconds{{run="{label}"}} {time.time() - self.started_at:.3f}',
+                  "# HELP mlb_scraper_run_finished_timestamp_seconds When the run finished.",
+                  "# TYPE mlb_scraper_run_finished_timestamp_seconds gauge",
+                  f'mlb_scraper_run_finished_timestamp_seconds{{run="{label}"}} {time.time():.0f}']
+        return "\n".join(lines) + "\n"
+
+
+_metrics = ScrapeMetrics()
+
+
+def get_metrics():
+    """Returns the process-wide ScrapeMetrics."""
+    return _metrics
+
+
+def export_run_metrics(output_dir, run_label):
+    """
+    Writes the run's metrics to <output dir>/<run_label>_metrics.json and a Prometheus textfile
+    (<METRICS_TEXTFILE_DIR or output dir>/mlb_scraper_<run_label>.prom, replaced atomically).
+    """
+    if not METRICS_ENABLED or not output_dir:
+        return
+    try:
+        summary = get_metrics().summary()
+        summary["run"] = str(run_label)
+        json_filename = os.path.join(output_dir, f"{run_label}_metrics.json")
+        with open(json_filename, "w", encoding="utf-8") as json_file:
+            json.dump(summary, json_file, indent=2)
+
+        textfile_dir = METRICS_TEXTFILE_DIR or output_dir
+        os.makedirs(textfile_dir, exist_ok=True)
+        prom_filename = os.path.join(textfile_dir, f"mlb_scraper_{run_label}.prom")
+        temp_filename = f"{prom_filename}.{os.getpid()}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as prom_file:
+            prom_file.write(get_metrics().prometheus_text(str(run_label)))
+        os.replace(temp_filename, prom_filename)
+        print(f"Process {os.getpid()}: Run metrics saved to {json_filename} and {prom_filename}")
+    except Exception as e:
+        print(f"Process {os.getpid()}: Could not export run metrics for {run_label}: {str(e)}")
+
+
+class FetchError(Exception):
+    """A page request that came back with a non-200 status. Carries the status and any Retry-After delay."""
+
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"Failed to retrieve the webpage. Status code: {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def is_retryable_error(error):
+    """True for failures worth retrying later: throttling, server errors and network errors (not 404s or parse errors)."""
+    if isinstance(error, FetchError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    if type(error).__name__ == "TimeoutException" and type(error).__module__.startswith("selenium"):
+        return True # page load timed out in Chrome
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def next_retry_delay(error, attempt):
+    """
+    The retry policy shared by every fetch path: seconds to wait before retry number `attempt` (1-based) of a
+    failed request, or None when the error is final (not retryable, or LINK_MAX_RETRIES used up). Honours a
+    Retry-After the server sent, else backs off exponentially with jitter.
+    """
+    if attempt > LINK_MAX_RETRIES or not is_retryable_error(error):
+        return None
+    if isinstance(error, FetchError) and error.retry_after is not None:
+        return min(error.retry_after, LINK_RETRY_MAX_DELAY)
+    return min(LINK_RETRY_BASE_DELAY * 2 ** (attempt - 1), LINK_RETRY_MAX_DELAY) * random.uniform(0.5, 1.0)
+
+
+def parse_retry_after(value):
+    """Returns a Retry-After header (delta seconds or HTTP date) as seconds to wait, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateGovernor:
+    """
+    Per-host request governor shared by every thread in a process, and the only place requests to a host are
+    limited: request starts are spaced PER_HOST_MIN_INTERVAL apart and concurrency follows AIMD. Each healthy
+    response raises the host's limit by 1/limit (about +1 per round of requests) up to GOVERNOR_MAX_CONCURRENCY,
+    while a throttle response (429/403/503) halves it and pauses the host for its Retry-After delay, or an
+    exponentially growing cooldown when the server does not send one. GOVERNOR_ENABLED=False keeps the limit fixed.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._hosts = {}
+
+    def _state(self, host):
+        if host not in self._hosts:
+            self._hosts[host] = {"limit": float(GOVERNOR_MAX_CONCURRENCY), "in_flight": 0, "paused_until": 0.0,
+                                 "next_start": 0.0, "throttle_streak": 0}
+        return self._hosts[host]
+
+    def acquire(self, url):
+        """Blocks until the host of url is not paused, is due its next request start and has a free slot under its limit."""
+        host = urlparse(url).netloc
+        with self._condition:
+            while True:
+                state = self._state(host)
+                now = time.monotonic()
+                wait = max(state["paused_until"], state["next_start"]) - now
+                has_slot = state["in_flight"] < max(1, int(state["limit"]))
+                if wait <= 0 and has_slot:
+                    state["in_flight"] += 1
+                    state["next_start"] = now + PER_HOST_MIN_INTERVAL
+                    return host
+                # Without a free slot only a release helps; otherwise sleep until the host is due.
+                self._condition.wait(timeout=wait if has_slot else None)
+
+    def release(self, host, status_code=None, retry_after=None):
+        """Records the outcome of a request started with acquire(); status_code None means a network error."""
+        with self._condition:
+            state = self._state(host)
+            state["in_flight"] -= 1
+            if GOVERNOR_ENABLED:
+                self._adapt(host, state, status_code, retry_after)
+            self._condition.notify_all()
+
+    def _adapt(self, host, state, status_code, retry_after):
+        """AIMD step for one response; called with the condition held."""
+        if status_code in THROTTLE_STATUS_CODES:
+            state["throttle_streak"] += 1
+            state["limit"] = max(GOVERNOR_MIN_CONCURRENCY, state["limit"] * GOVERNOR_DECREASE_FACTOR)
+            cooldown = retry_after if retry_after is not None else GOVERNOR_BASE_COOLDOWN * 2 ** (state["throttle_streak"] - 1)
+            state["paused_until"] = max(state["paused_until"], time.monotonic() + min(cooldown, GOVERNOR_MAX_COOLDOWN))
+            print(f"Process {os.getpid()}: {host} throttled us (status {status_code}). "
+                  f"Concurrency limit now {state['limit']:.1f}, pausing {min(cooldown, GOVERNOR_MAX_COOLDOWN):.1f}s.")
+        elif status_code is None or status_code >= 500:
+            state["limit"] = max(GOVERNOR_MIN_CONCURRENCY, state["limit"] * GOVERNOR_DECREASE_FACTOR)
+        else:
+            state["throttle_streak"] = 0
+            state["limit"] = min(GOVERNOR_MAX_CONCURRENCY, state["limit"] + 1 / state["limit"])
+
+    @contextlib.contextmanager
+    def request(self, url):
+        """Holds a slot for one request. The caller sets slot["status_code"] and slot["retry_after"] from the response."""
+        slot = {"host": self.acquire(url), "status_code": None, "retry_after": None}
+        try:
+            yield slot
+        finally:
+            self.release(slot["host"], slot["status_code"], slot["retry_after"])
+
+    def limit(self, url):
+        with self._condition:
+            return self._state(urlparse(url).netloc)["limit"]
+
+
+_rate_governor = RateGovernor()
+
+
+def get_rate_governor():
+    """Returns the process-wide RateGovernor."""
+    return _rate_governor
+
+
+LEADING_NUMBER_PATTERN = re.compile(r'^\s*(-?\d+)')
+# Output dtypes of a games DataFrame: small nullable integers for the numeric fields, categories for the repetitive text.
+GAME_INTEGER_COLUMNS = ['Home Team Score', 'Away Team Score', 'Total Runs Scored', 'Temperature', 'Wind Speed']
+GAME_CATEGORY_COLUMNS = ['Home Team', 'Away Team', 'Home Team Symbol', 'Away Team Symbol', 'Venue', 'Weekday', 'Wind Direction',
+                         # Stadium fields from the lookup repeat for every home game.
+                         'Team', 'City', 'State', 'Longitude', 'Latitude', 'Time Zone', 'TZ Abb']
+# Start times as scraped ("7:05:00PM", or raw "Start Time:7:05 p.m." text) and the lookup's 'Time Zone' (POSIX style:
+# "+04:00" is four hours behind UTC). 'TZ Abb' is mapped to an IANA zone so daylight saving follows the game date;
+# other abbreviations fall back to the fixed offset.
+START_TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})(?::\d{2})?\s*([AP])\.?\s*M', re.IGNORECASE)
+POSIX_OFFSET_PATTERN = re.compile(r'^\s*([+-]?)(\d{1,2})(?::?(\d{2}))?\s*$')
+TZ_ABBREVIATION_ZONES = {
+    "EDT": "America/New_York", "EST": "America/New_York",
+    "CDT": "America/Chicago", "CST": "America/Chicago",
+    "MDT": "America/Denver", "MST": "America/Phoenix",
+    "PDT": "America/Los_Angeles", "PST": "America/Los_Angeles",
+}
+
+
+def leading_number(value):
+    """Returns the whole number at the start of a value such as "72° F" or "10mph" (numbers pass through), or None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else int(value)
+    match = LEADING_NUMBER_PATTERN.match(str(value))
+    return int(match.group(1)) if match else None
+
+
+class GameRecord:
+    """
+    One scraped game. Slotted, with typed fields: scores, total runs, temperature (degrees F) and wind speed (mph)
+    are ints, or None when the page did not have them; the rest is text. FIELDS maps each attribute to its output
+    column, and to_dict()/from_dict() convert to the column-keyed dicts stored in checkpoints.
+    """
+
+    FIELDS = (
+        ("date", "Date"), ("time", "Time"), ("venue", "Venue"), ("weekday", "Weekday"), ("game_length", "Game Length"),
+        ("home_team", "Home Team"), ("away_team", "Away Team"), ("home_team_score", "Home Team Score"),
+        ("away_team_score", "Away Team Score"), ("total_runs_scored", "Total Runs Scored"), ("name", "Name"),
+        ("temperature", "Temperature"), ("wind_speed", "Wind Speed"), ("wind_direction", "Wind Direction"),
+        ("additional_weather_info", "Additional Weather Info"), ("game_link", "Game Link"),
+    )
+    COLUMNS = [column for _, column in FIELDS]
+    # box_tables holds extract_box_tables() output when BOX_TABLES_ENABLED; it is not a games column.
+    # play_by_play carries a game's events from the page to GameScraper._record_game(), which writes them out and
+    # clears it; it is never checkpointed or compared.
+    __slots__ = tuple(attribute for attribute, _ in FIELDS) + ("box_tables", "play_by_play")
+
+    date: "str | None"
+    time: "str | None"
+    venue: "str | None"
+    weekday: "str | None"
+    game_length: "str | None"
+    home_team: "str | None"
+    away_team: "str | None"
+    home_team_score: "int | None"
+    away_team_score: "int | None"
+    total_runs_scored: "int | None"
+    name: "str | None"
+    temperature: "int | None"
+    wind_speed: "int | None"
+    wind_direction: "str | None"
+    additional_weather_info: "str | None"
+    game_link: "str | None"
+    box_tables: "dict | None"
+    play_by_play: "dict | None"
+
+    def __init__(self, **values):
+        for attribute in self.__slots__:
+            setattr(self, attribute, values.get(attribute))
+
+    @classmethod
+    def from_dict(cls, game_info):
+        """
+        Builds a record from a column-keyed game_info dict, turning the page's strings ("72° F", "10mph") into numbers.
+        Also reads checkpoints written before records were typed.
+        """
+        record = cls(**{attribute: game_info.get(column) for attribute, column in cls.FIELDS}, box_tables=game_info.get("Box Tables"))
+        for attribute in ("home_team_score", "away_team_score", "total_runs_scored", "temperature", "wind_speed"):
+            setattr(record, attribute, leading_number(getattr(record, attribute)))
+        return record
+
+    def to_dict(self):
+        game_info = {column: getattr(self, attribute) for attribute, column in self.FIELDS}
+        if self.box_tables is not None:
+            game_info["Box Tables"] = self.box_tables
+        return game_info
+
+    def to_tuple(self):
+        """The games columns, in COLUMNS order."""
+        return tuple(getattr(self, attribute) for attribute, _ in self.FIELDS)
+
+    def __getstate__(self):
+        return self.to_tuple() + (self.box_tables, self.play_by_play)
+
+    def __setstate__(self, state):
+        self.box_tables = None
+        self.play_by_play = None
+        for attribute, value in zip(self.__slots__, state):
+            setattr(self, attribute, value)
+
+    def __eq__(self, other):
+        return isinstance(other, GameRecord) and self.to_tuple() == other.to_tuple() and self.box_tables == other.box_tables
+
+    def __repr__(self):
+        return f"GameRecord({self.name or self.game_link!r})"
+
+
+def as_game_record(game):
+    """Accepts a GameRecord or a column-keyed game_info dict (e.g. read back from a checkpoint)."""
+    return game if isinstance(game, GameRecord) else GameRecord.from_dict(game)
+
+
+def games_frame(games):
+    """Builds the games DataFrame (GameRecord.COLUMNS, in that order) from GameRecords or game_info dicts."""
+    return pd.DataFrame.from_records([as_game_record(game).to_tuple() for game in games], columns=GameRecord.COLUMNS)
+
+
+def apply_game_dtypes(df):
+    """
+    Gives a games DataFrame its compact dtypes: nullable Int16 for runs, temperature and wind speed (text such as
+    "72° F" from older outputs is parsed) and categories for teams, venues and their lookup fields, weekday and wind direction.
+    Returns the same DataFrame, converted in place.
+    """
+    for col in GAME_INTEGER_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.Int16Dtype):
+            values = df[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values.astype("string").str.extract(LEADING_NUMBER_PATTERN, expand=False), errors="coerce")
+            df[col] = values.astype("Int16")
+    for col in GAME_CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def parse_game_dates(dates):
+    """Parses a column of "April 05, 2023" dates (or unconverted "Saturday, April 1, 2023" text) to datetimes; NaT otherwise."""
+    text = dates.astype("string").str.strip()
+    parsed = pd.to_datetime(text, format="%B %d, %Y", errors="coerce")
+    unparsed = parsed.isna() & text.notna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(text[unparsed], format="%A, %B %d, %Y", errors="coerce")
+    return parsed
+
+
+def parse_game_times(times):
+    """Parses a column of start times ("7:05:00PM", "7:05 p.m.") to offsets from midnight; NaT otherwise."""
+    parts = times.astype("string").str.extract(START_TIME_PATTERN)
+    hours = pd.to_numeric(parts[0], errors="coerce") % 12 + parts[2].str.upper().eq("P").astype("Int64") * 12
+    minutes = pd.to_numeric(parts[1], errors="coerce")
+    return pd.to_timedelta((hours * 60 + minutes).astype("float64"), unit="m")
+
+
+def parse_distinct(values, parse):
+    """Runs a column parser on the distinct values only and spreads the results back; a season repeats each date and start time many times."""
+    codes, uniques = pd.factorize(values)
+    parsed = parse(pd.Series(uniques, dtype="string"))
+    # Missing values have code -1, which reindexes to NaT.
+    return pd.Series(parsed.reindex(codes).to_numpy(), index=values.index)
+
+
+def local_to_utc(local_start, tz_abbreviations, posix_offsets):
+    """Converts naive stadium-local datetimes to UTC, by IANA zone where the abbreviation is known, else by the POSIX offset."""
+    local = local_start.reset_index(drop=True)
+    unzoned = pd.Series(True, index=local.index)
+    pieces = []
+    if tz_abbreviations is not None:
+        zones = tz_abbreviations.reset_index(drop=True).astype("string").str.strip().str.upper().map(TZ_ABBREVIATION_ZONES)
+        unzoned = zones.isna()
+        # One localize per zone, on that zone's rows only.
+        for zone, positions in zones.groupby(zones, sort=False).indices.items():
+            pieces.append(local.iloc[positions].dt.tz_localize(zone, ambiguous="NaT", nonexistent="shift_forward").dt.tz_convert("UTC"))
+    if posix_offsets is not None and unzoned.any():
+        parts = posix_offsets.reset_index(drop=True)[unzoned].astype("string").str.extract(POSIX_OFFSET_PATTERN)
+        west_minutes = pd.to_numeric(parts[1], errors="coerce") * 60 + pd.to_numeric(parts[2], errors="coerce").fillna(0)
+        west_minutes = west_minutes.where(parts[0] != "-", -west_minutes)
+        pieces.append((local[unzoned] + pd.to_timedelta(west_minutes.astype("float64"), unit="m")).dt.tz_localize("UTC"))
+    utc_start = pd.Series(pd.NaT, index=local.index, dtype=f"datetime64[{local.dt.unit}, UTC]")
+    if pieces:
+        utc_start = pd.concat(pieces).reindex(local.index).astype(utc_start.dtype)
+    utc_start.index = local_start.index
+    return utc_start
+
+
+def _parse_game_date(text):
+    for date_format in ("%B %d, %Y", "%A, %B %d, %Y"):
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            pass
+    return None
+
+
+def _local_to_utc_scalar(local_start, tz_abbreviation, posix_offset):
+    """local_to_utc for one value; returns a UTC datetime or None."""
+    zone = TZ_ABBREVIATION_ZONES.get(str(tz_abbreviation).strip().upper()) if tz_abbreviation is not None else None
+    if zone:
+        zone_info = zoneinfo.ZoneInfo(zone)
+        offset = local_start.replace(tzinfo=zone_info).utcoffset()
+        if offset != local_start.replace(tzinfo=zone_info, fold=1).utcoffset():
+            # Inside a DST change: leave it to pandas so the result matches the column-wise path exactly.
+            utc_start = pd.Timestamp(local_start).tz_localize(zone, ambiguous="NaT", nonexistent="shift_forward")
+            return None if utc_start is pd.NaT else utc_start.tz_convert("UTC").to_pydatetime()
+        return (local_start - offset).replace(tzinfo=timezone.utc)
+    match = POSIX_OFFSET_PATTERN.match(str(posix_offset)) if posix_offset is not None else None
+    if not match:
+        return None
+    west_minutes = int(match.group(2)) * 60 + int(match.group(3) or 0)
+    return (local_start + timedelta(minutes=-west_minutes if match.group(1) == "-" else west_minutes)).replace(tzinfo=timezone.utc)
+
+
+def game_datetimes_per_row(df):
+    """
+    Returns the 'Local Start' and 'UTC Start' Series of normalize_game_datetimes, computed one row at a time
+    (the small-frame path; see DATETIME_COLUMNWISE_MIN_ROWS).
+    """
+    missing = [None] * len(df)
+    local_starts, utc_starts = [], []
+    for date_text, time_text, tz_abbreviation, posix_offset in zip(df['Date'], df['Time'], df['TZ Abb'] if 'TZ Abb' in df.columns else missing,
+                                                                   df['Time Zone'] if 'Time Zone' in df.columns else missing):
+        local_start = utc_start = None
+        day = _parse_game_date(date_text.strip()) if isinstance(date_text, str) else None
+        match = START_TIME_PATTERN.search(time_text) if isinstance(time_text, str) else None
+        if day is not None and match:
+            hours = int(match.group(1)) % 12 + (12 if match.group(3).upper() == "P" else 0)
+            local_start = day + timedelta(hours=hours, minutes=int(match.group(2)))
+            utc_start = _local_to_utc_scalar(local_start, tz_abbreviation if isinstance(tz_abbreviation, str) else None,
+                                             posix_offset if isinstance(posix_offset, str) else None)
+        local_starts.append(local_start)
+        utc_starts.append(utc_start)
+    return (pd.Series(pd.to_datetime(local_starts), index=df.index).astype("datetime64[us]"),
+            pd.Series(pd.to_datetime(utc_starts, utc=True), index=df.index).astype("datetime64[us, UTC]"))
+
+
+def normalize_game_datetimes(df):
+    """
+    Adds 'Local Start' (the stadium's wall-clock start time) and 'UTC Start' (timezone-aware UTC) to an enriched games
+    DataFrame, parsed column-wise from the scraped Date and Time and the home stadium's Time Zone / TZ Abb from the lookup.
+    Date and Time themselves are kept as scraped. Returns the same DataFrame, converted in place.
+    Frames under DATETIME_COLUMNWISE_MIN_ROWS rows go through game_datetimes_per_row() instead, with the same result.
+    """
+    if df is None or 'Date' not in df.columns or 'Time' not in df.columns:
+        return df
+    if len(df) < DATETIME_COLUMNWISE_MIN_ROWS:
+        df['Local Start'], df['UTC Start'] = game_datetimes_per_row(df)
+        return df
+    # One fixed unit, so every chunk of a streamed run has the same schema.
+    local_start = (parse_distinct(df['Date'], parse_game_dates) + parse_distinct(df['Time'], parse_game_times)).astype("datetime64[us]")
+    df['Local Start'] = local_start
+    df['UTC Start'] = local_to_utc(local_start, df.get('TZ Abb'), df.get('Time Zone'))
+    return df
 
 
 class GameScraper:
     # *** REVERTED METHOD NAME TO ORIGINAL init ***
-    def init(self, output_dir=None, year_identifier=None):
-        self.base_site = "https://www.baseball-reference.com"
+    def init(self, output_dir=None, year_identifier=None, use_selenium=None, use_proxies=None):
+        self.base_site = BASE_SITE
         self.proxies = []
         # self.current_proxy_index is per instance, allowing each process its own index
         self.current_proxy_index = 0
         self.output_dir = output_dir
         self.year_identifier = year_identifier
-
-
-    # *** REVERTED TO ORIGINAL get_random_proxy LOGIC ***
+        self.use_selenium = USE_SELENIUM if use_selenium is None else use_selenium
+        self.selenium_fallback = SELENIUM_FALLBACK
+        self.use_proxies = USE_PROXIES if use_proxies is None else use_proxies
+        self.proxy_manager = get_proxy_manager(output_dir)
+        # Sessions are per thread so the concurrent fetch engine can share one scraper instance.
+        self._thread_local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self.cache = get_response_cache(output_dir)
+        self.checkpoint = GameCheckpoint.for_run(output_dir, year_identifier)
+        self.failed_links = FailedLinkLog.for_run(output_dir, year_identifier)
+        self.play_by_play = PlayByPlayWriter(output_dir, year_identifier) if PLAY_BY_PLAY_ENABLED and output_dir and year_identifier else None
+        # Set by the runs to a threading/multiprocessing Event; once set, no new links are started.
+        self.cancel_event = None
+
+    def cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def get_session(self):
+        """Returns this thread's requests session, creating it on first use."""
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(REQUEST_HEADERS)
+            self._thread_local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def request_page(self, url):
+        """
+        The one request path: returns (status_code, html, retry_after seconds or None) for a page, from the response
+        cache when possible. The request holds a RateGovernor slot, and its status and Retry-After are reported to
+        the governor on the way out. Request errors are raised to the caller.
+        """
+        if self.cache is not None:
+            html = self.cache.get(url)
+            if html is not None:
+                get_metrics().increment("cache_hits")
+                return 200, html, None
+
+        with get_metrics().time_stage("page_load"), get_rate_governor().request(url) as slot:
+            response = self._get_through_proxies(url) if self.use_proxies else self.get_session().get(url, timeout=REQUEST_TIMEOUT)
+            slot["status_code"] = response.status_code
+            slot["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code in THROTTLE_STATUS_CODES:
+            get_metrics().increment("throttled")
+        if response.status_code == 200 and self.cache is not None:
+            self.cache.put(url, response.text)
+        return response.status_code, response.text, slot["retry_after"]
+
+    def fetch_page(self, url):
+        """Returns (status_code, html) for a page (see request_page). Request errors are raised to the caller."""
+        status_code, html, _ = self.request_page(url)
+        return status_code, html
+
+    def fetch_page_with_retries(self, url):
+        """
+        fetch_page for the schedule and daily pages, retrying throttled/server/network failures with next_retry_delay().
+        Box score links are never fetched through here; AsyncGameFetcher owns their retries.
+        """
+        attempt = 0
+        while True:
+            try:
+                status_code, html, retry_after = self.request_page(url)
+                if status_code == 200:
+                    return status_code, html
+                error = FetchError(status_code, retry_after)
+            except Exception as e:
+                error = e
+            attempt += 1
+            delay = next_retry_delay(error, attempt)
+            if delay is None:
+                if isinstance(error, FetchError):
+                    return error.status_code, html
+                raise error
+            get_metrics().increment("retries")
+            print(f"Process {os.getpid()}: Retrying {url} in {delay:.1f}s (attempt {attempt + 1}/{LINK_MAX_RETRIES + 1}): {str(error)}")
+            time.sleep(delay)
+
+    def _get_through_proxies(self, url):
+        """
+        GETs a URL through up to PROXY_ATTEMPTS of the best proxies, reporting each outcome to the proxy manager.
+        Falls back to a direct request when no proxy works and PROXY_DIRECT_FALLBACK is set.
+        """
+        metrics = get_metrics()
+        last_error = None
+        for attempt in range(PROXY_ATTEMPTS):
+            with metrics.time_stage("proxy_selection"):
+                proxy = self.proxy_manager.acquire()
+            if not proxy:
+                break
+            if attempt:
+                metrics.increment("retries")
+                metrics.increment("proxy_changes")
+            start_time = time.monotonic()
+            try:
+                response = self.get_session().get(url, timeout=REQUEST_TIMEOUT, proxies=proxy_url_map(proxy))
+            except requests.exceptions.RequestException as e:
+                self.proxy_manager.report(proxy, False)
+                last_error = e
+                continue
+            # Blocks and server errors count against the proxy; 404s are a property of the page, not the proxy.
+            healthy = response.status_code < 500 and response.status_code not in (403, 407, 429)
+            self.proxy_manager.report(proxy, healthy, time.monotonic() - start_time)
+            if healthy:
+                return response
+            last_error = Exception(f"Status code {response.status_code} through proxy {proxy}")
+
+        if PROXY_DIRECT_FALLBACK or last_error is None:
+            if last_error is not None:
+                metrics.increment("retries")
+            return self.get_session().get(url, timeout=REQUEST_TIMEOUT)
+        raise last_error
+
+    def close(self):
+        """Releases the HTTP sessions. Pooled browsers are shared and stay open for the next run."""
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+        self._thread_local = threading.local()
+
+
+    # Proxy selection is delegated to the process-wide ProxyManager, which ranks proxies by health.
     def get_random_proxy(self):
-        if not self.proxies:
-            self.fetch_proxies()
-        # ADDED minimal check to prevent IndexError if proxies list is empty immediately after fetch fails
-        # This check does not change the original logic of accessing by index, only prevents a crash.
-        if not self.proxies:
-            print(f"Process {os.getpid()}: No proxies available after fetch. Cannot return proxy.")
-            return None
-        # ADDED minimal check to prevent IndexError if the index is out of bounds *before* accessing
-        # This check does not change the original logic of index increment/break in scrape_game_data.
-        if self.current_proxy_index >= len(self.proxies):
-             print(f"Process {os.getpid()}: Proxy index {self.current_proxy_index} is out of bounds ({len(self.proxies)} available).")
-             return None
-
+        proxy = self.proxy_manager.acquire()
+        if not proxy:
+            print(f"Process {os.getpid()}: No healthy proxies available. Cannot return proxy.")
+        return proxy
 
-        return self.proxies[self.current_proxy_index]
-
-    # *** REVERTED TO ORIGINAL fetch_proxies LOGIC ***
     def fetch_proxies(self):
-        try:
-            url = "https://proxylist.geonode.com/api/proxy-list?limit=500&page=1&sort_by=lastChecked&sort_type=desc"
-            # NOTE: Original code did not specify timeout for requests.get
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                # NOTE: Original code did not check if 'data' or 'data'['data'] exist or if keys like 'ip', 'port' exist.
-                # Reverting to this exact behavior as requested. This could raise KeyError.
-                self.proxies = [f"{proxy['ip']}:{proxy['port']}" for proxy in data['data']]
-                print(f"Process {os.getpid()}: Fetched {len(self.proxies)} proxies successfully.")
-                self.current_proxy_index = 0 # Reset index after fetching (or if fetching again)
-            else:
-                print(f"Process {os.getpid()}: Failed to fetch proxies. Status code: {response.status_code}")
-                self.proxies = [] # Ensure list is empty on failure
-                self.current_proxy_index = 0
-        except Exception as e: # NOTE: Original code caught generic Exception.
-            print(f"Process {os.getpid()}: An error occurred while fetching proxies: {str(e)}")
-            self.proxies = []
-            self.current_proxy_index = 0
+        """Loads the proxy list (from the on-disk cache when it is fresh) and exposes it as self.proxies, best first."""
+        self.proxy_manager.ensure_loaded()
+        self.proxies = self.proxy_manager.ranked_proxies()
+        self.current_proxy_index = 0
 
     # Added a method to allow setting the initial proxy index from outside (necessary for multi-process)
     def set_initial_proxy_index(self, index):
-        """Sets the starting index for the proxy list traversal."""
-        # Ensure proxies are fetched before setting index relative to list length
+        """Offsets where this process starts rotating through the best proxies, so processes do not all start on the same one."""
         if not self.proxies:
             self.fetch_proxies()
 
         if self.proxies:
             self.current_proxy_index = index % len(self.proxies)
+            self.proxy_manager.rotation_offset = self.current_proxy_index
             print(f"Process {os.getpid()}: Initial proxy index set to {self.current_proxy_index} (based on requested index {index}).")
         else:
             print(f"Process {os.getpid()}: No proxies available, cannot set initial index.")
@@ -109,14 +1498,13 @@ class GameScraper:
     def get_all_games(self, season):
         try:
             url = f"{self.base_site}/leagues/majors/{season}-schedule.shtml"
-            # NOTE: Original code did not specify timeout for requests.get
-            response = requests.get(url)
-            if response.status_code == 200:
-                html = response.text
+            with get_metrics().season_scope(season):
+                status_code, html = self.fetch_page_with_retries(url)
+            if status_code == 200:
                 game_links = self.parse_games(html)
                 return game_links
             else:
-                print(f"Process {os.getpid()}: Failed to fetch schedule for {season}. Status code: {response.status_code}") # Added PID print
+                print(f"Process {os.getpid()}: Failed to fetch schedule for {season}. Status code: {status_code}") # Added PID print
                 return None
         except Exception as e: # NOTE: Original code caught generic Exception.
             print(f"Process {os.getpid()}: An error occurred: {str(e)}") # Added PID print
@@ -126,17 +1514,16 @@ class GameScraper:
     def parse_games(self, html):
         game_links = []
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = bs4.BeautifulSoup(html, resolve_html_parser(), parse_only=soup_strainer("schedule_links"))
+            seen_links = set()
             # Reverted selector back to original 'em a' as requested implicitly.
             for game in soup.select("em a"):
                 href = game.get("href")
                 if href:
                     full_link = urljoin(self.base_site, href)
-                    # Original code had an "if full_link not in game_links:" check inside the loop
-                    # followed by "game_links.append(full_link)" outside the if. This was likely a copy/paste error.
-                    # Assuming the intent was to append unique links, correcting this slight structure.
-                    # Sticking to original's 'if href: full_link = urljoin(...)' structure before the list check.
-                    if full_link not in game_links: # Corrected to append only if not already present
+                    # Append unique links only, keeping schedule order. The set keeps this O(n).
+                    if full_link not in seen_links:
+                        seen_links.add(full_link)
                         game_links.append(full_link)
             print(f"Process {os.getpid()}: Parsed {len(game_links)} links from HTML.") # Added PID print
             return game_links
@@ -145,7 +1532,7 @@ class GameScraper:
             return []
 
     # *** UPDATED to use data extraction logic from code 2 ***
-    def game_meta_data(self, soup: BeautifulSoup, game_info: dict) -> dict:
+    def game_meta_data(self, soup: "bs4.BeautifulSoup", game_info: dict) -> dict:
         try:
             upper_score_box_metas = soup.select(".scorebox_meta div")
             game_info["Date"] = self.__change_date_format(upper_score_box_metas[0].getText(strip=True))
@@ -166,7 +1553,7 @@ class GameScraper:
             return game_info
 
     # *** UPDATED to use data extraction logic from code 2 ***
-    def teams_scores(self, soup: BeautifulSoup, game_info: dict) -> dict:
+    def teams_scores(self, soup: "bs4.BeautifulSoup", game_info: dict) -> dict:
         teamsBox = soup.select(".scorebox > div:nth-child(1),.scorebox > div:nth-child(2)")
         if teamsBox:
             scores = []
@@ -200,166 +1587,371 @@ class GameScraper:
     # *** UPDATED to use regex and data extraction logic from code 2 ***
     def extract_weather_info(self, url):
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                weather_element = soup.find(string=lambda text: text and "Start Time Weather:" in text)
-                if weather_element:
-                    weather_text = weather_element.strip()
-                    temperature_match = re.search(r'(\d+)&deg; F', weather_text)
-                    wind_speed_match = re.search(r'Wind (\d+mph)', weather_text)
-                    wind_direction_match = re.search(r'Wind (\d+mph(?: in from)? .*?)(?:,|\.|$)', weather_text)
-                    additional_weather_match = re.search(r'Wind \d+mph(?:.*?)\s*,\s*(.*?)(?:\s*\.|$)', weather_text)
-                    
-                    temperature = temperature_match.group(1) + "° F" if temperature_match else "Unknown temperature"
-                    wind_speed = wind_speed_match.group(1) if wind_speed_match else "Unknown wind speed"
-                    wind_info = wind_direction_match.group(1) if wind_direction_match else "Unknown wind info"
-                    wind_direction = wind_info.split(wind_speed)[1].strip() if wind_speed != "Unknown wind speed" and wind_speed in wind_info else "Unknown wind direction"
-                    additional_weather_info = additional_weather_match.group(1).strip() if additional_weather_match else "Unknown additional weather info"
-                    
-                    return temperature, wind_speed, wind_direction, additional_weather_info
-                else:
-                    print(f"Process {os.getpid()}: Weather information string not found on the webpage {url}.")
-                    return "Weather information not found on the webpage.", "", "", ""
+            status_code, html = self.fetch_page(url)
+            if status_code == 200:
+                soup = bs4.BeautifulSoup(html, 'html.parser')
+                return self.weather_info_from_soup(soup, url)
             else:
-                print(f"Process {os.getpid()}: Failed to retrieve webpage for weather info. Status code: {response.status_code} for {url}")
-                return f"Failed to retrieve the webpage. Status code: {response.status_code}", "", "", ""
+                print(f"Process {os.getpid()}: Failed to retrieve webpage for weather info. Status code: {status_code} for {url}")
+                return f"Failed to retrieve the webpage. Status code: {status_code}", "", "", ""
         except Exception as e:
             print(f"Process {os.getpid()}: An error occurred while extracting weather info from {url}: {str(e)}")
             return "", "", "", ""
 
-    def _save_failed_link(self, link, error):
-        if not self.output_dir or not self.year_identifier:
-            print("Output directory or year identifier not set. Cannot save failed link.")
-            return
-
-        failed_links_file = os.path.join(self.output_dir, f"{self.year_identifier}_failed_links.csv")
+    def weather_info_from_soup(self, soup: "bs4.BeautifulSoup", url, weather_element=None):
+        """Extracts (temperature, wind speed, wind direction, additional info) from an already parsed box score page."""
         try:
-            # Create a DataFrame for the failed link
-            df_failed = pd.DataFrame({'FailedLink': [link], 'Error': [error]})
-            # Append to the CSV file, creating it with a header if it doesn't exist
-            df_failed.to_csv(failed_links_file, mode='a', header=not os.path.exists(failed_links_file), index=False)
+            # The weather line lives inside an HTML comment, so the entity is still a literal "&deg;" here.
+            if weather_element is None:
+                weather_element = soup.find(string=lambda text: text and WEATHER_MARKER in text)
+            if weather_element:
+                weather_text = weather_element.strip()
+                temperature_match = re.search(r'(\d+)&deg; F', weather_text)
+                wind_speed_match = re.search(r'Wind (\d+mph)', weather_text)
+                wind_direction_match = re.search(r'Wind (\d+mph(?: in from)? .*?)(?:,|\.|$)', weather_text)
+                additional_weather_match = re.search(r'Wind \d+mph(?:.*?)\s*,\s*(.*?)(?:\s*\.|$)', weather_text)
+                
+                temperature = temperature_match.group(1) + "° F" if temperature_match else "Unknown temperature"
+                wind_speed = wind_speed_match.group(1) if wind_speed_match else "Unknown wind speed"
+                wind_info = wind_direction_match.group(1) if wind_direction_match else "Unknown wind info"
+                wind_direction = wind_info.split(wind_speed)[1].strip() if wind_speed != "Unknown wind speed" and wind_speed in wind_info else "Unknown wind direction"
+                additional_weather_info = additional_weather_match.group(1).strip() if additional_weather_match else "Unknown additional weather info"
+                
+                return temperature, wind_speed, wind_direction, additional_weather_info
+            else:
+                print(f"Process {os.getpid()}: Weather information string not found on the webpage {url}.")
+                return "Weather information not found on the webpage.", "", "", ""
         except Exception as e:
-            print(f"Process {os.getpid()}: Could not save failed link {link} to {failed_links_file}. Reason: {e}")
-
-    # *** REVERTED TO ORIGINAL scrape_game_data METHOD LOGIC AND STRUCTURE ***
-    # This method exactly matches the original, including the [:5] limit and the proxy logic placement.
-    def scrape_game_data(self, game_links):
-        try:
-            game_data = []
-            
-            options = webdriver.ChromeOptions() 
-            options.add_argument("--log-level=3")
-            options.add_argument("--silent")
-            options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-            driver = webdriver.Chrome(options=options)
-
-            for link_index, link in enumerate(game_links):
-                try:
-                    print(f"Process {os.getpid()}: Processing link {link_index + 1}/{len(game_links)}: {link}")
-                    proxy = self.get_random_proxy() 
-
-                    if proxy:
-                        print(f"Process {os.getpid()}: Using proxy: {proxy}")
-                        options.add_argument(f'--proxy-server={proxy}')
-                    else:
-                        print(f"Process {os.getpid()}: No proxy available from get_random_proxy. Scraping link {link_index + 1}/{len(game_links)} without proxy.") 
-
-                    driver.get(link)
-
-                    time.sleep(3)
-                    driver.execute_script("return window.stop();")
-
-                    html = driver.page_source
-                    game_soup = BeautifulSoup(html, 'html.parser')
-
-                    game_info = {}
-                    game_info = self.game_meta_data(game_soup, game_info)
-                    game_info = self.teams_scores(game_soup, game_info)
-
-                    weather_info = self.extract_weather_info(link)
-                    game_info["Temperature"], game_info["Wind Speed"], game_info["Wind Direction"], game_info["Additional Weather Info"] = weather_info
-
-                    game_info['Game Link'] = link
+            print(f"Process {os.getpid()}: An error occurred while extracting weather info from {url}: {str(e)}")
+            return "", "", "", ""
 
-                    game_data.append(game_info)
+    def weather_info_from_html(self, html, url):
+        """Same result as weather_info_from_soup, read straight from the raw HTML without building a tree."""
+        weather_text = find_weather_text(html)
+        if weather_text is None:
+            print(f"Process {os.getpid()}: Weather information string not found on the webpage {url}.")
+            return "Weather information not found on the webpage.", "", "", ""
+        return self.weather_info_from_soup(None, url, weather_text)
+
+    def parse_game_page(self, html, link):
+        """
+        Builds a GameRecord from a single box score HTML document. Only the .scorebox subtree is parsed;
+        the weather line, and the box score tables and play-by-play events when enabled, are read from the raw HTML.
+        """
+        metrics = get_metrics()
+        with metrics.time_stage("parse"):
+            game_soup = bs4.BeautifulSoup(html, resolve_html_parser(), parse_only=soup_strainer("scorebox"))
+
+            game_info = {}
+            game_info = self.game_meta_data(game_soup, game_info)
+            game_info = self.teams_scores(game_soup, game_info)
+
+        with metrics.time_stage("weather"):
+            weather_info = self.weather_info_from_html(html, link)
+        game_info["Temperature"], game_info["Wind Speed"], game_info["Wind Direction"], game_info["Additional Weather Info"] = weather_info
+
+        game_info['Game Link'] = link
+        record = GameRecord.from_dict(game_info)
+        table_names = (BOX_TABLE_NAMES if BOX_TABLES_ENABLED else ()) + (("play_by_play",) if PLAY_BY_PLAY_ENABLED else ())
+        if table_names:
+            with metrics.time_stage("box_tables"):
+                tables = extract_box_tables(html, table_names)
+            record.play_by_play = tables.pop("play_by_play", None)
+            record.box_tables = tables if BOX_TABLES_ENABLED else None
+        return record
+
+    def fetch_page_with_selenium(self, link):
+        """Loads a page in a pooled Chrome and returns its HTML. Used only as a fallback for the HTTP path."""
+        with get_metrics().time_stage("page_load"):
+            return get_driver_pool().load_page(link, self.proxy_manager if self.use_proxies else None)
+
+    def scrape_game(self, link):
+        """
+        Downloads one box score page once and returns its GameRecord. Raises on failure, without retrying: the
+        caller (AsyncGameFetcher) owns the retries of a link. With use_selenium the page is loaded in a pooled
+        Chrome (drivers come from the process-wide WebDriverPool, so Chrome is started once and reused).
+        """
+        game_day = box_score_date(link)
+        with get_metrics().season_scope(game_day.year if game_day else self.year_identifier):
+            if self.use_selenium:
+                return self.parse_game_page(self.fetch_page_with_selenium(link), link)
 
-                except Exception as e:
-                    print(f"Process {os.getpid()}: An error occurred while scraping {link}: {str(e)}")
-                    self._save_failed_link(link, str(e))
-                    self.current_proxy_index += 1
-                    print(f"Process {os.getpid()}: Advanced proxy index to {self.current_proxy_index} after error.")
-
-                    if self.current_proxy_index >= len(self.proxies):
-                        print(f"Process {os.getpid()}: No more proxies to try according to index. Exiting loop...")
-                        break
-                    else:
-                        print(f"Process {os.getpid()}: Trying next proxy...")
-                        continue
-
-            driver.quit()
-            return game_data
+            try:
+                status_code, html, retry_after = self.request_page(link)
+                if status_code != 200:
+                    raise FetchError(status_code, retry_after)
+            except Exception as e:
+                # Rate limiting is left to the retry scheduler; loading the page in Chrome would only hit the limit harder.
+                if not self.selenium_fallback or (isinstance(e, FetchError) and e.status_code in THROTTLE_STATUS_CODES):
+                    raise
+                print(f"Process {os.getpid()}: HTTP fetch failed for {link} ({str(e)}). Falling back to Selenium.")
+                get_metrics().increment("retries")
+                html = self.fetch_page_with_selenium(link)
 
-        except Exception as e:
-            print(f"Process {os.getpid()}: An error occurred during driver launch or setup: {str(e)}") 
-            if 'driver' in locals() and driver:
-                try:
-                    driver.quit()
-                    print(f"Process {os.getpid()}: Driver quit after error before loop.")
-                except Exception as quit_e:
-                    print(f"Process {os.getpid()}: Error quitting driver after error before loop: {str(quit_e)}")
-            return []
+            return self.parse_game_page(html, link)
 
-    # *** RETAINED get_game_links_by_date_range - MINOR ADJUSTMENTS FOR ROBUSTNESS ONLY ***
-    def get_game_links_by_date_range(self, start_date, end_date):
-        game_links = []
-        current_date = start_date
-        print(f"Process {os.getpid()}: Fetching game links for date range {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}") 
-
-        session = requests.Session()
+    def _save_failed_link(self, link, error):
+        game_day = box_score_date(link)
+        get_metrics().increment("failures", game_day.year if game_day else self.year_identifier)
+        if self.failed_links is None:
+            print("Output directory or year identifier not set. Cannot save failed link.")
+            return
+        self.failed_links.add(link, error)
+
+    def flush_failed_links(self):
+        if self.failed_links is not None:
+            self.failed_links.flush()
+
+    def flush_play_by_play(self):
+        if self.play_by_play is not None:
+            self.play_by_play.flush()
+
+    def _drop_incomplete_games(self, completed, read=None):
+        """
+        Removes the checkpointed games that lack output this run asks for from completed, so they are scraped again:
+        box score tables when BOX_TABLES_ENABLED and the game was checkpointed without them, and play-by-play events
+        for games checkpointed while play-by-play was off (no "Play-By-Play Events" count) or whose events never
+        reached a part file (the checkpoint line is written first, so a crash loses the unwritten chunk).
+        read turns a value of completed into its game_info (completed from checkpoint.index() holds offsets).
+        """
+        if not completed or not (BOX_TABLES_ENABLED or self.play_by_play is not None):
+            return
+        stored = None
+        missing_tables, missing_events = [], []
+        for link, entry in completed.items():
+            game_info = (read(entry) if read else entry) or {}
+            if BOX_TABLES_ENABLED and game_info.get("Box Tables") is None:
+                missing_tables.append(link)
+                continue
+            if self.play_by_play is None:
+                continue
+            event_count = game_info.get("Play-By-Play Events")
+            if event_count:
+                if stored is None:
+                    stored = self.play_by_play.stored_links()
+                if link in stored:
+                    continue
+            elif event_count is not None:
+                continue # the page has no play-by-play table
+            missing_events.append(link)
+        for link in missing_tables + missing_events:
+            del completed[link]
+        if missing_tables:
+            print(f"Process {os.getpid()}: {len(missing_tables)} checkpointed games for {self.year_identifier} have no box score tables and will be scraped again.")
+        if missing_events:
+            print(f"Process {os.getpid()}: {len(missing_events)} checkpointed games for {self.year_identifier} are missing their play-by-play events and will be scraped again.")
+
+    def scrape_game_data(self, game_links, max_in_flight=None):
+        """Scrapes every link and returns the list of GameRecords in link order (see iter_game_data)."""
+        return list(self.iter_game_data(game_links, max_in_flight))
+
+    def iter_game_data(self, game_links, max_in_flight=None):
+        """
+        Fetch and extract stages of the streaming pipeline. Yields a GameRecord per scraped link, in the order
+        of game_links, while later links are still downloading (HTTP-only unless use_selenium is set).
+        game_links may be a lazy iterable; links are only pulled as fetch slots free up, at most
+        STREAM_QUEUE_SIZE finished games wait for the consumer before fetching pauses, and at most
+        STREAM_REORDER_WINDOW scraped games are held back while an earlier link is still unfinished.
+        Links already recorded in this run's checkpoint are read back from it, when their turn comes, instead
+        of being scraped again.
+        """
+        completed = self.checkpoint.index() if self.checkpoint else {}
+        self._drop_incomplete_games(completed, self.checkpoint.read if self.checkpoint else None)
+        if completed:
+            print(f"Process {os.getpid()}: Resuming {self.year_identifier}: {len(completed)} games already checkpointed.")
+        total = len(game_links) if hasattr(game_links, "__len__") else None
+        results = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        finished = object()
+        fetch_positions = {} # fetch index -> position of the link in game_links (duplicates removed)
+        scraped_count = 0
+
+        def links_to_fetch():
+            seen_links = set()
+            fetch_index = 0
+            for link in game_links:
+                if stop.is_set():
+                    return
+                if link in seen_links:
+                    continue
+                position = len(seen_links)
+                seen_links.add(link)
+                if link in completed:
+                    # Only the offset is queued; the game is read back when the consumer reaches it.
+                    results.put((position, completed.pop(link)))
+                    continue
+                fetch_positions[fetch_index] = position
+                fetch_index += 1
+                yield link
+
+        def handle(fetch_index, link, game_info, error):
+            nonlocal scraped_count
+            if error is None:
+                self._record_game(game_info)
+                scraped_count += 1
+                print(f"Process {os.getpid()}: Finished link {scraped_count}{f'/{total}' if total else ''}: {link}")
+            else:
+                print(f"Process {os.getpid()}: An error occurred while scraping {link}: {error}")
+                self._save_failed_link(link, error)
+            # Failures are passed on as None so the consumer does not wait for them.
+            results.put((fetch_positions.pop(fetch_index), game_info))
 
-        while current_date <= end_date:
+        def produce():
             try:
-                url = f"{self.base_site}/boxes/?month={current_date.month}&day={current_date.day}&year={current_date.year}"
-                # print(f"Process {os.getpid()}: Fetching links for {current_date.strftime('%Y-%m-%d')} from {url}")
-                response = session.get(url, timeout=10)
-                if response.status_code == 200:
-                    html = response.text
-                    soup = BeautifulSoup(html, 'html.parser')
-                    links = soup.select("#wrap [role='main'] td.gamelink.right a")
-
-                    if not links:
-                        # print(f"Process {os.getpid()}: Daily links selector failed for {current_date.strftime('%Y-%m-%d')}, trying fallback.")
-                        links = soup.select("#content div.game_summaries a[href*='/boxes/']")
-
-                    if not links:
-                        print(f"Process {os.getpid()}: No game links found for {current_date.strftime('%Y-%m-%d')} using known selectors.")
-
-                    for link_tag in links:
-                        href = link_tag.get("href")
-                        if href and "/boxes/" in href and href.endswith('.shtml'):
-                            full_link = urljoin(self.base_site, href)
-                            if full_link not in game_links:
-                                game_links.append(full_link)
-
-                    # print(f"Process {os.getpid()}: Added {len(links)} links for {current_date.strftime('%Y-%m-%d')}. Total links so far: {len(game_links)}")
-                elif response.status_code == 404:
-                    print(f"Process {os.getpid()}: No games found for {current_date.strftime('%Y-%m-%d')} (404 Not Found).")
-                else:
-                    print(f"Process {os.getpid()}: Failed to fetch game links for {current_date.strftime('%Y-%m-%d')}. Status code: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                print(f"Process {os.getpid()}: Requests error fetching links for {current_date.strftime('%Y-%m-%d')}: {str(e)}")
+                # Selenium runs go through the same engine, one page per pooled driver at most.
+                async def collect():
+                    fetcher = AsyncGameFetcher(self, max_in_flight=max_in_flight or (WEBDRIVER_POOL_SIZE if self.use_selenium else None),
+                                               reorder_window=STREAM_REORDER_WINDOW)
+                    async for outcome in fetcher.iter_games(links_to_fetch()):
+                        handle(*outcome)
+
+                asyncio.run(collect())
             except Exception as e:
-                print(f"Process {os.getpid()}: An unexpected error occurred while fetching game links for {current_date.strftime('%Y-%m-%d')}: {str(e)}")
+                results.put(e)
             finally:
-                current_date += timedelta(days=1)
+                self.close()
+                self.flush_failed_links()
+                self.flush_play_by_play()
+                results.put(finished)
+
+        def passed_on(game_info):
+            """Turns a queued checkpoint offset into its GameRecord; scraped games and failures (None) pass through."""
+            if isinstance(game_info, int):
+                game_info = self.checkpoint.read(game_info)
+                return GameRecord.from_dict(game_info) if game_info is not None else None
+            return game_info
 
-        session.close()
+        producer = threading.Thread(target=produce, name="scrape-producer", daemon=True)
+        producer.start()
+        waiting = {} # position -> scraped game, checkpoint offset or None; bounded by the fetcher's reorder window
+        next_position = 0
+        try:
+            while True:
+                item = results.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                position, game_info = item
+                waiting[position] = game_info
+                while next_position in waiting:
+                    game_info = passed_on(waiting.pop(next_position))
+                    next_position += 1
+                    if game_info is not None:
+                        yield game_info
+            # Links skipped because of a cancel leave gaps; whatever finished after them is still passed on.
+            for position in sorted(waiting):
+                game_info = passed_on(waiting[position])
+                if game_info is not None:
+                    yield game_info
+        finally:
+            # Also reached when the consumer stops early: no new links are started and the producer is drained.
+            stop.set()
+            while producer.is_alive():
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def _record_game(self, record):
+        """
+        Persists a finished game to the checkpoint so a restarted run can skip it, and hands its play-by-play events
+        to the run's PlayByPlayWriter, dropping them from the record.
+        """
+        game_day = box_score_date(record.game_link or "")
+        get_metrics().increment("games", game_day.year if game_day else self.year_identifier)
+        game_info = record.to_dict()
+        if record.play_by_play is not None:
+            game_info["Play-By-Play Events"] = len(record.play_by_play.get("Event") or ())
+            if self.play_by_play is not None:
+                self.play_by_play.add(record.game_link, record.play_by_play)
+            record.play_by_play = None
+        if self.checkpoint:
+            self.checkpoint.append(game_info)
 
+    def get_game_links_by_date_range(self, start_date, end_date):
+        """
+        Returns box score links for games between start_date and end_date (inclusive). Links come from the
+        season schedule pages (one request per season, filtered by the date in each link); daily /boxes/
+        pages are only fetched, concurrently, for seasons whose schedule could not be loaded.
+        """
+        print(f"Process {os.getpid()}: Fetching game links for date range {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}") 
+        game_links = list(self.iter_game_links_by_date_range(start_date, end_date))
         print(f"Process {os.getpid()}: Finished collecting links for date range. Total links: {len(game_links)}")
         return game_links
 
+    def iter_game_links_by_date_range(self, start_date, end_date):
+        """
+        Discovery stage of the streaming pipeline: yields the date range's box score links in date order,
+        one season at a time, so a multi-decade range never holds more than one season's links.
+        The next season's schedule is fetched in the background while the current season is consumed.
+        """
+        first_day, last_day = start_date.date() if isinstance(start_date, datetime) else start_date, end_date.date() if isinstance(end_date, datetime) else end_date
+        seasons = list(range(first_day.year, last_day.year + 1))
+        with ThreadPoolExecutor(max_workers=1) as schedule_executor:
+            next_schedule = schedule_executor.submit(self.get_all_games, seasons[0]) if seasons else None
+            for season_index, season in enumerate(seasons):
+                season_links = next_schedule.result()
+                if season_index + 1 < len(seasons):
+                    next_schedule = schedule_executor.submit(self.get_all_games, seasons[season_index + 1])
+                yield from self._season_links_in_range(season, season_links, max(first_day, date(season, 1, 1)), min(last_day, date(season, 12, 31)))
+
+    def _season_links_in_range(self, season, season_links, season_first_day, season_last_day):
+        """Returns one season's links between two days in date order, from its schedule or, failing that, its daily pages."""
+        season_game_links = []
+        seen_links = set()
+        if season_links:
+            for link in season_links:
+                game_day = box_score_date(link)
+                if game_day and season_first_day <= game_day <= season_last_day and link not in seen_links:
+                    seen_links.add(link)
+                    season_game_links.append(link)
+        else:
+            print(f"Process {os.getpid()}: Schedule for {season} unavailable. Falling back to daily box score pages.")
+            fallback_days = [season_first_day + timedelta(days=offset) for offset in range((season_last_day - season_first_day).days + 1)]
+            with ThreadPoolExecutor(max_workers=PER_HOST_LIMIT) as executor:
+                for day_links in executor.map(self.get_game_links_for_day, fallback_days):
+                    for link in day_links:
+                        if link not in seen_links:
+                            seen_links.add(link)
+                            season_game_links.append(link)
+
+        season_game_links.sort(key=lambda link: box_score_date(link) or date.max)
+        return season_game_links
+
+    # *** RETAINED daily /boxes/ page parsing - now used as the fallback for get_game_links_by_date_range ***
+    def get_game_links_for_day(self, current_date):
+        """Returns the box score links listed on one day's /boxes/ page."""
+        day_links = []
+        try:
+            url = f"{self.base_site}/boxes/?month={current_date.month}&day={current_date.day}&year={current_date.year}"
+            status_code, html = self.fetch_page_with_retries(url)
+            if status_code == 200:
+                soup = bs4.BeautifulSoup(html, resolve_html_parser(), parse_only=soup_strainer("daily_boxes"))
+                links = soup.select("td.gamelink.right a")
+
+                if not links:
+                    links = soup.select("div.game_summaries a[href*='/boxes/']")
+
+                if not links:
+                    print(f"Process {os.getpid()}: No game links found for {current_date.strftime('%Y-%m-%d')} using known selectors.")
+
+                for link_tag in links:
+                    href = link_tag.get("href")
+                    if href and "/boxes/" in href and href.endswith('.shtml'):
+                        full_link = urljoin(self.base_site, href)
+                        if full_link not in day_links:
+                            day_links.append(full_link)
+            elif status_code == 404:
+                print(f"Process {os.getpid()}: No games found for {current_date.strftime('%Y-%m-%d')} (404 Not Found).")
+            else:
+                print(f"Process {os.getpid()}: Failed to fetch game links for {current_date.strftime('%Y-%m-%d')}. Status code: {status_code}")
+        except requests.exceptions.RequestException as e:
+            print(f"Process {os.getpid()}: Requests error fetching links for {current_date.strftime('%Y-%m-%d')}: {str(e)}")
+        except Exception as e:
+            print(f"Process {os.getpid()}: An unexpected error occurred while fetching game links for {current_date.strftime('%Y-%m-%d')}: {str(e)}")
+        return day_links
+
     # *** REVERTED TO ORIGINAL __change_time_format LOGIC ***
     def __change_time_format(self, time_str):
         new_time: list[str] | str = time_str.replace(".", "").strip().upper().split(" ")
@@ -388,6 +1980,395 @@ class GameScraper:
             return date_str
 
 
+def proxy_url_map(proxy):
+    """Returns the requests `proxies` mapping for an "ip:port" proxy."""
+    return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+
+
+class ProxyManager:
+    """
+    Shared proxy list with health scoring. The list is fetched from PROXY_SOURCE_URL (with a timeout),
+    health-checked concurrently and cached on disk, so other processes reuse it instead of fetching again.
+    Every request outcome updates the proxy's success rate and latency, and repeated failures quarantine it.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.rotation_offset = 0
+        self._stats = {}
+        self._rotation = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        # Held for the whole first load, so callers wait for the scored list instead of going direct meanwhile.
+        self._load_lock = threading.Lock()
+
+    @staticmethod
+    def _new_stats(latency=None):
+        return {"successes": 0, "failures": 0, "latency": latency, "consecutive_failures": 0, "quarantined_until": 0.0}
+
+    def ensure_loaded(self):
+        """
+        Loads the proxy list once per process: from the disk cache when it is fresh, otherwise fetched and
+        health-checked. Other threads calling in meanwhile block until the stats are populated.
+        """
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            if not self._load_cache():
+                self.refresh()
+            self._loaded = True
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if time.time() - cached.get("fetched_at", 0) > PROXY_LIST_TTL:
+                return False
+            with self._lock:
+                self._stats = {proxy: {**self._new_stats(), **stats} for proxy, stats in cached.get("proxies", {}).items()}
+            print(f"Process {os.getpid()}: Loaded {len(self._stats)} scored proxies from {self.cache_path}.")
+            return True
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read proxy cache {self.cache_path}: {str(e)}")
+            return False
+
+    def save(self):
+        """Writes the scored proxy list to the disk cache."""
+        if not self.cache_path:
+            return
+        try:
+            with self._lock:
+                payload = {"fetched_at": time.time(), "proxies": dict(self._stats)}
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(payload, cache_file)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not write proxy cache {self.cache_path}: {str(e)}")
+
+    def refresh(self):
+        """Fetches a fresh proxy list, health-checks it and keeps only proxies that answered."""
+        try:
+            response = requests.get(PROXY_SOURCE_URL, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                print(f"Process {os.getpid()}: Failed to fetch proxies. Status code: {response.status_code}")
+                return
+            candidates = []
+            for proxy in response.json().get("data", []):
+                protocols = proxy.get("protocols") or ["http"]
+                if proxy.get("ip") and proxy.get("port") and any(protocol in ("http", "https") for protocol in protocols):
+                    candidates.append(f"{proxy['ip']}:{proxy['port']}")
+            print(f"Process {os.getpid()}: Fetched {len(candidates)} HTTP proxies. Health-checking...")
+        except Exception as e:
+            print(f"Process {os.getpid()}: An error occurred while fetching proxies: {str(e)}")
+            return
+
+        with ThreadPoolExecutor(max_workers=PROXY_CHECK_WORKERS) as executor:
+            latencies = dict(zip(candidates, executor.map(self._check_proxy, candidates)))
+
+        with self._lock:
+            self._stats = {proxy: self._new_stats(latency) for proxy, latency in latencies.items() if latency is not None}
+        print(f"Process {os.getpid()}: {len(self._stats)} of {len(candidates)} proxies passed the health check.")
+        self.save()
+
+    @staticmethod
+    def _check_proxy(proxy):
+        """Returns the proxy's round-trip latency in seconds, or None if it did not answer."""
+        start_time = time.monotonic()
+        try:
+            response = requests.get(PROXY_CHECK_URL, proxies=proxy_url_map(proxy), timeout=PROXY_CHECK_TIMEOUT)
+            if response.status_code in (200, 204):
+                return time.monotonic() - start_time
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _score(stats):
+        # Smoothed success rate divided by latency: reliable, fast proxies first.
+        success_rate = (stats["successes"] + 1) / (stats["successes"] + stats["failures"] + 2)
+        return success_rate / ((stats["latency"] or PROXY_CHECK_TIMEOUT) + 0.1)
+
+    def ranked_proxies(self):
+        """Returns the proxies that are not quarantined, best score first."""
+        now = time.time()
+        with self._lock:
+            available = [(self._score(stats), proxy) for proxy, stats in self._stats.items() if stats["quarantined_until"] <= now]
+        return [proxy for _, proxy in sorted(available, reverse=True)]
+
+    def acquire(self):
+        """Returns one of the PROXY_TOP_CANDIDATES best proxies in rotation, or None if none are healthy."""
+        self.ensure_loaded()
+        candidates = self.ranked_proxies()[:PROXY_TOP_CANDIDATES]
+        if not candidates:
+            return None
+        with self._lock:
+            index = (self._rotation + self.rotation_offset) % len(candidates)
+            self._rotation += 1
+        return candidates[index]
+
+    def report(self, proxy, success, latency=None):
+        """Records the outcome of a request made through a proxy."""
+        with self._lock:
+            stats = self._stats.setdefault(proxy, self._new_stats())
+            if success:
+                stats["successes"] += 1
+                stats["consecutive_failures"] = 0
+                if latency is not None:
+                    stats["latency"] = latency if stats["latency"] is None else 0.7 * stats["latency"] + 0.3 * latency
+                return
+            stats["failures"] += 1
+            stats["consecutive_failures"] += 1
+            if stats["consecutive_failures"] >= PROXY_QUARANTINE_AFTER:
+                extra_failures = stats["consecutive_failures"] - PROXY_QUARANTINE_AFTER
+                stats["quarantined_until"] = time.time() + min(PROXY_QUARANTINE_SECONDS * 2 ** extra_failures, 3600)
+                print(f"Process {os.getpid()}: Quarantined proxy {proxy} after {stats['consecutive_failures']} consecutive failures.")
+
+
+_proxy_managers = {}
+_proxy_managers_lock = threading.Lock()
+
+
+def get_proxy_manager(output_dir):
+    """Returns the process-wide ProxyManager. Its list is cached in "<output dir>/.proxy_cache.json" when there is an output dir."""
+    cache_path = os.path.abspath(os.path.join(output_dir, ".proxy_cache.json")) if output_dir else None
+    with _proxy_managers_lock:
+        if cache_path not in _proxy_managers:
+            _proxy_managers[cache_path] = ProxyManager(cache_path)
+        return _proxy_managers[cache_path]
+
+
+class WebDriverPool:
+    """
+    Pool of headless Chrome drivers shared by every scrape in a process. Drivers are created lazily
+    (at most `size`), handed out one caller at a time and quit after `recycle_after` pages to cap
+    Chrome's memory growth.
+    """
+
+    def __init__(self, size=None, recycle_after=None, wait_timeout=None):
+        self.size = max(1, size or WEBDRIVER_POOL_SIZE)
+        self.recycle_after = recycle_after or WEBDRIVER_RECYCLE_AFTER
+        self.wait_timeout = wait_timeout or WEBDRIVER_WAIT_TIMEOUT
+        self._idle = [] # most recently released last, so warm drivers are reused first
+        self._page_counts = {}
+        self._driver_proxies = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        # Signalled whenever a driver is released or discarded, so a waiter can take it or start a replacement.
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+    def _create_driver(self, proxy=None):
+        options = webdriver.ChromeOptions()
+        if proxy:
+            # Must be set before the driver is built; Chrome ignores options added afterwards.
+            options.add_argument(f"--proxy-server=http://{proxy}")
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--log-level=3")
+        options.add_argument("--silent")
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        # "eager" returns once the DOM is ready instead of waiting for ads, images and trackers.
+        options.page_load_strategy = "eager"
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(self.wait_timeout * 2)
+        print(f"Process {os.getpid()}: Started pooled Chrome driver ({self._created}/{self.size}){f' using proxy {proxy}' if proxy else ''}.")
+        return driver
+
+    def acquire(self, proxy_manager=None):
+        """
+        Returns an idle driver, starting a new one if the pool is not full, otherwise waits until a driver is
+        released, or discarded (which frees a slot for a new one). New drivers are bound to the best proxy from
+        proxy_manager, if one is given.
+        """
+        with self._available:
+            while not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        with get_metrics().time_stage("proxy_selection"):
+            proxy = proxy_manager.acquire() if proxy_manager else None
+        try:
+            driver = self._create_driver(proxy)
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+        with self._lock:
+            self._page_counts[id(driver)] = 0
+            self._driver_proxies[id(driver)] = proxy
+        return driver
+
+    def driver_proxy(self, driver):
+        with self._lock:
+            return self._driver_proxies.get(id(driver))
+
+    def release(self, driver, broken=False):
+        """Returns a driver to the pool, quitting it instead if it is broken or has served recycle_after pages."""
+        with self._available:
+            self._page_counts[id(driver)] = self._page_counts.get(id(driver), 0) + 1
+            if not (broken or self._closed or self._page_counts[id(driver)] >= self.recycle_after):
+                self._idle.append(driver)
+                self._available.notify()
+                return
+        self._discard(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+            self._driver_proxies.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Process {os.getpid()}: Error quitting pooled driver: {str(e)}")
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+    def load_page(self, link, proxy_manager=None):
+        """Loads a box score and returns its HTML as soon as the scorebox metadata is present."""
+        # Imported here so only Selenium runs pay for loading selenium.
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver = self.acquire(proxy_manager)
+        proxy = self.driver_proxy(driver)
+        broken = False
+        start_time = time.monotonic()
+        try:
+            driver.get(link)
+            WebDriverWait(driver, self.wait_timeout).until(
+                expected_conditions.presence_of_element_located((By.CSS_SELECTOR, WEBDRIVER_WAIT_SELECTOR)))
+            driver.execute_script("return window.stop();")
+            if proxy and proxy_manager:
+                proxy_manager.report(proxy, True, time.monotonic() - start_time)
+            return driver.page_source
+        except TimeoutException:
+            if proxy and proxy_manager:
+                # A timeout behind a proxy is most likely the proxy; restart the driver on a different one.
+                proxy_manager.report(proxy, False)
+                get_metrics().increment("proxy_changes")
+                broken = True
+            raise
+        except Exception:
+            if proxy and proxy_manager:
+                proxy_manager.report(proxy, False)
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def shutdown(self):
+        """Quits every idle driver. Drivers still in use are quit when they are released."""
+        with self._lock:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self._discard(driver)
+
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """Returns the process-wide WebDriverPool, creating it on first use."""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = WebDriverPool()
+            atexit.register(_driver_pool.shutdown)
+        return _driver_pool
+
+
+class AsyncGameFetcher:
+    """
+    Concurrent box score fetch engine. Keeps up to max_in_flight links scraping at once and yields results
+    as each page completes. The blocking fetch/parse work runs in a thread pool, so results are the same
+    GameRecords that GameScraper.scrape_game produces; per-host limits are left to the RateGovernor that
+    every request goes through.
+    """
+
+    def __init__(self, scraper, max_in_flight=None, reorder_window=None):
+        self.scraper = scraper
+        self.max_in_flight = max(1, max_in_flight or MAX_IN_FLIGHT)
+        # When set, no link is started reorder_window or more links past the oldest unfinished one.
+        self.reorder_window = reorder_window
+
+    async def _fetch_one(self, loop, executor, link_index, link):
+        try:
+            game_info = await loop.run_in_executor(executor, self.scraper.scrape_game, link)
+            return link_index, link, game_info, None
+        except Exception as e:
+            return link_index, link, None, e
+
+    async def iter_games(self, game_links):
+        """
+        Async generator yielding (link_index, link, game_info, error) tuples in completion order.
+        This is the single retry owner for box score links: a link that fails with a retryable error is rescheduled
+        with next_retry_delay() instead of being yielded as a failure straight away, and only the final outcome of
+        each link is yielded.
+        Links not started before the scraper's cancel_event was set are not yielded.
+        """
+        loop = asyncio.get_running_loop()
+        links = iter(enumerate(game_links))
+        next_index = 0
+        unfinished = set() # link_index of every started link whose final outcome has not been yielded
+        attempts = {}
+        retry_heap = [] # (ready time, link_index, link) of links waiting to be retried
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while True:
+                # Top up to max_in_flight so only a bounded number of tasks exist at any time; due retries go first.
+                # After a cancel nothing new is started; the games already in flight are allowed to finish.
+                while len(pending) < self.max_in_flight and not self.scraper.cancelled():
+                    if retry_heap and retry_heap[0][0] <= time.monotonic():
+                        _, link_index, link = heapq.heappop(retry_heap)
+                    else:
+                        if self.reorder_window and unfinished and next_index - min(unfinished) >= self.reorder_window:
+                            break
+                        next_link = next(links, None)
+                        if next_link is None:
+                            break
+                        link_index, link = next_link
+                        next_index = link_index + 1
+                        unfinished.add(link_index)
+                    pending.add(asyncio.ensure_future(self._fetch_one(loop, executor, link_index, link)))
+                if self.scraper.cancelled():
+                    unfinished.difference_update(link_index for _, link_index, _ in retry_heap)
+                    retry_heap = []
+                if not pending and not retry_heap:
+                    break
+                timeout = max(0.0, retry_heap[0][0] - time.monotonic()) if retry_heap else None
+                if not pending:
+                    await asyncio.sleep(timeout)
+                    continue
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    link_index, link, game_info, error = task.result()
+                    delay = None if error is None else next_retry_delay(error, attempts.get(link_index, 0) + 1)
+                    if delay is not None:
+                        attempts[link_index] = attempts.get(link_index, 0) + 1
+                        game_day = box_score_date(link)
+                        get_metrics().increment("retries", game_day.year if game_day else None)
+                        print(f"Process {os.getpid()}: Retrying {link} in {delay:.1f}s "
+                              f"(attempt {attempts[link_index] + 1}/{LINK_MAX_RETRIES + 1}): {str(error)}")
+                        heapq.heappush(retry_heap, (time.monotonic() + delay, link_index, link))
+                        continue
+                    unfinished.discard(link_index)
+                    yield link_index, link, game_info, None if error is None else str(error)
+
+
 # --- Helper functions for UI ---
 
 def create_year_entry_fields(num_years_str, frame):
@@ -445,96 +2426,865 @@ def select_output_directory_wrapper(output_dir_label_widget):
         output_dir_path = ""
         update_status("Output directory selection cancelled.", "black")
 
-def save_excel_and_text_files(df, output_dir, year_identifier):
-    """Saves the DataFrame to an Excel and a text file in the specified directory."""
+TEXT_EXPORT_COLUMNS = ['Away Team Symbol', 'Away Team Score', 'Home Team Symbol', 'Home Team Score',
+                       'Total Runs Scored', 'Date', 'Time', 'Time Zone', 'Venue', 'Latitude', 'Longitude']
+
+
+def format_games_text(df):
+    """
+    Builds the contents of {year}_games_data.txt column-wise: one line per row that has every TEXT_EXPORT_COLUMNS
+    value, formatted exactly like the original per-row f-string.
+    """
+    if df is None or df.empty or not all(col in df.columns for col in TEXT_EXPORT_COLUMNS):
+        return ""
+    complete_rows = df[TEXT_EXPORT_COLUMNS].notna().all(axis=1)
+    if not complete_rows.any():
+        return ""
+    # astype(str) renders each cell the way the f-string did (str() of the Python/NumPy scalar).
+    text = {col: df.loc[complete_rows, col].astype(str) for col in TEXT_EXPORT_COLUMNS}
+    lines = ('"' + text['Away Team Symbol'] + text['Away Team Score'] + '@' + text['Home Team Symbol'] + text['Home Team Score']
+             + ' T' + text['Total Runs Scored'] + '","' + text['Date'] + '","' + text['Time'] + '","' + text['Time Zone']
+             + '","' + text['Venue'] + '","' + text['Latitude'] + '","' + text['Longitude'] + '"\n')
+    return "".join(lines.tolist())
+
+
+def season_of_games(df):
+    """Returns a Series with each game's season, taken from its box score link (falling back to the Date column)."""
+    seasons = pd.Series(pd.NA, index=df.index, dtype="Int64")
+    if 'Game Link' in df.columns:
+        seasons = df['Game Link'].map(lambda link: box_score_date(str(link)).year if box_score_date(str(link)) else pd.NA).astype("Int64")
+    if 'Date' in df.columns and seasons.isna().any():
+        parsed_years = pd.to_datetime(df['Date'], format="%B %d, %Y", errors="coerce").dt.year.astype("Int64")
+        seasons = seasons.fillna(parsed_years)
+    return seasons
+
+
+class CsvStreamWriter:
+    """
+    Appends DataFrame chunks to one CSV file, writing the header with the first chunk only. With append, an existing
+    file is kept and new rows are aligned to its header instead.
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.rows_written = 0
+        self._columns = None
+        self._header_written = False
+        if append and os.path.exists(path):
+            with open(path, newline='', encoding='utf-8') as csv_file:
+                self._columns = next(csv.reader(csv_file), None)
+            self._header_written = self._columns is not None
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def write(self, chunk_df):
+        if chunk_df is None or chunk_df.empty:
+            return
+        if self._columns is None:
+            self._columns = chunk_df.columns.tolist()
+        # Later chunks are aligned to the first chunk's columns so the file stays rectangular.
+        chunk_df.reindex(columns=self._columns).to_csv(self.path, mode='a', header=not self._header_written, index=False)
+        self._header_written = True
+        self.rows_written += len(chunk_df)
+
+
+class GameDatabase:
+    """
+    SQLite store for game records keyed by Game Link, so overlapping season and date range scrapes
+    collapse into one table. All writes in a process go through one writer thread fed by a queue;
+    other processes are serialised by SQLite's own locking (WAL mode plus a busy timeout).
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.columns = []
+        self._queue = queue.Queue()
+        self._error = None
+        self._writer = threading.Thread(target=self._write_loop, name="sqlite-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f'CREATE TABLE IF NOT EXISTS {SQLITE_TABLE} ("Game Link" TEXT PRIMARY KEY)')
+        connection.commit()
+        return connection
+
+    def _ensure_indexes(self, connection):
+        for index_name, index_columns in SQLITE_INDEXES.items():
+            self._ensure_columns(connection, index_columns)
+            quoted = ", ".join(f'"{col}"' for col in index_columns)
+            connection.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {SQLITE_TABLE} ({quoted})')
+
+    def _ensure_columns(self, connection, columns):
+        existing = {row[1] for row in connection.execute(f'PRAGMA table_info({SQLITE_TABLE})')}
+        for col in columns:
+            if col not in existing:
+                connection.execute(f'ALTER TABLE {SQLITE_TABLE} ADD COLUMN "{col}"')
+        self.columns = [row[1] for row in connection.execute(f'PRAGMA table_info({SQLITE_TABLE})')]
+
+    @staticmethod
+    def _sqlite_value(value):
+        if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
+            return None
+        if isinstance(value, (pd.Timestamp, datetime, date)):
+            return value.isoformat()
+        if hasattr(value, "item"):
+            return value.item()
+        return value
+
+    def _upsert(self, connection, columns, rows):
+        # New columns are added in the order they first arrive, then the indexes on top of them.
+        self._ensure_columns(connection, columns)
+        self._ensure_indexes(connection)
+        quoted = ", ".join(f'"{col}"' for col in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f'"{col}" = excluded."{col}"' for col in columns if col != "Game Link")
+        statement = f'INSERT INTO {SQLITE_TABLE} ({quoted}) VALUES ({placeholders}) ON CONFLICT("Game Link") DO UPDATE SET {updates}'
+        for start in range(0, len(rows), SQLITE_BATCH_SIZE):
+            connection.executemany(statement, rows[start:start + SQLITE_BATCH_SIZE])
+        connection.commit()
+
+    def _write_loop(self):
+        connection = None
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if connection is None:
+                    connection = self._connect()
+                self._upsert(connection, *item)
+            except Exception as e:
+                self._error = e
+                print(f"Process {os.getpid()}: Error writing to {self.db_path}: {str(e)}")
+            finally:
+                self._queue.task_done()
+                if item is None and connection is not None:
+                    connection.close()
+
+    def upsert_dataframe(self, df):
+        """Queues every row of the DataFrame for an upsert. Rows without a Game Link are skipped."""
+        if df is None or df.empty or 'Game Link' not in df.columns:
+            return 0
+        df = df[df['Game Link'].notna()].assign(Season=season_of_games(df))
+        columns = df.columns.tolist()
+        rows = [tuple(self._sqlite_value(value) for value in row) for row in df.itertuples(index=False, name=None)]
+        self._queue.put((columns, rows))
+        return len(rows)
+
+    def flush(self):
+        """Blocks until the writer has committed everything queued so far; re-raises the last write error."""
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def load(self, seasons=None):
+        """Reads the stored games (optionally only some seasons) back into a DataFrame."""
+        self.flush()
+        if not os.path.exists(self.db_path):
+            return pd.DataFrame()
+        with sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT) as connection:
+            query = f'SELECT * FROM {SQLITE_TABLE}'
+            params = []
+            if seasons is not None:
+                seasons = [int(season) for season in seasons]
+                query += f' WHERE "Season" IN ({", ".join("?" for _ in seasons)})'
+                params = seasons
+            return pd.read_sql_query(query + ' ORDER BY "Game Link"', connection, params=params)
+
+
+_game_databases = {}
+_game_databases_lock = threading.Lock()
+
+
+def get_game_database(output_dir):
+    """Returns the process-wide GameDatabase (and its writer thread) for the output directory."""
+    db_path = os.path.abspath(os.path.join(output_dir, SQLITE_DB_FILENAME))
+    with _game_databases_lock:
+        if db_path not in _game_databases:
+            _game_databases[db_path] = GameDatabase(db_path)
+            atexit.register(_game_databases[db_path].close)
+        return _game_databases[db_path]
+
+
+class GameChunkWriter(ABC):
+    """
+    Base of the output backends. write() is called once per chunk of enriched games, then close() once.
+    Files are written to <name>.partial and only moved into place by close(); abort() removes them instead,
+    so a failed or cancelled run leaves the previous outputs untouched.
+
+    With keep_existing (update and redrive runs, which only pass games that are not stored yet) the new games are
+    added to the stored outputs: formats that can be appended to are appended in place and truncated back by
+    abort(), the others copy their stored rows into the partial file before the first new chunk.
+    """
+
+    label = None
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False):
+        self.output_dir = output_dir
+        self.year_identifier = year_identifier
+        self.keep_existing = keep_existing
+        self._partial_files = {} # final path -> partial path
+        self._appended_files = {} # path -> size before this run
+
+    def _partial_path(self, path):
+        return self._partial_files.setdefault(path, f"{path}.partial")
+
+    def _output_path(self, path):
+        """Returns the path to write to: the stored file itself when appending to it, otherwise its partial file."""
+        if self.keep_existing and os.path.exists(path):
+            self._appended_files.setdefault(path, os.path.getsize(path))
+            return path
+        return self._partial_path(path)
+
+    @abstractmethod
+    def write(self, chunk_df):
+        """Writes one chunk of enriched games."""
+
+    def _finish(self):
+        """Flushes and closes whatever the writer holds open."""
+
+    def close(self):
+        self._finish()
+        for path, partial_path in self._partial_files.items():
+            os.replace(partial_path, path)
+            print(f"Process {os.getpid()}: {self.label} file saved as: {path}")
+
+    def abort(self):
+        with contextlib.suppress(Exception):
+            self._finish()
+        for partial_path in self._partial_files.values():
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        for path, size in self._appended_files.items():
+            with contextlib.suppress(OSError):
+                os.truncate(path, size)
+
+
+class ExcelChunkWriter(GameChunkWriter):
+    """Streams rows into a write-only openpyxl workbook, with the header styled the way DataFrame.to_excel styles it."""
+
+    label = "Excel"
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False):
+        super().__init__(output_dir, year_identifier, keep_existing)
+        self._path = os.path.join(output_dir, f"{year_identifier}_games_data.xlsx")
+        self._workbook = None
+        self._sheet = None
+        self._columns = None
+
+    @staticmethod
+    def _cell_value(value):
+        if isinstance(value, (list, dict)):
+            return str(value)
+        if value is None or pd.isna(value):
+            return None
+        if isinstance(value, pd.Timestamp):
+            # Excel has no timezones; UTC Start is written as naive UTC.
+            return (value.tz_convert(None) if value.tzinfo is not None else value).to_pydatetime()
+        return value.item() if hasattr(value, "item") else value
+
+    def write(self, chunk_df):
+        if self._workbook is None:
+            import openpyxl
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Border, Font, Side
+
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet("Sheet1")
+            self._columns = chunk_df.columns.tolist()
+            stored_rows = None
+            if self.keep_existing and os.path.exists(self._path):
+                # An xlsx cannot be appended to: the stored rows are streamed into the new workbook ahead of the new games.
+                stored_workbook = openpyxl.load_workbook(self._path, read_only=True)
+                stored_rows = stored_workbook.active.iter_rows(values_only=True)
+                stored_columns = [str(col) for col in next(stored_rows, ()) if col is not None]
+                self._columns = stored_columns + [col for col in self._columns if col not in stored_columns]
+            thin = Side(style="thin")
+            header = []
+            for col in self._columns:
+                cell = WriteOnlyCell(self._sheet, value=str(col))
+                cell.font = Font(bold=True)
+                cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+                cell.alignment = Alignment(horizontal="center", vertical="top")
+                header.append(cell)
+            self._sheet.append(header)
+            if stored_rows is not None:
+                for row in stored_rows:
+                    self._sheet.append(row)
+                stored_workbook.close()
+        for row in chunk_df.reindex(columns=self._columns).itertuples(index=False, name=None):
+            self._sheet.append([self._cell_value(value) for value in row])
+
+    def _finish(self):
+        if self._workbook is not None:
+            workbook, self._workbook = self._workbook, None
+            workbook.save(self._partial_path(self._path))
+
+
+class TextChunkWriter(GameChunkWriter):
+    """
+    Writes {year}_games_data.txt and, next to it, {year}_games_data_links.txt with the Game Link of every game
+    written, since the text lines do not carry it (see stored_game_links()).
+    """
+
+    label = "Text"
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False):
+        super().__init__(output_dir, year_identifier, keep_existing)
+        text_path = os.path.join(output_dir, f"{year_identifier}_games_data.txt")
+        links_path = game_links_path(output_dir, year_identifier)
+        # A text file saved without its links file stays that way: a links file listing only the new games would
+        # make the rest of the season look unsaved.
+        keeps_unlisted_text = keep_existing and os.path.exists(text_path) and not os.path.exists(links_path)
+        path = self._output_path(text_path)
+        self._file = open(path, "a" if path in self._appended_files else "w", encoding='utf-8')
+        self._links_file = None
+        if not keeps_unlisted_text:
+            path = self._output_path(links_path)
+            self._links_file = open(path, "a" if path in self._appended_files else "w", encoding='utf-8')
+
+    def write(self, chunk_df):
+        self._file.write(format_games_text(chunk_df))
+        if self._links_file is not None and 'Game Link' in chunk_df.columns:
+            self._links_file.write("".join(f"{link}\n" for link in chunk_df['Game Link'].dropna()))
+
+    def _finish(self):
+        self._file.close()
+        if self._links_file is not None:
+            self._links_file.close()
+
+
+class CsvChunkWriter(GameChunkWriter):
+    label = "CSV"
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False):
+        super().__init__(output_dir, year_identifier, keep_existing)
+        path = self._output_path(os.path.join(output_dir, f"{year_identifier}_games_data.csv"))
+        self._writer = CsvStreamWriter(path, append=path in self._appended_files)
+
+    def write(self, chunk_df):
+        self._writer.write(chunk_df)
+
+
+class PartitionedChunkWriter(GameChunkWriter):
+    """
+    Writes one file per season under <output dir>/<dataset>_<format>/season=<year>/<year_identifier>.<format>,
+    appending each chunk as a row group (parquet) or record batch (feather) with pyarrow. The dataset is "games",
+    or a box score table name. Columns the first chunk of a season did not have are dropped from later chunks.
+    With keep_existing, only the seasons that get new rows are rewritten, starting with their stored rows.
+    """
+
+    file_format = None
+
+    def __init__(self, output_dir, year_identifier, dataset="games", keep_existing=False):
+        super().__init__(output_dir, year_identifier, keep_existing)
+        self.dataset = dataset
+        self._writers = {} # season -> (pyarrow writer, schema)
+        self._skipped_rows = 0
+
+    def _field_type(self, field_type):
+        import pyarrow
+
+        # Columns that are empty in the first chunk are typed as strings rather than null so later chunks fit.
+        if pyarrow.types.is_null(field_type):
+            return pyarrow.string()
+        # Category columns: every chunk brings its own dictionary. Parquet re-encodes them per row group (with
+        # indices wide enough for any chunk); Arrow IPC files allow one dictionary per column, so feather stores text.
+        if pyarrow.types.is_dictionary(field_type):
+            return pyarrow.dictionary(pyarrow.int32(), field_type.value_type) if self.file_format == "parquet" else field_type.value_type
+        return field_type
+
+    def _stored_batches(self, path):
+        """Returns the schema and an iterator over the record batches of a stored season file."""
+        if self.file_format == "parquet":
+            import pyarrow.parquet
+            stored_file = pyarrow.parquet.ParquetFile(path)
+            return stored_file.schema_arrow, stored_file.iter_batches()
+        import pyarrow.ipc
+        reader = pyarrow.ipc.open_file(path)
+        return reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+    def _open(self, season, table):
+        import pyarrow
+
+        season_dir = os.path.join(self.output_dir, f"{self.dataset}_{self.file_format}", f"season={season}")
+        path = os.path.join(season_dir, f"{self.year_identifier}.{self.file_format}")
+        stored_batches = ()
+        if self.keep_existing and os.path.exists(path):
+            # The stored schema wins, so the stored rows and the new chunks line up column for column.
+            stored_schema, stored_batches = self._stored_batches(path)
+            table = stored_schema.empty_table()
+        schema = pyarrow.schema([field.with_type(self._field_type(field.type)) for field in table.schema], metadata=table.schema.metadata)
+        os.makedirs(season_dir, exist_ok=True)
+        partial_path = self._partial_path(path)
+        if self.file_format == "parquet":
+            import pyarrow.parquet
+            writer = pyarrow.parquet.ParquetWriter(partial_path, schema, compression="zstd")
+        else:
+            import pyarrow.ipc
+            writer = pyarrow.ipc.new_file(partial_path, schema, options=pyarrow.ipc.IpcWriteOptions(compression="zstd"))
+        self._writers[season] = (writer, schema)
+        for batch in stored_batches:
+            writer.write_table(pyarrow.Table.from_batches([batch]).cast(schema))
+        return writer, schema
+
+    def write(self, chunk_df):
+        import pyarrow
+
+        seasons = season_of_games(chunk_df)
+        self._skipped_rows += int(seasons.isna().sum())
+        for season in seasons.dropna().unique():
+            season_df = chunk_df[seasons == season].reset_index(drop=True)
+            if int(season) not in self._writers:
+                self._open(int(season), pyarrow.Table.from_pandas(season_df, preserve_index=False))
+            writer, schema = self._writers[int(season)]
+            writer.write_table(pyarrow.Table.from_pandas(season_df.reindex(columns=schema.names), schema=schema, preserve_index=False))
+
+    def _finish(self):
+        writers, self._writers = self._writers, {}
+        for writer, _ in writers.values():
+            writer.close()
+        if self._skipped_rows:
+            print(f"Process {os.getpid()}: Skipped {self._skipped_rows} rows without a known season for {self.dataset} {self.file_format} output ({self.year_identifier}).")
+            self._skipped_rows = 0
+
+    def abort(self):
+        super().abort()
+        for partial_path in self._partial_files.values():
+            with contextlib.suppress(OSError):
+                os.rmdir(os.path.dirname(partial_path)) # only succeeds if this run created the season directory
+
+
+class ParquetChunkWriter(PartitionedChunkWriter):
+    label = "Parquet"
+    file_format = "parquet"
+
+
+class FeatherChunkWriter(PartitionedChunkWriter):
+    label = "Feather"
+    file_format = "feather"
+
+
+class SqliteChunkWriter(GameChunkWriter):
+    """Queues each chunk for the database writer thread. Upserted rows are complete games, so abort() keeps them."""
+
+    label = "SQLite"
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False):
+        super().__init__(output_dir, year_identifier, keep_existing)
+        self._database = get_game_database(output_dir)
+        self._row_count = 0
+
+    def write(self, chunk_df):
+        self._row_count += self._database.upsert_dataframe(chunk_df)
+
+    def _finish(self):
+        self._database.flush()
+
+    def close(self):
+        self._finish()
+        print(f"Process {os.getpid()}: Upserted {self._row_count} games for {self.year_identifier} into: {self._database.db_path}")
+
+
+OUTPUT_BACKENDS = {
+    "excel": ExcelChunkWriter,
+    "text": TextChunkWriter,
+    "csv": CsvChunkWriter,
+    "parquet": ParquetChunkWriter,
+    "feather": FeatherChunkWriter,
+    "sqlite": SqliteChunkWriter,
+}
+
+
+def ensure_output_dir(output_dir):
+    """Creates the output directory if needed; returns False (after printing why) when there is none to write to."""
     if not output_dir:
         print(f"Process {os.getpid()}: Output directory not specified. Cannot save files.")
-        return
-
+        return False
     try:
         os.makedirs(output_dir, exist_ok=True)
-        # print(f"Process {os.getpid()}: Ensured output directory exists: {output_dir}")
     except Exception as e:
         print(f"Process {os.getpid()}: Error creating output directory {output_dir}: {str(e)}")
-        return
+        return False
+    return True
 
-    excel_filename = os.path.join(output_dir, f"{year_identifier}_games_data.xlsx")
-    text_filename = os.path.join(output_dir, f"{year_identifier}_games_data.txt")
 
-    try:
-        df.to_excel(excel_filename, index=False)
-        print(f"Process {os.getpid()}: Excel file saved as: {excel_filename}")
-    except Exception as e:
-        print(f"Process {os.getpid()}: Error saving Excel file {excel_filename}: {str(e)}")
+class GameOutputStream:
+    """
+    Write stage of the streaming pipeline: one chunk writer per selected output format (defaults to OUTPUT_FORMATS).
+    A backend that fails is reported, aborted and dropped; the others carry on. keep_existing is passed to the
+    backends (see GameChunkWriter).
+    """
 
+    def __init__(self, output_dir, year_identifier, output_formats=None, keep_existing=False):
+        self.year_identifier = year_identifier
+        self.rows_written = 0
+        self.writers = {}
+        for output_format in output_formats or OUTPUT_FORMATS:
+            backend = OUTPUT_BACKENDS.get(output_format)
+            if backend is None:
+                print(f"Process {os.getpid()}: Unknown output format '{output_format}'. Available: {', '.join(OUTPUT_BACKENDS)}.")
+                continue
+            self._run(output_format, lambda: self.writers.__setitem__(output_format, backend(output_dir, year_identifier, keep_existing=keep_existing)))
+
+    def _run(self, output_format, action):
+        try:
+            with get_metrics().time_stage(f"save_{output_format}", self.year_identifier):
+                action()
+            return
+        except ImportError as e:
+            print(f"Process {os.getpid()}: {output_format} output needs an optional dependency (pip install pyarrow): {str(e)}")
+        except Exception as e:
+            print(f"Process {os.getpid()}: Error saving {output_format} output for {self.year_identifier}: {str(e)}")
+        writer = self.writers.pop(output_format, None)
+        if writer is not None:
+            writer.abort()
+
+    def write(self, chunk_df):
+        for output_format, writer in list(self.writers.items()):
+            self._run(output_format, lambda: writer.write(chunk_df))
+        self.rows_written += len(chunk_df)
+
+    def close(self):
+        for output_format, writer in list(self.writers.items()):
+            self._run(output_format, writer.close)
+        self.writers = {}
+
+    def abort(self):
+        for writer in self.writers.values():
+            writer.abort()
+        self.writers = {}
+
+
+def save_game_outputs(df, output_dir, year_identifier, output_formats=None):
+    """Saves the DataFrame with every selected output backend (defaults to OUTPUT_FORMATS), OUTPUT_CHUNK_ROWS rows at a time."""
+    if not ensure_output_dir(output_dir):
+        return
+    stream = GameOutputStream(output_dir, year_identifier, output_formats)
     try:
-        with open(text_filename, "w", encoding='utf-8') as text_file:
-            required_cols = ['Away Team Symbol', 'Away Team Score', 'Home Team Symbol', 'Home Team Score',
-                             'Total Runs Scored', 'Date', 'Time', 'Time Zone', 'Venue', 'Latitude', 'Longitude']
-            for index, row in df.iterrows():
-                if all(col in df.columns and pd.notna(row.get(col)) for col in required_cols):
-                    try:
-                        game_data_line = f'"{row["Away Team Symbol"]}{row["Away Team Score"]}@{row["Home Team Symbol"]}{row["Home Team Score"]} T{row["Total Runs Scored"]}",'
-                        game_data_line += f'"{row["Date"]}","{row["Time"]}","{row["Time Zone"]}","{row["Venue"]}","{row["Latitude"]}","{row["Longitude"]}"\n'
-                        text_file.write(game_data_line)
-                    except Exception as row_e:
-                        print(f"Process {os.getpid()}: Error formatting text line for row {index} ({year_identifier}): {str(row_e)}. Skipping row.")
-                else:
-                    pass
+        # An empty frame still goes through once so the files are written with their headers.
+        for start in range(0, max(len(df), 1), OUTPUT_CHUNK_ROWS):
+            stream.write(df.iloc[start:start + OUTPUT_CHUNK_ROWS])
+    except BaseException:
+        stream.abort()
+        raise
+    stream.close()
 
-        print(f"Process {os.getpid()}: Text file saved as: {text_filename}")
 
-    except Exception as e:
-        print(f"Process {os.getpid()}: Error saving Text file {text_filename}: {str(e)}")
+def save_excel_and_text_files(df, output_dir, year_identifier):
+    """Saves the DataFrame to an Excel and a text file in the specified directory."""
+    save_game_outputs(df, output_dir, year_identifier, ("excel", "text"))
 
 
-def process_game_data_and_save(game_data, lookup_file, output_dir, year_identifier):
+def load_partitioned(output_dir, dataset, seasons=None, file_format="parquet", year_identifier=None):
     """
-    Processes scraped game data by merging with a lookup file, adds team symbols,
-    and saves the result to Excel and text files. Runs within a process.
+    Loads a season-partitioned parquet/feather dataset (optionally only some seasons, or one run's files) into one
+    DataFrame with a Season column.
     """
-    if not game_data:
-        print(f"Process {os.getpid()}: No game data provided to process for {year_identifier}.")
-        return
+    season_dirs = sorted(glob.glob(os.path.join(output_dir, f"{dataset}_{file_format}", "season=*")))
+    frames = []
+    for season_dir in season_dirs:
+        season = int(season_dir.rsplit("=", 1)[1])
+        if seasons is not None and season not in seasons:
+            continue
+        for filename in sorted(glob.glob(os.path.join(season_dir, f"{year_identifier or '*'}.{file_format}"))):
+            frame = pd.read_parquet(filename) if file_format == "parquet" else pd.read_feather(filename)
+            frames.append(frame.assign(Season=season))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
 
-    try:
-        if not lookup_file:
-            print(f"Process {os.getpid()}: Lookup file path is empty. Cannot process data for {year_identifier}.")
-            return
 
-        lookup_file_abs = os.path.abspath(lookup_file)
-        if not os.path.exists(lookup_file_abs):
-            print(f"Process {os.getpid()}: Lookup file not found at {lookup_file_abs}. Cannot process data for {year_identifier}.")
-            return
+def load_games(output_dir, seasons=None, file_format="parquet"):
+    """Loads the season-partitioned parquet/feather games outputs (optionally only some seasons) into one DataFrame."""
+    return apply_game_dtypes(load_partitioned(output_dir, "games", seasons, file_format))
+
 
+def load_box_table(output_dir, table, seasons=None, file_format=None):
+    """Loads one box score table ("line_score", "batting" or "pitching") for all or some seasons; join it to the games on 'Game Link'."""
+    return load_partitioned(output_dir, table, seasons, file_format or BOX_TABLE_FORMAT)
+
+
+def load_play_by_play(output_dir, seasons=None, file_format=None, year_identifier=None):
+    """
+    Loads the play-by-play events for all or some seasons (or one run's part files), one row per event; join them to
+    the games on 'Game Link'. A game written to more than one part (scraped again later) keeps its newest events.
+    """
+    file_format = file_format or BOX_TABLE_FORMAT
+    frames = []
+    for season_dir in sorted(glob.glob(os.path.join(output_dir, f"play_by_play_{file_format}", "season=*"))):
+        season = int(season_dir.rsplit("=", 1)[1])
+        if seasons is not None and season not in seasons:
+            continue
+        pattern = f"{glob.escape(year_identifier) if year_identifier else '*'}.part*.{file_format}"
+        for part_order, filename in enumerate(sorted(glob.glob(os.path.join(season_dir, pattern)), key=lambda path: (os.path.getmtime(path), path))):
+            frame = pd.read_parquet(filename) if file_format == "parquet" else pd.read_feather(filename)
+            frames.append(frame.assign(Season=season, _part=part_order))
+    if not frames:
+        return pd.DataFrame()
+    events = pd.concat(frames, ignore_index=True)
+    newest = events.groupby("Game Link")["_part"].transform("max")
+    return events[events["_part"] == newest].drop(columns="_part").reset_index(drop=True)
+
+
+# Identity columns of the box score tables; every other column is a stat and is stored as a float.
+BOX_TABLE_TEXT_COLUMNS = ("Game Link", "Team", "Side", "Player", "Player ID", "details")
+BOX_TABLE_WRITERS = {"parquet": ParquetChunkWriter, "feather": FeatherChunkWriter}
+
+
+def box_table_frame(games):
+    """Builds one box score table's DataFrame from (game link, {column: values}) pairs, with 'Game Link' first."""
+    columns = list(dict.fromkeys(column for _, table in games for column in table))
+    data = {"Game Link": [], **{column: [] for column in columns}}
+    for link, table in games:
+        row_count = len(next(iter(table.values()), ()))
+        data["Game Link"].extend([link] * row_count)
+        for column in columns:
+            data[column].extend(table.get(column) or [None] * row_count)
+    frame = pd.DataFrame(data)
+    for column in columns:
+        if column not in BOX_TABLE_TEXT_COLUMNS and column != "Innings":
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+    return frame
+
+
+class BoxTableStream:
+    """
+    Write stage for the box score tables carried by GameRecords: rows are buffered per table and appended
+    OUTPUT_CHUNK_ROWS at a time to a season-partitioned BOX_TABLE_FORMAT writer per table, whose files are moved
+    into place by close() like the games outputs. With keep_existing (update and redrive runs), close() also carries
+    over the stored rows of every game this run did not write again.
+    """
+
+    def __init__(self, output_dir, year_identifier, keep_existing=False, file_format=None):
+        self.output_dir = output_dir
+        self.year_identifier = year_identifier
+        self.keep_existing = keep_existing
+        self.file_format = file_format or BOX_TABLE_FORMAT
+        self.game_links = set()
+        self._buffers = {table: [] for table in BOX_TABLE_NAMES}
+        self._buffered_rows = dict.fromkeys(BOX_TABLE_NAMES, 0)
+        self._writers = {}
+        self._failed = set()
+
+    def collect(self, games):
+        """Passes GameRecords (or game_info dicts) through, taking their box score tables on the way."""
+        for game in games:
+            record = as_game_record(game)
+            self.add(record)
+            yield record
+
+    def add(self, record):
+        if not record.box_tables or not record.game_link:
+            return
+        self.game_links.add(record.game_link)
+        for table, columns in record.box_tables.items():
+            row_count = len(next(iter(columns.values()), ()))
+            if table not in self._buffers or not row_count:
+                continue
+            self._buffers[table].append((record.game_link, columns))
+            self._buffered_rows[table] += row_count
+            if self._buffered_rows[table] >= OUTPUT_CHUNK_ROWS:
+                self._flush(table)
+
+    def _write(self, table, frame):
+        if table in self._failed or frame.empty:
+            return
+        try:
+            with get_metrics().time_stage(f"save_{table}", self.year_identifier):
+                if table not in self._writers:
+                    self._writers[table] = BOX_TABLE_WRITERS[self.file_format](self.output_dir, self.year_identifier, dataset=table)
+                self._writers[table].write(frame)
+            return
+        except ImportError as e:
+            print(f"Process {os.getpid()}: Box score tables need an optional dependency (pip install pyarrow): {str(e)}")
+        except Exception as e:
+            print(f"Process {os.getpid()}: Error saving the {table} table for {self.year_identifier}: {str(e)}")
+        self._failed.add(table)
+        writer = self._writers.pop(table, None)
+        if writer is not None:
+            writer.abort()
+
+    def _flush(self, table):
+        games, self._buffers[table] = self._buffers[table], []
+        self._buffered_rows[table] = 0
+        if games:
+            self._write(table, box_table_frame(games))
+
+    def _carry_over_existing(self, table):
         try:
-            lookup_df = pd.read_excel(lookup_file_abs)
-            # print(f"Process {os.getpid()}: Loaded lookup file from {lookup_file_abs}. Columns: {lookup_df.columns.tolist()}")
+            existing = load_partitioned(self.output_dir, table, file_format=self.file_format, year_identifier=self.year_identifier)
         except Exception as e:
-            print(f"Process {os.getpid()}: Error loading lookup file {lookup_file_abs}: {str(e)}. Cannot process data.")
+            print(f"Process {os.getpid()}: Could not read the existing {table} table for {self.year_identifier}: {str(e)}")
             return
+        if existing.empty:
+            return
+        existing = existing[~existing["Game Link"].isin(self.game_links)].drop(columns="Season")
+        for start in range(0, len(existing), OUTPUT_CHUNK_ROWS):
+            self._write(table, existing.iloc[start:start + OUTPUT_CHUNK_ROWS])
+
+    def close(self):
+        if not self.game_links:
+            return # nothing new: whatever is stored stays as it is
+        for table in BOX_TABLE_NAMES:
+            self._flush(table)
+            if self.keep_existing:
+                self._carry_over_existing(table)
+            writer = self._writers.pop(table, None)
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception as e:
+                    print(f"Process {os.getpid()}: Error saving the {table} table for {self.year_identifier}: {str(e)}")
+                    writer.abort()
 
-        scraped_df = pd.DataFrame(game_data)
-        print(f"Process {os.getpid()}: Created DataFrame from {len(scraped_df)} scraped games.")
+    def abort(self):
+        for writer in self._writers.values():
+            writer.abort()
+        self._writers = {}
+
+
+# Play-by-play columns converted from the page's text: outs to a number, the win probability columns from "3%" to 3.0.
+PLAY_BY_PLAY_NUMERIC_COLUMNS = ("outs", "win_probability_added", "win_expectancy_post")
 
-        merge_cols_from_lookup = ['Team', 'City', 'State', 'Longitude', 'Latitude', 'Time Zone', 'TZ Abb']
-        lookup_merge_subset = lookup_df.filter(items=merge_cols_from_lookup).copy()
 
-        merged_df = scraped_df
-        merge_successful = False
+def play_by_play_frame(columns):
+    """Builds the play-by-play DataFrame for one chunk from PlayByPlayWriter's column buffer."""
+    frame = pd.DataFrame(columns)
+    for column in ("Event", "Inning"):
+        if column in frame.columns:
+            frame[column] = frame[column].astype("Int16")
+    for column in PLAY_BY_PLAY_NUMERIC_COLUMNS:
+        if column in frame.columns:
+            frame[column] = pd.to_numeric(frame[column].astype("string").str.rstrip("%"), errors="coerce").astype("float64")
+    return frame
+
+
+class PlayByPlayWriter:
+    """
+    Write stage for play-by-play events. add() appends a game's events to one column buffer, and every
+    PLAY_BY_PLAY_CHUNK_ROWS events flush() writes the buffer out as a complete, numbered part file (see
+    PLAY_BY_PLAY_ENABLED), so memory stays flat however many games a run has and a crash loses at most the
+    unwritten chunk. Parts are only ever added; load_play_by_play() keeps each game's events from its newest part.
+    """
 
-        if 'Team' in lookup_merge_subset.columns:
+    def __init__(self, output_dir, year_identifier, file_format=None):
+        self.output_dir = output_dir
+        self.year_identifier = year_identifier
+        self.file_format = file_format or BOX_TABLE_FORMAT
+        self._columns = {"Game Link": []}
+        self._row_count = 0
+        self._next_part = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def part_paths(self):
+        pattern = os.path.join(self.output_dir, f"play_by_play_{self.file_format}", "season=*",
+                               f"{glob.escape(self.year_identifier)}.part*.{self.file_format}")
+        return sorted(glob.glob(pattern))
+
+    def stored_links(self):
+        """Returns the links of every game with events in this run's part files."""
+        links = set()
+        for path in self.part_paths():
             try:
-                scraped_df['Home Team_str'] = scraped_df['Home Team'].astype(str)
-                lookup_merge_subset['Team_str'] = lookup_merge_subset['Team'].astype(str)
+                frame = pd.read_parquet(path, columns=["Game Link"]) if self.file_format == "parquet" else pd.read_feather(path, columns=["Game Link"])
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not read play-by-play part {path}: {str(e)}")
+                continue
+            links.update(frame["Game Link"].dropna().unique())
+        return links
+
+    def add(self, game_link, events):
+        """Buffers one game's events ({column: values}, from parse_play_by_play())."""
+        row_count = len(events.get("Event") or ())
+        if not row_count or self._failed:
+            return
+        with self._lock:
+            for column in events:
+                if column not in self._columns:
+                    self._columns[column] = [None] * self._row_count
+            for column, values in self._columns.items():
+                if column == "Game Link":
+                    values.extend([game_link] * row_count)
+                else:
+                    values.extend(events.get(column) or [None] * row_count)
+            self._row_count += row_count
+            if self._row_count >= PLAY_BY_PLAY_CHUNK_ROWS:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._row_count:
+            return
+        columns, self._columns = self._columns, {"Game Link": []}
+        self._row_count = 0
+        if self._next_part is None:
+            part_numbers = [int(path.rsplit(".part", 1)[1].split(".", 1)[0]) for path in self.part_paths()]
+            self._next_part = max(part_numbers, default=0) + 1
+        writer = BOX_TABLE_WRITERS[self.file_format](self.output_dir, f"{self.year_identifier}.part{self._next_part:05d}", dataset="play_by_play")
+        try:
+            with get_metrics().time_stage("save_play_by_play", self.year_identifier):
+                writer.write(play_by_play_frame(columns))
+                writer.close()
+            self._next_part += 1
+            return
+        except ImportError as e:
+            print(f"Process {os.getpid()}: Play-by-play output needs an optional dependency (pip install pyarrow): {str(e)}")
+            self._failed = True
+        except Exception as e:
+            print(f"Process {os.getpid()}: Error saving play-by-play events for {self.year_identifier}: {str(e)}")
+        writer.abort()
+
 
-                merged_df = pd.merge(scraped_df, lookup_merge_subset,
-                                     left_on='Home Team_str', right_on='Team_str', how='left', suffixes=('', '_lookup'))
+LOOKUP_MERGE_COLUMNS = ['Team', 'City', 'State', 'Longitude', 'Latitude', 'Time Zone', 'TZ Abb']
 
-                merged_df = merged_df.drop(columns=['Home Team_str', 'Team_str'], errors='ignore')
 
-                # print(f"Process {os.getpid()}: Successfully merged scraped data with lookup for venue info.")
-                merge_successful = True
+class StadiumLookup:
+    """
+    Preprocessed stadium lookup workbook. The workbook is parsed once and reduced to plain dict indexes keyed
+    by team name, so enriching games is a dictionary lookup per team instead of a pd.merge per season.
+    """
+
+    def __init__(self, lookup_df):
+        self.columns = lookup_df.columns.tolist()
+        self.merge_columns = [col for col in LOOKUP_MERGE_COLUMNS if col in self.columns]
+        self.merge_rows = {}
+        self.symbol_by_team = {}
+        if 'Team' in self.columns:
+            for row in lookup_df.to_dict('records'):
+                # Keyed like the original merge (str of the cell), first row wins for repeated teams.
+                self.merge_rows.setdefault(str(row['Team']), {col: row[col] for col in self.merge_columns})
+                if 'Column1' in self.columns:
+                    self.symbol_by_team[str(row['Team']).strip()] = str(row['Column1'])
+
+    def has_symbols(self):
+        return 'Team' in self.columns and 'Column1' in self.columns
+
+    def enrich_dataframe(self, scraped_df):
+        """Adds the lookup columns for the home team and the team symbols, in the same layout the old pd.merge produced."""
+        merged_df = scraped_df.copy()
+
+        if self.merge_columns and 'Team' in self.merge_columns:
+            try:
+                home_keys = merged_df['Home Team'].astype(str)
+                for col in self.merge_columns:
+                    merged_df[col] = home_keys.map({team: row[col] for team, row in self.merge_rows.items()})
             except Exception as e:
                 print(f"Process {os.getpid()}: Error during merge with lookup for venue info: {str(e)}. Proceeding without merged venue info.")
 
@@ -543,17 +3293,10 @@ def process_game_data_and_save(game_data, lookup_file, output_dir, year_identifi
         if 'Away Team Symbol' not in merged_df.columns:
             merged_df['Away Team Symbol'] = "Unknown"
 
-        if 'Team' in lookup_df.columns and 'Column1' in lookup_df.columns and \
-           'Home Team' in scraped_df.columns and 'Away Team' in scraped_df.columns:
+        if self.has_symbols() and 'Home Team' in scraped_df.columns and 'Away Team' in scraped_df.columns:
             try:
-                lookup_df['Team_str'] = lookup_df['Team'].astype(str).str.strip()
-                team_symbol_map = lookup_df.set_index('Team_str')['Column1'].astype(str).to_dict()
-
-                merged_df['Home Team Symbol'] = merged_df['Home Team'].astype(str).str.strip().map(team_symbol_map).fillna("Unknown")
-                merged_df['Away Team Symbol'] = merged_df['Away Team'].astype(str).str.strip().map(team_symbol_map).fillna("Unknown")
-
-                if 'Team_str' in lookup_df.columns:
-                    lookup_df = lookup_df.drop(columns=['Team_str'], errors='ignore')
+                merged_df['Home Team Symbol'] = merged_df['Home Team'].astype(str).str.strip().map(self.symbol_by_team).fillna("Unknown")
+                merged_df['Away Team Symbol'] = merged_df['Away Team'].astype(str).str.strip().map(self.symbol_by_team).fillna("Unknown")
 
                 unknown_home_teams = merged_df[merged_df['Home Team Symbol'] == "Unknown"]['Home Team'].unique()
                 unknown_home_teams = [team for team in unknown_home_teams if pd.notna(team) and team != "Unknown"]
@@ -569,11 +3312,109 @@ def process_game_data_and_save(game_data, lookup_file, output_dir, year_identifi
                 print(f"Process {os.getpid()}: Error mapping team symbols from lookup: {str(e)}")
 
         else:
-            print(f"Process {os.getpid()}: Lookup file {lookup_file_abs} is missing the required 'Team' or 'Column1' column(s) or scraped data is missing 'Home Team'/'Away Team' columns for adding symbols.")
+            print(f"Process {os.getpid()}: Lookup file is missing the required 'Team' or 'Column1' column(s) or scraped data is missing 'Home Team'/'Away Team' columns for adding symbols.")
+
+        return merged_df
+
+
+_stadium_lookups = {}
+_stadium_lookups_lock = threading.Lock()
+
+
+def _lookup_cache_path(lookup_file_abs):
+    """The preprocessed lookup is cached as JSON next to its workbook (not in the shared temp directory)."""
+    directory, filename = os.path.split(lookup_file_abs)
+    return os.path.join(directory, f".{filename}.lookup-cache.json")
+
+
+def get_stadium_lookup(lookup_file):
+    """
+    Returns the StadiumLookup for a workbook. It is kept in memory per process and its plain dict indexes are
+    saved as JSON next to the workbook, so other processes skip openpyxl entirely. Both copies are invalidated when the workbook's mtime or size changes.
+    """
+    lookup_file_abs = os.path.abspath(lookup_file)
+    try:
+        stat = os.stat(lookup_file_abs)
+    except OSError as e:
+        print(f"Process {os.getpid()}: Lookup file not found at {lookup_file_abs}: {str(e)}")
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _stadium_lookups_lock:
+        cached = _stadium_lookups.get(lookup_file_abs)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        cache_path = _lookup_cache_path(lookup_file_abs)
+        lookup = None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            cached_signature, cached_state = tuple(cached["signature"]), cached["state"]
+            if cached_signature == signature:
+                lookup = StadiumLookup.__new__(StadiumLookup)
+                lookup.__dict__.update(cached_state)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Process {os.getpid()}: Ignoring unreadable lookup cache {cache_path}: {str(e)}")
+
+        if lookup is None:
+            try:
+                lookup = StadiumLookup(pd.read_excel(lookup_file_abs))
+            except Exception as e:
+                print(f"Process {os.getpid()}: Error loading lookup file {lookup_file_abs}: {str(e)}. Cannot process data.")
+                return None
+            try:
+                temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as cache_file:
+                    json.dump({"signature": signature, "state": lookup.__dict__}, cache_file, ensure_ascii=False)
+                os.replace(temp_path, cache_path)
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not write lookup cache {cache_path}: {str(e)}")
+
+        _stadium_lookups[lookup_file_abs] = (signature, lookup)
+        return lookup
+
+
+def load_lookup_for_run(lookup_file, year_identifier):
+    """Returns the StadiumLookup for a run's lookup file, or None (after printing why) if it cannot be used."""
+    if not lookup_file:
+        print(f"Process {os.getpid()}: Lookup file path is empty. Cannot process data for {year_identifier}.")
+        return None
+
+    lookup_file_abs = os.path.abspath(lookup_file)
+    if not os.path.exists(lookup_file_abs):
+        print(f"Process {os.getpid()}: Lookup file not found at {lookup_file_abs}. Cannot process data for {year_identifier}.")
+        return None
+    return get_stadium_lookup(lookup_file_abs)
+
+
+def build_game_dataframe(game_data, lookup_file, year_identifier):
+    """
+    Processes scraped game data by merging with a lookup file and adds team symbols.
+    Returns the merged DataFrame, or None if the data could not be processed.
+    """
+    if not game_data:
+        print(f"Process {os.getpid()}: No game data provided to process for {year_identifier}.")
+        return None
+
+    try:
+        lookup = load_lookup_for_run(lookup_file, year_identifier)
+        if lookup is None:
+            return None
+
+        scraped_df = games_frame(game_data)
+        print(f"Process {os.getpid()}: Created DataFrame from {len(scraped_df)} scraped games.")
+
+        with get_metrics().time_stage("lookup_merge", year_identifier):
+            merged_df = apply_game_dtypes(lookup.enrich_dataframe(scraped_df))
+        with get_metrics().time_stage("datetime_normalize", year_identifier):
+            normalize_game_datetimes(merged_df)
 
         # print(f"Process {os.getpid()}: Added symbols to data for {year_identifier}.")
 
-        save_excel_and_text_files(merged_df, output_dir, year_identifier)
+        return merged_df
 
     except FileNotFoundError:
         print(f"Process {os.getpid()}: Lookup file not found at {lookup_file}.")
@@ -581,18 +3422,183 @@ def process_game_data_and_save(game_data, lookup_file, output_dir, year_identifi
         print(f"Process {os.getpid()}: Missing expected column during data processing: {e}")
     except Exception as e:
         print(f"Process {os.getpid()}: An unexpected error occurred during data processing or saving for {year_identifier}: {str(e)}")
+    return None
+
+
+def iter_enriched_chunks(game_infos, lookup, year_identifier, chunk_rows=None):
+    """Enrich stage of the streaming pipeline: yields the games as lookup-enriched DataFrames of up to chunk_rows rows."""
+    def enrich(chunk):
+        with get_metrics().time_stage("lookup_merge", year_identifier):
+            chunk_df = apply_game_dtypes(lookup.enrich_dataframe(games_frame(chunk)))
+        with get_metrics().time_stage("datetime_normalize", year_identifier):
+            return normalize_game_datetimes(chunk_df)
+
+    chunk_rows = chunk_rows or OUTPUT_CHUNK_ROWS
+    chunk = []
+    for game_info in game_infos:
+        chunk.append(game_info)
+        if len(chunk) >= chunk_rows:
+            yield enrich(chunk)
+            chunk = []
+    if chunk:
+        yield enrich(chunk)
+
+
+def stream_game_data_and_save(game_infos, lookup_file, output_dir, year_identifier, output_formats=None, should_commit=None,
+                              keep_existing=False):
+    """
+    Enriches games (GameRecords or game_info dicts, in a list or a generator such as GameScraper.iter_game_data)
+    chunk by chunk and appends each chunk to the selected outputs, so only one chunk is ever held in memory.
+    The outputs replace the previous ones at the end, unless nothing was written or should_commit() returns False
+    (e.g. the run was cancelled). With keep_existing the games are added to the stored outputs instead (the
+    games must not be stored already; see stored_game_links()). Box score tables carried by the games are
+    written and committed alongside. Once the outputs are committed the run's GameCheckpoint is removed.
+    Returns the number of games written, or None if the lookup file could not be loaded.
+    """
+    lookup = load_lookup_for_run(lookup_file, year_identifier)
+    if lookup is None or not ensure_output_dir(output_dir):
+        return None
+
+    stream = GameOutputStream(output_dir, year_identifier, output_formats, keep_existing=keep_existing)
+    box_tables = BoxTableStream(output_dir, year_identifier, keep_existing=keep_existing)
+    try:
+        for chunk_df in iter_enriched_chunks(box_tables.collect(game_infos), lookup, year_identifier):
+            stream.write(chunk_df)
+    except BaseException:
+        stream.abort()
+        box_tables.abort()
+        raise
+    if stream.rows_written == 0 or (should_commit is not None and not should_commit()):
+        stream.abort()
+        box_tables.abort()
+    else:
+        stream.close()
+        box_tables.close()
+        checkpoint = GameCheckpoint.for_run(output_dir, year_identifier)
+        if checkpoint:
+            checkpoint.remove()
+    return stream.rows_written
+
+
+def process_game_data_and_save(game_data, lookup_file, output_dir, year_identifier, output_formats=None):
+    """
+    Processes scraped game data by merging with a lookup file, adds team symbols,
+    and saves the result with the selected output backends (Excel and text by default). Runs within a process.
+    """
+    if not game_data:
+        print(f"Process {os.getpid()}: No game data provided to process for {year_identifier}.")
+        return
+    stream_game_data_and_save(game_data, lookup_file, output_dir, year_identifier, output_formats)
+
+
+def game_links_path(output_dir, year_identifier):
+    """The file listing the Game Link of every game in {year_identifier}_games_data.txt, one per line."""
+    return os.path.join(output_dir, f"{year_identifier}_games_data_links.txt")
+
+
+def stored_game_links(output_dir, year_identifier):
+    """
+    Returns the set of 'Game Link's in a previously saved {year_identifier}_games_data output (reading only that
+    column, or the text output's links file), or an empty set if there is none.
+    """
+    def links(frame):
+        return set(frame['Game Link'].dropna().astype(str))
+
+    candidates = [
+        (os.path.join(output_dir, f"{year_identifier}_games_data.xlsx"), lambda filename: pd.read_excel(filename, usecols=['Game Link'])),
+        (os.path.join(output_dir, f"{year_identifier}_games_data.csv"), lambda filename: pd.read_csv(filename, usecols=['Game Link'])),
+    ]
+    for filename, reader in candidates:
+        if os.path.exists(filename):
+            try:
+                return links(reader(filename))
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not read existing output {filename}: {str(e)}")
+
+    for file_format in ("parquet", "feather"):
+        filenames = sorted(glob.glob(os.path.join(output_dir, f"games_{file_format}", "season=*", f"{year_identifier}.{file_format}")))
+        if filenames:
+            try:
+                reader = pd.read_parquet if file_format == "parquet" else pd.read_feather
+                return set().union(*(links(reader(filename, columns=['Game Link'])) for filename in filenames))
+            except Exception as e:
+                print(f"Process {os.getpid()}: Could not read existing {file_format} output for {year_identifier}: {str(e)}")
+
+    if str(year_identifier).isdigit() and os.path.exists(os.path.join(output_dir, SQLITE_DB_FILENAME)):
+        try:
+            database = get_game_database(output_dir)
+            database.flush()
+            with sqlite3.connect(database.db_path, timeout=SQLITE_BUSY_TIMEOUT) as connection:
+                rows = connection.execute(f'SELECT "Game Link" FROM {SQLITE_TABLE} WHERE "Season" = ?', (int(year_identifier),)).fetchall()
+            return {row[0] for row in rows if row[0]}
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read existing SQLite output for {year_identifier}: {str(e)}")
+
+    links_path = game_links_path(output_dir, year_identifier)
+    if os.path.exists(links_path):
+        try:
+            with open(links_path, "r", encoding="utf-8") as links_file:
+                return {line.strip() for line in links_file if line.strip()}
+        except Exception as e:
+            print(f"Process {os.getpid()}: Could not read existing links file {links_path}: {str(e)}")
+    return set()
+
+
+def selected_output_formats():
+    """Returns the output formats ticked in the UI, or the configured defaults when the UI is not running."""
+    if not output_format_vars:
+        return None
+    return tuple(name for name, var in output_format_vars.items() if var.get())
+
+
+def set_box_tables_enabled(enabled):
+    """Turns box score table extraction on or off for the runs started from now on (worker processes copy the setting)."""
+    global BOX_TABLES_ENABLED
+    BOX_TABLES_ENABLED = bool(enabled)
+
+
+def set_play_by_play_enabled(enabled):
+    """Turns play-by-play extraction on or off for the runs started from now on (worker processes copy the setting)."""
+    global PLAY_BY_PLAY_ENABLED
+    PLAY_BY_PLAY_ENABLED = bool(enabled)
 
 
 def update_status(message, color="black"):
     """Updates the UI status label and prints to console."""
+    global last_status_color
+    last_status_color = color
     if 'root' in globals() and root.winfo_exists() and status_label:
         status_label.after(0, status_label.config, {"text": message, "fg": color})
     print(f"Status: {message}")
 
+def update_progress(text):
+    """Shows live run progress in the UI progress area, or on the console when there is no UI."""
+    if 'root' in globals() and root.winfo_exists() and progress_label:
+        progress_label.after(0, progress_label.config, {"text": text})
+    else:
+        print(f"Progress:\n{text}")
+
+
+def new_cancel_event():
+    """Creates the cancel event for the run that is about to start and arms the Cancel button."""
+    global cancel_event
+    cancel_event = multiprocessing.Event()
+    return cancel_event
+
+
+def cancel_scraping():
+    """Asks the running scrape to stop: no new games are started and the ones in flight finish."""
+    if cancel_event is not None and not cancel_event.is_set():
+        cancel_event.set()
+        update_status("Cancelling... games already in flight will finish first.", "orange")
+        if cancel_button and cancel_button.winfo_exists():
+            cancel_button.config(state=tk.DISABLED)
+
+
 def disable_buttons():
     """Disables relevant UI elements to prevent interaction during scraping."""
     widgets_to_disable = [
-        scrape_all_season_button, scrape_range_button, create_fields_button,
+        scrape_all_season_button, update_season_button, redrive_button, scrape_range_button, create_fields_button,
         start_multi_year_button, lookup_button, output_dir_button,
         num_years_spinbox, season_entry, start_date_entry, end_date_entry
     ]
@@ -604,11 +3610,14 @@ def disable_buttons():
         if entry and entry.winfo_exists():
             entry.config(state=tk.DISABLED)
 
+    if cancel_button and cancel_button.winfo_exists():
+        cancel_button.config(state=tk.NORMAL)
+
 
 def enable_buttons():
     """Enables UI elements after scraping is complete."""
     widgets_to_enable = [
-        scrape_all_season_button, scrape_range_button, create_fields_button,
+        scrape_all_season_button, update_season_button, redrive_button, scrape_range_button, create_fields_button,
         start_multi_year_button, lookup_button, output_dir_button,
         num_years_spinbox, season_entry, start_date_entry, end_date_entry
     ]
@@ -620,6 +3629,9 @@ def enable_buttons():
         if entry and entry.winfo_exists():
             entry.config(state=tk.NORMAL)
 
+    if cancel_button and cancel_button.winfo_exists():
+        cancel_button.config(state=tk.DISABLED)
+
 
 # --- Functions triggered by UI Buttons ---
 
@@ -641,7 +3653,11 @@ def start_scraping_single_season():
         update_status(f"Starting single season scrape for {year}...", "blue")
         disable_buttons()
 
-        scrape_thread = threading.Thread(target=lambda: run_single_season_scrape(year, lookup_file_path, output_dir_path))
+        use_selenium = bool(use_selenium_var.get()) if use_selenium_var else None
+        use_proxies = bool(use_proxies_var.get()) if use_proxies_var else None
+        output_formats = selected_output_formats()
+        run_cancel_event = new_cancel_event()
+        scrape_thread = threading.Thread(target=lambda: run_single_season_scrape(year, lookup_file_path, output_dir_path, use_selenium, use_proxies, output_formats=output_formats, cancel_event=run_cancel_event))
         scrape_thread.start()
 
     except ValueError:
@@ -652,20 +3668,27 @@ def start_scraping_single_season():
         enable_buttons()
 
 
-def run_single_season_scrape(year, lookup_file, output_dir):
+def run_single_season_scrape(year, lookup_file, output_dir, use_selenium=None, use_proxies=None, output_formats=None, cancel_event=None):
     """Worker function to perform single season scraping and saving."""
+    run_label = str(year)
+    get_metrics().reset()
     try:
         year_identifier = str(year)
         scraper = GameScraper()
-        scraper.init(output_dir, year_identifier)
+        scraper.init(output_dir, year_identifier, use_selenium, use_proxies)
+        scraper.cancel_event = cancel_event
         game_links = scraper.get_all_games(year)
         if game_links:
             print(f"Thread: Found {len(game_links)} game links for season {year}. Starting scrape...")
-            game_data = scraper.scrape_game_data(game_links)
-            if game_data:
-                print(f"Thread: Finished scraping data for {len(game_data)} games in season {year}. Processing data...")
-                process_game_data_and_save(game_data, lookup_file, output_dir, year_identifier)
-                update_status(f"Single season {year} scraping finished. Data saved to {output_dir}.", "green")
+            # Games are enriched and written in chunks while the rest of the season is still downloading.
+            games_written = stream_game_data_and_save(scraper.iter_game_data(game_links), lookup_file, output_dir, year_identifier,
+                                                      output_formats, should_commit=lambda: not scraper.cancelled())
+            if scraper.cancelled():
+                update_status(f"Season {year} scrape cancelled after {games_written or 0} games. Progress is checkpointed and will resume on the next run.", "orange")
+            elif games_written is None:
+                update_status(f"Could not process game data for season {year}.", "red")
+            elif games_written:
+                update_status(f"Single season {year} scraping finished ({games_written} games). Data saved to {output_dir}.", "green")
             else:
                 update_status(f"No game data scraped for season {year}.", "orange")
         else:
@@ -674,6 +3697,179 @@ def run_single_season_scrape(year, lookup_file, output_dir):
         update_status(f"Error during single season scrape for {year}: {str(e)}", "red")
         print(f"Thread: Error during single season scrape for {year}: {str(e)}")
     finally:
+        export_run_metrics(output_dir, run_label)
+        if 'root' in globals() and root.winfo_exists():
+            root.after(0, enable_buttons)
+
+
+def start_incremental_season_update():
+    """Initiates an incremental (new games only) update of a season in a separate thread."""
+    year = season_entry.get().strip()
+    if not year:
+        update_status("Please enter a season year (e.g., 2023) to update.", "red")
+        return
+    if not lookup_file_path:
+        update_status("Please select a lookup file first.", "red")
+        return
+    if not output_dir_path:
+        update_status("Please select an output directory first.", "red")
+        return
+
+    try:
+        int(year)
+        update_status(f"Checking season {year} for new games...", "blue")
+        disable_buttons()
+
+        use_selenium = bool(use_selenium_var.get()) if use_selenium_var else None
+        use_proxies = bool(use_proxies_var.get()) if use_proxies_var else None
+        output_formats = selected_output_formats()
+        run_cancel_event = new_cancel_event()
+        scrape_thread = threading.Thread(target=lambda: run_incremental_season_update(year, lookup_file_path, output_dir_path, use_selenium, use_proxies, output_formats=output_formats, cancel_event=run_cancel_event))
+        scrape_thread.start()
+
+    except ValueError:
+        update_status("Invalid year entered. Please enter a number (e.g., 2023).", "red")
+        enable_buttons()
+    except Exception as e:
+        update_status(f"Error preparing season update: {str(e)}", "red")
+        enable_buttons()
+
+
+def run_incremental_season_update(year, lookup_file, output_dir, use_selenium=None, use_proxies=None, output_formats=None, cancel_event=None):
+    """
+    Worker function that scrapes only the games of a season that are missing from its existing
+    {year}_games_data output and adds them to it, streaming them through the chunk writers like a full run
+    (CSV and text are appended to, SQLite upserted, the other formats rewritten with their stored rows first).
+    """
+    run_label = f"{year}_update"
+    get_metrics().reset()
+    try:
+        year_identifier = str(year)
+        scraper = GameScraper()
+        scraper.init(output_dir, year_identifier, use_selenium, use_proxies)
+        scraper.cancel_event = cancel_event
+        game_links = scraper.get_all_games(year)
+        if not game_links:
+            update_status(f"No game links found for season {year}.", "orange")
+            return
+
+        existing_links = stored_game_links(output_dir, year_identifier)
+        if not existing_links and os.path.exists(os.path.join(output_dir, f"{year_identifier}_games_data.txt")):
+            # Text lines carry no Game Link, so without another output (or the links file) every game would look new.
+            update_status(f"Cannot update season {year}: its saved text output does not record which games it holds. "
+                          f"Run a full scrape of the season instead.", "red")
+            return
+        new_links = [link for link in game_links if link not in existing_links]
+        print(f"Thread: Season {year} schedule has {len(game_links)} games, {len(existing_links)} already saved, {len(new_links)} new.")
+
+        if not new_links:
+            update_status(f"Season {year} is already up to date.", "green")
+            return
+
+        # The update is additive, so the games finished before a cancel are kept.
+        games_written = stream_game_data_and_save(scraper.iter_game_data(new_links), lookup_file, output_dir, year_identifier,
+                                                  output_formats, keep_existing=True)
+        if games_written is None:
+            update_status(f"Could not process new games for season {year}.", "red")
+        elif scraper.cancelled():
+            update_status(f"Season {year} update cancelled; saved the {games_written} new games scraped so far.", "orange")
+        elif not games_written:
+            update_status(f"No new game data scraped for season {year}.", "orange")
+        else:
+            update_status(f"Season {year} updated with {games_written} new games ({len(existing_links) + games_written} total). Data saved to {output_dir}.", "green")
+    except Exception as e:
+        update_status(f"Error during incremental update for {year}: {str(e)}", "red")
+        print(f"Thread: Error during incremental update for {year}: {str(e)}")
+    finally:
+        export_run_metrics(output_dir, run_label)
+        if 'root' in globals() and root.winfo_exists():
+            root.after(0, enable_buttons)
+
+
+def start_failed_link_redrive():
+    """Initiates a redrive of the season's failed links in a separate thread."""
+    year = season_entry.get().strip()
+    if not year:
+        update_status("Please enter a season year (e.g., 2023) to redrive.", "red")
+        return
+    if not lookup_file_path:
+        update_status("Please select a lookup file first.", "red")
+        return
+    if not output_dir_path:
+        update_status("Please select an output directory first.", "red")
+        return
+
+    try:
+        int(year)
+        update_status(f"Redriving failed links for season {year}...", "blue")
+        disable_buttons()
+
+        use_selenium = bool(use_selenium_var.get()) if use_selenium_var else None
+        use_proxies = bool(use_proxies_var.get()) if use_proxies_var else None
+        output_formats = selected_output_formats()
+        run_cancel_event = new_cancel_event()
+        scrape_thread = threading.Thread(target=lambda: run_failed_link_redrive(year, lookup_file_path, output_dir_path, use_selenium, use_proxies, output_formats=output_formats, cancel_event=run_cancel_event))
+        scrape_thread.start()
+
+    except ValueError:
+        update_status("Invalid year entered. Please enter a number (e.g., 2023).", "red")
+        enable_buttons()
+    except Exception as e:
+        update_status(f"Error preparing failed link redrive: {str(e)}", "red")
+        enable_buttons()
+
+
+def run_failed_link_redrive(year_identifier, lookup_file, output_dir, use_selenium=None, use_proxies=None, output_formats=None, cancel_event=None):
+    """
+    Worker function that scrapes only the links in {year_identifier}_failed_links.csv,
+    adds the recovered games to the existing {year_identifier}_games_data output (streamed like an incremental
+    update) and drops them from the file. Links that fail again stay in the file with their latest error.
+    """
+    run_label = f"{year_identifier}_redrive"
+    get_metrics().reset()
+    try:
+        year_identifier = str(year_identifier)
+        scraper = GameScraper()
+        scraper.init(output_dir, year_identifier, use_selenium, use_proxies)
+        scraper.cancel_event = cancel_event
+        failed_links = scraper.failed_links.load()
+        if not failed_links:
+            update_status(f"No failed links recorded for {year_identifier}.", "green")
+            return
+
+        # A link that made it into the outputs since it failed (e.g. a later rerun) counts as recovered.
+        recovered_links = stored_game_links(output_dir, year_identifier) & set(failed_links)
+        redrive_links = [link for link in failed_links if link not in recovered_links]
+        print(f"Thread: Redriving {len(redrive_links)} failed links for {year_identifier}...")
+
+        def recovered(games):
+            for game in games:
+                recovered_links.add(game.game_link)
+                yield game
+
+        if redrive_links:
+            games_written = stream_game_data_and_save(recovered(scraper.iter_game_data(redrive_links)), lookup_file, output_dir,
+                                                      year_identifier, output_formats, keep_existing=True)
+            if games_written is None:
+                update_status(f"Could not process the recovered games for {year_identifier}.", "red")
+                return
+
+        # Re-read after the scrape so links that failed again carry their newest error.
+        still_failing = {link: error for link, error in scraper.failed_links.load().items()
+                         if link in failed_links and link not in recovered_links}
+        scraper.failed_links.rewrite(still_failing)
+        if scraper.cancelled():
+            update_status(f"Redrive for {year_identifier} cancelled; recovered {len(recovered_links)} of {len(failed_links)} failed links so far.", "orange")
+        elif still_failing:
+            update_status(f"Redrive for {year_identifier} recovered {len(recovered_links)} of {len(failed_links)} failed links; "
+                          f"{len(still_failing)} still failing.", "orange")
+        else:
+            update_status(f"Redrive for {year_identifier} recovered all {len(failed_links)} failed links. Data saved to {output_dir}.", "green")
+    except Exception as e:
+        update_status(f"Error during failed link redrive for {year_identifier}: {str(e)}", "red")
+        print(f"Thread: Error during failed link redrive for {year_identifier}: {str(e)}")
+    finally:
+        export_run_metrics(output_dir, run_label)
         if 'root' in globals() and root.winfo_exists():
             root.after(0, enable_buttons)
 
@@ -703,7 +3899,11 @@ def start_scraping_date_range():
         update_status(f"Starting scrape for date range {start_date_str} to {end_date_str}...", "blue")
         disable_buttons()
 
-        scrape_thread = threading.Thread(target=lambda: run_date_range_scrape(start_date, end_date, lookup_file_path, output_dir_path))
+        use_selenium = bool(use_selenium_var.get()) if use_selenium_var else None
+        use_proxies = bool(use_proxies_var.get()) if use_proxies_var else None
+        output_formats = selected_output_formats()
+        run_cancel_event = new_cancel_event()
+        scrape_thread = threading.Thread(target=lambda: run_date_range_scrape(start_date, end_date, lookup_file_path, output_dir_path, use_selenium, use_proxies, output_formats=output_formats, cancel_event=run_cancel_event))
         scrape_thread.start()
 
     except ValueError:
@@ -714,28 +3914,33 @@ def start_scraping_date_range():
         enable_buttons()
 
 
-def run_date_range_scrape(start_date, end_date, lookup_file, output_dir):
+def run_date_range_scrape(start_date, end_date, lookup_file, output_dir, use_selenium=None, use_proxies=None, output_formats=None, cancel_event=None):
     """Worker function to perform date range scraping and saving."""
+    run_label = f"{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}"
+    get_metrics().reset()
     try:
         year_identifier = f"{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}"
         scraper = GameScraper()
-        scraper.init(output_dir, year_identifier)
-        game_links = scraper.get_game_links_by_date_range(start_date, end_date)
-        if game_links:
-            print(f"Thread: Found {len(game_links)} game links for date range. Starting scrape...")
-            game_data = scraper.scrape_game_data(game_links)
-            if game_data:
-                print(f"Thread: Finished scraping data for {len(game_data)} games in range. Processing data...")
-                process_game_data_and_save(game_data, lookup_file, output_dir, year_identifier)
-                update_status(f"Date range scrape finished. Data saved to {output_dir}.", "green")
-            else:
-                update_status(f"No game data scraped for date range.", "orange")
+        scraper.init(output_dir, year_identifier, use_selenium, use_proxies)
+        scraper.cancel_event = cancel_event
+        # Links are discovered a season at a time and flow straight into the fetch, enrich and write stages,
+        # so a multi-decade range uses about as much memory as a single week.
+        game_links = scraper.iter_game_links_by_date_range(start_date, end_date)
+        games_written = stream_game_data_and_save(scraper.iter_game_data(game_links), lookup_file, output_dir, year_identifier,
+                                                  output_formats, should_commit=lambda: not scraper.cancelled())
+        if scraper.cancelled():
+            update_status(f"Date range scrape cancelled after {games_written or 0} games. Progress is checkpointed and will resume on the next run.", "orange")
+        elif games_written is None:
+            update_status(f"Could not process game data for date range.", "red")
+        elif games_written:
+            update_status(f"Date range scrape finished ({games_written} games). Data saved to {output_dir}.", "green")
         else:
-            update_status(f"No game links found for date range.", "orange")
+            update_status(f"No game data scraped for date range.", "orange")
     except Exception as e:
         update_status(f"Error during date range scrape: {str(e)}", "red")
         print(f"Thread: Error during date range scrape: {str(e)}")
     finally:
+        export_run_metrics(output_dir, run_label)
         if 'root' in globals() and root.winfo_exists():
             root.after(0, enable_buttons)
 
@@ -779,47 +3984,267 @@ def start_scraping_multiple_years():
             print("Main Process: Could not set multiprocessing start method to 'spawn'. Proceeding with default.")
 
 
-    update_status(f"Starting concurrent scrape for {len(valid_years)} years: {', '.join(map(str, valid_years))}...", "blue")
+    update_status(f"Starting scrape for {len(valid_years)} years: {', '.join(map(str, valid_years))}...", "blue")
 
     disable_buttons()
 
-    processes = []
-    for i, year in enumerate(valid_years):
-        p = multiprocessing.Process(target=run_multi_year_worker, args=(year, lookup_file_path, output_dir_path, i))
-        processes.append(p)
-        p.start()
-        print(f"Main Process: Launched process {p.pid} for year {year} with initial proxy index offset {i}")
+    use_selenium = bool(use_selenium_var.get()) if use_selenium_var else None
+    use_proxies = bool(use_proxies_var.get()) if use_proxies_var else None
+    output_formats = selected_output_formats()
+    run_cancel_event = new_cancel_event()
+    scrape_thread = threading.Thread(target=lambda: run_multi_year_scrape(valid_years, lookup_file_path, output_dir_path, use_selenium, use_proxies, output_formats=output_formats, cancel_event=run_cancel_event))
+    scrape_thread.start()
+
+
+def default_worker_count(use_selenium=False):
+    """Sizes the scrape pool to the CPU count, capped by how many workers fit in available memory."""
+    worker_count = os.cpu_count() or 2
+    try:
+        available_bytes = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        per_worker = SELENIUM_WORKER_MEMORY_ESTIMATE if use_selenium else WORKER_MEMORY_ESTIMATE
+        worker_count = min(worker_count, available_bytes // per_worker)
+    except (AttributeError, ValueError, OSError):
+        pass # os.sysconf is not available on Windows; fall back to the CPU count.
+    if MAX_SCRAPE_WORKERS:
+        worker_count = min(worker_count, MAX_SCRAPE_WORKERS)
+    return max(1, int(worker_count))
+
 
-    update_status(f"Launched {len(processes)} concurrent scraping processes. Check console for detailed progress messages from each process. UI is now responsive.", "green")
-    enable_buttons()
+_worker_scraper = None
+_worker_max_in_flight = None
+_worker_telemetry = None
+
+
+def _init_scrape_worker(output_dir, use_selenium, use_proxies, max_in_flight, settings=None, telemetry_queue=None, cancel_event=None):
+    """
+    Pool initializer: builds the one GameScraper each worker process reuses for all of its tasks.
+    telemetry_queue receives a (year, succeeded) event per finished game; cancel_event stops new links from starting.
+    """
+    global _worker_scraper, _worker_max_in_flight, _worker_telemetry
+    if settings:
+        globals().update(settings)
+    _worker_scraper = GameScraper()
+    _worker_scraper.init(output_dir, None, use_selenium, use_proxies)
+    _worker_scraper.cancel_event = cancel_event
+    _worker_max_in_flight = max_in_flight
+    _worker_telemetry = telemetry_queue
+
+
+def _scrape_game_batch(batch):
+    """Pool task: scrapes a batch of (year, link) pairs and returns ((year, link, game_info, error) tuples, metrics snapshot)."""
+    links = [link for _, link in batch]
+    results = []
+
+    async def collect():
+        fetcher = AsyncGameFetcher(_worker_scraper, max_in_flight=_worker_max_in_flight)
+        async for link_index, link, game_info, error in fetcher.iter_games(links):
+            results.append((batch[link_index][0], link, game_info, error))
+            if _worker_telemetry is not None:
+                _worker_telemetry.put((batch[link_index][0], error is None))
+
+    asyncio.run(collect())
+    # Links skipped because of a cancel are reported back so the main process can account for them.
+    finished_links = {link for _, link, _, _ in results}
+    results.extend((year, link, None, SCRAPE_CANCELLED) for year, link in batch if link not in finished_links)
+    # The metrics recorded for this batch travel back with its results; the main process merges them.
+    return results, get_metrics().snapshot(reset=True)
+
+
+class ScrapeProgress:
+    """Per-year progress of a run, fed by worker telemetry: games done, failures, games per minute and ETA."""
+
+    def __init__(self, year_totals, year_already_done=None):
+        self.started_at = time.monotonic()
+        self.totals = dict(year_totals)
+        self.done = {year: (year_already_done or {}).get(year, 0) for year in self.totals}
+        self.failed = {year: 0 for year in self.totals}
+        self.finished_this_run = 0
+
+    def record(self, year, succeeded):
+        self.done[year] = self.done.get(year, 0) + 1
+        if not succeeded:
+            self.failed[year] = self.failed.get(year, 0) + 1
+        self.finished_this_run += 1
+
+    def games_per_minute(self):
+        elapsed = time.monotonic() - self.started_at
+        return self.finished_this_run / elapsed * 60 if elapsed > 0 else 0.0
+
+    def render(self):
+        lines = []
+        for year, total in self.totals.items():
+            percent = self.done[year] / total * 100 if total else 100.0
+            lines.append(f"{year}: {self.done[year]}/{total} games ({percent:.0f}%), {self.failed[year]} failed")
+        remaining = sum(self.totals.values()) - sum(self.done.values())
+        rate = self.games_per_minute()
+        eta = str(timedelta(seconds=int(remaining / rate * 60))) if rate > 0 else "unknown"
+        lines.append(f"{rate:.1f} games/min, ETA {eta}, {sum(self.failed.values())} failed")
+        return "\n".join(lines)
+
+
+def run_multi_year_scrape(years, lookup_file, output_dir, use_selenium=None, use_proxies=None, num_workers=None, output_formats=None,
+                          cancel_event=None):
+    """
+    Scrapes several seasons with one shared queue of game links and a fixed-size worker pool.
+    Each year is processed and saved as soon as its last game comes back, streamed back out of the year's
+    checkpoint (every finished game is checkpointed on arrival), so the main process only holds link offsets.
+    Workers report every finished game over a multiprocessing queue, which drives the live progress display.
+    Setting cancel_event stops the workers from starting new games; partly scraped years are left in their
+    checkpoints, not saved.
+    """
+    run_label = f"years_{min(years)}_{max(years)}" if years else "years"
+    get_metrics().reset()
+    try:
+        num_workers = num_workers or default_worker_count(bool(use_selenium))
+        # Split the in-flight budget across workers so the total load on the site stays the same.
+        per_worker_in_flight = WEBDRIVER_POOL_SIZE if use_selenium else max(1, MAX_IN_FLIGHT // num_workers)
+
+        year_scrapers = {}
+        year_links = {}
+        for year in years:
+            scraper = GameScraper()
+            scraper.init(output_dir, str(year), use_selenium, use_proxies)
+            year_scrapers[year] = scraper
+
+        if year_scrapers[years[0]].use_proxies:
+            # Fetch and health-check once here; the workers pick the scored list up from the disk cache.
+            year_scrapers[years[0]].fetch_proxies()
+
+        with ThreadPoolExecutor(max_workers=min(len(years), MAX_IN_FLIGHT) or 1) as executor:
+            discovered = dict(zip(years, executor.map(lambda y: year_scrapers[y].get_all_games(y), years)))
+
+        tasks = []
+        remaining = {}
+        for year in years:
+            game_links = list(dict.fromkeys(discovered.get(year) or []))
+            if not game_links:
+                print(f"Main Process: No game links found for year {year}.")
+                continue
+            year_links[year] = game_links
+            checkpoint = year_scrapers[year].checkpoint
+            completed = checkpoint.index() if checkpoint else {}
+            year_scrapers[year]._drop_incomplete_games(completed, checkpoint.read if checkpoint else None)
+            resumed = sum(1 for link in game_links if link in completed)
+            if resumed:
+                print(f"Main Process: Resuming {year}: {resumed} of {len(game_links)} games already checkpointed.")
+            tasks.extend((year, link) for link in game_links if link not in completed)
+            remaining[year] = len(game_links) - resumed
+
+        def checkpointed_games(year, completed):
+            checkpoint = year_scrapers[year].checkpoint
+            for link in year_links[year]:
+                game_info = checkpoint.read(completed[link]) if link in completed else None
+                if game_info is not None:
+                    yield GameRecord.from_dict(game_info)
+
+        def save_year(year):
+            year_scrapers[year].flush_play_by_play()
+            checkpoint = year_scrapers[year].checkpoint
+            completed = checkpoint.index() if checkpoint else {}
+            game_count = sum(1 for link in year_links[year] if link in completed)
+            if game_count:
+                print(f"Main Process: Finished scraping {game_count} games for {year}. Processing and saving data...")
+                stream_game_data_and_save(checkpointed_games(year, completed), lookup_file, output_dir, str(year), output_formats)
+            else:
+                print(f"Main Process: No game data scraped for year {year}.")
+
+        for year in year_links:
+            if remaining[year] == 0:
+                save_year(year)
+
+        if tasks:
+            batches = [tasks[i:i + SCHEDULER_BATCH_SIZE] for i in range(0, len(tasks), SCHEDULER_BATCH_SIZE)]
+            num_workers = min(num_workers, len(batches))
+            update_status(f"Scraping {len(tasks)} games from {len(year_links)} years with {num_workers} worker processes...", "blue")
+            cancel_event = cancel_event or multiprocessing.Event()
+            telemetry_queue = multiprocessing.Queue()
+            progress = ScrapeProgress({year: len(year_links[year]) for year in year_links}, {year: len(year_links[year]) - remaining[year] for year in year_links})
+            telemetry_done = threading.Event()
+
+            def consume_telemetry():
+                last_update = 0.0
+                while not (telemetry_done.is_set() and telemetry_queue.empty()):
+                    try:
+                        progress.record(*telemetry_queue.get(timeout=0.5))
+                    except queue.Empty:
+                        pass
+                    if time.monotonic() - last_update >= PROGRESS_UPDATE_INTERVAL:
+                        update_progress(progress.render())
+                        last_update = time.monotonic()
+                update_progress(progress.render())
+
+            telemetry_thread = threading.Thread(target=consume_telemetry, name="telemetry", daemon=True)
+            telemetry_thread.start()
+            cancelled_years = set()
+            try:
+                with multiprocessing.Pool(processes=num_workers, initializer=_init_scrape_worker,
+                                          initargs=(output_dir, use_selenium, use_proxies, per_worker_in_flight,
+                                                    {name: globals()[name] for name in WORKER_SETTING_NAMES},
+                                                    telemetry_queue, cancel_event)) as pool:
+                    for batch_results, batch_metrics in pool.imap_unordered(_scrape_game_batch, batches):
+                        get_metrics().merge(batch_metrics)
+                        for year, link, game_info, error in batch_results:
+                            if error is None:
+                                year_scrapers[year]._record_game(game_info)
+                            elif error == SCRAPE_CANCELLED:
+                                cancelled_years.add(year)
+                            else:
+                                year_scrapers[year]._save_failed_link(link, error)
+                            remaining[year] -= 1
+                            if remaining[year] == 0 and year not in cancelled_years:
+                                save_year(year)
+                    # Let the workers exit on their own so their telemetry queues are flushed.
+                    pool.close()
+                    pool.join()
+            finally:
+                telemetry_done.set()
+                telemetry_thread.join()
+                for scraper in year_scrapers.values():
+                    scraper.flush_failed_links()
+                    scraper.flush_play_by_play()
+
+            if cancelled_years:
+                update_status(f"Multi-year scrape cancelled. Unfinished years ({', '.join(map(str, sorted(cancelled_years)))}) "
+                              f"are checkpointed and will resume on the next run.", "orange")
+                return
+
+        update_status(f"Multi-year scrape finished for {len(year_links)} years. Data saved to {output_dir}.", "green")
+    except Exception as e:
+        update_status(f"Error during multi-year scrape: {str(e)}", "red")
+        print(f"Main Process: Error during multi-year scrape: {str(e)}")
+    finally:
+        export_run_metrics(output_dir, run_label)
+        if 'root' in globals() and root.winfo_exists():
+            root.after(0, enable_buttons)
 
 
-def run_multi_year_worker(year, lookup_file, output_dir, worker_index):
+def run_multi_year_worker(year, lookup_file, output_dir, worker_index, use_selenium=None, use_proxies=None, output_formats=None):
     """Worker function that scrapes, processes, and saves data for a single year."""
+    run_label = str(year)
+    get_metrics().reset()
     try:
         print(f"Process {os.getpid()}: Starting scraping for year {year}, worker index {worker_index}")
 
         scraper = GameScraper()
-        scraper.init(output_dir, str(year))
+        scraper.init(output_dir, str(year), use_selenium, use_proxies)
 
-        scraper.fetch_proxies()
+        if scraper.use_proxies:
+            scraper.fetch_proxies()
 
-        if scraper.proxies:
-            initial_proxy_offset = worker_index % len(scraper.proxies)
-            scraper.set_initial_proxy_index(initial_proxy_offset)
-        else:
-            print(f"Process {os.getpid()}: No proxies available after fetch for year {year}. Scraping without proxies.")
+            if scraper.proxies:
+                initial_proxy_offset = worker_index % len(scraper.proxies)
+                scraper.set_initial_proxy_index(initial_proxy_offset)
+            else:
+                print(f"Process {os.getpid()}: No proxies available after fetch for year {year}. Scraping without proxies.")
 
         game_links = scraper.get_all_games(year)
 
         if game_links:
-            print(f"Process {os.getpid()}: Found {len(game_links)} game links for {year}. Starting Selenium scrape...")
-            game_data = scraper.scrape_game_data(game_links)
+            print(f"Process {os.getpid()}: Found {len(game_links)} game links for {year}. Starting scrape...")
+            games_written = stream_game_data_and_save(scraper.iter_game_data(game_links), lookup_file, output_dir, str(year), output_formats)
 
-            if game_data:
-                print(f"Process {os.getpid()}: Finished scraping data for {len(game_data)} games in {year}. Processing and saving data...")
-                process_game_data_and_save(game_data, lookup_file, output_dir, str(year))
-                print(f"Process {os.getpid()}: Finished processing and saving for year {year}.")
+            if games_written:
+                print(f"Process {os.getpid()}: Finished scraping, processing and saving {games_written} games for year {year}.")
             else:
                 print(f"Process {os.getpid()}: No game data scraped for year {year}.")
         else:
@@ -829,15 +4254,81 @@ def run_multi_year_worker(year, lookup_file, output_dir, worker_index):
         print(f"Process {os.getpid()}: An unhandled error occurred during processing year {year}: {str(e)}")
 
     finally:
+        export_run_metrics(output_dir, run_label)
         print(f"Process {os.getpid()}: Worker process for year {year} finished.")
 
 
+# --- Headless command line ---
+
+def build_arg_parser():
+    """Command line for headless runs; the subcommands mirror the UI buttons."""
+    parser = argparse.ArgumentParser(
+        description="Scrape MLB box scores from Baseball-Reference without the UI. Run without arguments to open the window.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--lookup-file", required=True, help="Stadium lookup workbook (.xlsx).")
+    common.add_argument("--output-dir", required=True, help="Directory for the output files.")
+    common.add_argument("--selenium", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Load every page with Selenium (default: {USE_SELENIUM}).")
+    common.add_argument("--proxies", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Route requests through the proxy pool (default: {USE_PROXIES}).")
+    common.add_argument("--formats", nargs="+", choices=list(OUTPUT_BACKENDS), default=None,
+                        help=f"Output formats (default: {' '.join(OUTPUT_FORMATS)}).")
+    common.add_argument("--box-tables", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Also save each game's line score, batting and pitching tables as {BOX_TABLE_FORMAT} (default: {BOX_TABLES_ENABLED}).")
+    common.add_argument("--play-by-play", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Also save each game's play-by-play events as {BOX_TABLE_FORMAT} (default: {PLAY_BY_PLAY_ENABLED}).")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    season_parser = subparsers.add_parser("season", parents=[common], help="Scrape one full season.")
+    season_parser.add_argument("year", type=int)
+    season_parser.add_argument("--update", action="store_true", help="Only scrape games missing from the existing output.")
+    range_parser = subparsers.add_parser("range", parents=[common], help="Scrape every game between two dates.")
+    range_parser.add_argument("start_date", type=lambda value: datetime.strptime(value, "%Y-%m-%d"), help="YYYY-MM-DD")
+    range_parser.add_argument("end_date", type=lambda value: datetime.strptime(value, "%Y-%m-%d"), help="YYYY-MM-DD")
+    redrive_parser = subparsers.add_parser("redrive", parents=[common], help="Re-scrape the links in a run's failed_links.csv and merge them into its output.")
+    redrive_parser.add_argument("year_identifier", help="Season year, or the identifier of a date range run (e.g. 20230401_to_20230430).")
+    years_parser = subparsers.add_parser("years", parents=[common], help="Scrape several seasons with the multi-process scheduler.")
+    years_parser.add_argument("years", type=int, nargs="+")
+    years_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: sized to CPU and memory).")
+    return parser
+
+
+def run_cli(argv):
+    """Runs one headless scrape and returns the process exit code (1 if the run ended with an error status)."""
+    args = build_arg_parser().parse_args(argv)
+    if not os.path.exists(args.lookup_file):
+        print(f"Lookup file not found: {args.lookup_file}")
+        return 2
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.box_tables is not None:
+        set_box_tables_enabled(args.box_tables)
+    if args.play_by_play is not None:
+        set_play_by_play_enabled(args.play_by_play)
+
+    if args.command == "season" and args.update:
+        run_incremental_season_update(str(args.year), args.lookup_file, args.output_dir, args.selenium, args.proxies, output_formats=args.formats)
+    elif args.command == "season":
+        run_single_season_scrape(str(args.year), args.lookup_file, args.output_dir, args.selenium, args.proxies, output_formats=args.formats)
+    elif args.command == "redrive":
+        run_failed_link_redrive(args.year_identifier, args.lookup_file, args.output_dir, args.selenium, args.proxies, output_formats=args.formats)
+    elif args.command == "range":
+        if args.start_date > args.end_date:
+            print("Start date cannot be after end date.")
+            return 2
+        run_date_range_scrape(args.start_date, args.end_date, args.lookup_file, args.output_dir, args.selenium, args.proxies, output_formats=args.formats)
+    elif args.command == "years":
+        run_multi_year_scrape(sorted(set(args.years)), args.lookup_file, args.output_dir, args.selenium, args.proxies,
+                              num_workers=args.workers, output_formats=args.formats)
+    return 1 if last_status_color == "red" else 0
+
+
 # --- Main UI Setup ---
 def main():
     global root, year_entries_frame, lookup_file_path, output_dir_path, status_label, \
            season_entry, start_date_entry, end_date_entry, num_years_spinbox, \
            scrape_all_season_button, scrape_range_button, create_fields_button, \
-           start_multi_year_button, lookup_button, output_dir_button
+           start_multi_year_button, lookup_button, output_dir_button, use_selenium_var, use_proxies_var, \
+           update_season_button, progress_label, cancel_button, redrive_button
 
     root = tk.Tk()
     root.title("Baseball Game Scraper")
@@ -848,7 +4339,7 @@ def main():
 
     row_counter = 0
 
-    file_frame = LabelFrame(root, text="File Selection (Applies to All Scrapes)")
+    file_frame = tk.LabelFrame(root, text="File Selection (Applies to All Scrapes)")
     file_frame.grid(row=row_counter, column=0, columnspan=4, padx=10, pady=10, sticky="ew")
     file_frame.grid_columnconfigure(1, weight=1)
     file_frame.grid_columnconfigure(2, weight=1)
@@ -866,9 +4357,30 @@ def main():
     output_dir_label_dynamic.grid(row=1, column=1, padx=5, pady=5, sticky="w")
     output_dir_button = tk.Button(file_frame, text="Select Output Dir", command=lambda: select_output_directory_wrapper(output_dir_label_dynamic))
     output_dir_button.grid(row=1, column=2, padx=5, pady=5, sticky="w")
+
+    use_selenium_var = tk.BooleanVar(value=USE_SELENIUM)
+    use_selenium_check = tk.Checkbutton(file_frame, text="Load box scores in Chrome (Selenium) instead of plain HTTP", variable=use_selenium_var)
+    use_selenium_check.grid(row=2, column=0, columnspan=3, padx=5, pady=5, sticky="w")
+
+    use_proxies_var = tk.BooleanVar(value=USE_PROXIES)
+    use_proxies_check = tk.Checkbutton(file_frame, text="Route requests through health-checked rotating proxies", variable=use_proxies_var)
+    use_proxies_check.grid(row=3, column=0, columnspan=3, padx=5, pady=5, sticky="w")
+
+    output_formats_frame = tk.Frame(file_frame)
+    output_formats_frame.grid(row=4, column=0, columnspan=3, padx=5, pady=5, sticky="w")
+    tk.Label(output_formats_frame, text="Outputs:").pack(side=tk.LEFT)
+    for output_format in OUTPUT_BACKENDS:
+        output_format_vars[output_format] = tk.BooleanVar(value=output_format in OUTPUT_FORMATS)
+        tk.Checkbutton(output_formats_frame, text=output_format.title(), variable=output_format_vars[output_format]).pack(side=tk.LEFT)
+    box_tables_var = tk.BooleanVar(value=BOX_TABLES_ENABLED)
+    tk.Checkbutton(output_formats_frame, text="Box Score Tables", variable=box_tables_var,
+                   command=lambda: set_box_tables_enabled(box_tables_var.get())).pack(side=tk.LEFT)
+    play_by_play_var = tk.BooleanVar(value=PLAY_BY_PLAY_ENABLED)
+    tk.Checkbutton(output_formats_frame, text="Play-By-Play", variable=play_by_play_var,
+                   command=lambda: set_play_by_play_enabled(play_by_play_var.get())).pack(side=tk.LEFT)
     row_counter += 1
 
-    single_range_frame = LabelFrame(root, text="Single Year or Date Range Scraping")
+    single_range_frame = tk.LabelFrame(root, text="Single Year or Date Range Scraping")
     single_range_frame.grid(row=row_counter, column=0, columnspan=4, padx=10, pady=10, sticky="ew")
     single_range_frame.grid_columnconfigure(1, weight=1)
     single_range_frame.grid_columnconfigure(3, weight=1)
@@ -893,9 +4405,15 @@ def main():
 
     scrape_range_button = tk.Button(single_range_frame, text="Scrape Date Range", command=start_scraping_date_range)
     scrape_range_button.grid(row=0, column=3, padx=5, pady=5, sticky="ew", rowspan=3)
+
+    update_season_button = tk.Button(single_range_frame, text="Update Season\n(New Games Only)", command=start_incremental_season_update)
+    update_season_button.grid(row=0, column=4, padx=5, pady=5, sticky="ew", rowspan=3)
+
+    redrive_button = tk.Button(single_range_frame, text="Redrive Failed\nLinks (Season)", command=start_failed_link_redrive)
+    redrive_button.grid(row=0, column=5, padx=5, pady=5, sticky="ew", rowspan=3)
     row_counter += 1
 
-    multi_year_frame = LabelFrame(root, text="Multi-Year Concurrent Scraping")
+    multi_year_frame = tk.LabelFrame(root, text="Multi-Year Concurrent Scraping")
     multi_year_frame.grid(row=row_counter, column=0, columnspan=4, padx=10, pady=10, sticky="ew")
     multi_year_frame.grid_columnconfigure(1, weight=1)
 
@@ -918,7 +4436,13 @@ def main():
     row_counter += 1
 
     status_label = tk.Label(root, text="Ready", fg="black")
-    status_label.grid(row=row_counter, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
+    status_label.grid(row=row_counter, column=0, columnspan=3, padx=10, pady=5, sticky="ew")
+    cancel_button = tk.Button(root, text="Cancel", command=cancel_scraping, state=tk.DISABLED)
+    cancel_button.grid(row=row_counter, column=3, padx=10, pady=5, sticky="e")
+    row_counter += 1
+
+    progress_label = tk.Label(root, text="", fg="gray25", justify=tk.LEFT, anchor="w", font=("TkFixedFont", 9))
+    progress_label.grid(row=row_counter, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
     row_counter += 1
 
     root.mainloop()
@@ -935,4 +4459,6 @@ if __name__ == "__main__":
         except RuntimeError:
             print("Main Process: Could not set multiprocessing start method to 'spawn'. Proceeding with default.")
 
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
\ No newline at end of file
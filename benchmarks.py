@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+"""
+Offline benchmarks for MLB Data Scraper.py: box score extraction and text export against their original
+implementations, and the whole pipeline against FixtureServer, a local stand-in for baseball-reference.com.
+
+    python benchmarks.py suite [--latency 0.02] [--games 240] [--json results.json] ...
+    python benchmarks.py extraction [fixture dir]
+    python benchmarks.py text-export
+"""
+import argparse
+import contextlib
+import glob
+import hashlib
+import http.server
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta, date
+from urllib.parse import urlparse, parse_qs
+
+import bs4
+import pandas as pd
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MLB Data Scraper.py")
+
+
+def load_scraper():
+    """
+    Imports MLB Data Scraper.py (its file name is not importable) as the mlb_data_scraper module. The module is
+    registered in sys.modules before it runs, so spawned pool workers, which re-import this file, can unpickle
+    the scraper's functions.
+    """
+    if "mlb_data_scraper" in sys.modules:
+        return sys.modules["mlb_data_scraper"]
+    spec = importlib.util.spec_from_file_location("mlb_data_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+mlb = load_scraper()
+
+
+def _legacy_parse_game_page(scraper, html, link):
+    """The original extraction path (full html.parser tree), kept as the benchmark baseline."""
+    game_soup = bs4.BeautifulSoup(html, 'html.parser')
+    game_info = {}
+    game_info = scraper.game_meta_data(game_soup, game_info)
+    game_info = scraper.teams_scores(game_soup, game_info)
+    weather_info = scraper.weather_info_from_soup(game_soup, link)
+    game_info["Temperature"], game_info["Wind Speed"], game_info["Wind Direction"], game_info["Additional Weather Info"] = weather_info
+    game_info['Game Link'] = link
+    return game_info
+
+
+def _measure(function, pages, repeat):
+    """
+    Runs function over every page `repeat` times and returns (pages per second, peak traced memory in bytes, results).
+    The rate is taken from the fastest pass, like timeit, so a busy machine does not skew one side of a comparison.
+    """
+    results = [function(html, link) for link, html in pages] # warm-up, also used for the equality check
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for link, html in pages:
+            function(html, link)
+        elapsed = min(elapsed, time.perf_counter() - start_time)
+    # Memory is traced in a separate pass because tracemalloc itself slows the parsers down considerably.
+    tracemalloc.start()
+    for link, html in pages:
+        function(html, link)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(pages) / elapsed if elapsed else float("inf"), peak_bytes, results
+
+
+def benchmark_extraction(fixture_dir, repeat=5):
+    """
+    Compares box score extraction throughput and peak memory of the original full-tree html.parser path
+    against parse_game_page on saved fixture pages (*.shtml / *.html in fixture_dir).
+    """
+    paths = sorted(glob.glob(os.path.join(fixture_dir, "*.shtml")) + glob.glob(os.path.join(fixture_dir, "*.html")))
+    if not paths:
+        print(f"No fixture pages found in {fixture_dir}.")
+        return None
+    pages = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as fixture_file:
+            pages.append((f"https://www.baseball-reference.com/boxes/{os.path.basename(path)}", fixture_file.read()))
+
+    scraper = mlb.GameScraper()
+    scraper.init()
+    results = {}
+    baseline = None
+    for name, function in (("legacy (html.parser, full tree)", lambda html, link: _legacy_parse_game_page(scraper, html, link)),
+                           (f"targeted ({mlb.resolve_html_parser()}, scorebox only)", scraper.parse_game_page)):
+        pages_per_second, peak_bytes, outputs = _measure(function, pages, repeat)
+        results[name] = {"pages_per_second": pages_per_second, "peak_memory_mb": peak_bytes / 1024 ** 2}
+        outputs = [mlb.as_game_record(output) for output in outputs]
+        if baseline is None:
+            baseline = outputs
+        elif outputs != baseline:
+            print(f"WARNING: {name} produced different game_info than the legacy path.")
+
+    print(f"Extraction benchmark: {len(pages)} fixture pages x {repeat} repeats")
+    for name, result in results.items():
+        print(f"  {name:<40} {result['pages_per_second']:>8.1f} pages/s   peak {result['peak_memory_mb']:>7.2f} MB")
+    return results
+
+
+def _legacy_format_games_text(df):
+    """The original iterrows text export, kept as the benchmark baseline."""
+    lines = []
+    for index, row in df.iterrows():
+        if all(col in df.columns and pd.notna(row.get(col)) for col in mlb.TEXT_EXPORT_COLUMNS):
+            game_data_line = f'"{row["Away Team Symbol"]}{row["Away Team Score"]}@{row["Home Team Symbol"]}{row["Home Team Score"]} T{row["Total Runs Scored"]}",'
+            game_data_line += f'"{row["Date"]}","{row["Time"]}","{row["Time Zone"]}","{row["Venue"]}","{row["Latitude"]}","{row["Longitude"]}"\n'
+            lines.append(game_data_line)
+    return "".join(lines)
+
+
+def _synthetic_games_frame(row_count, seed=0):
+    """Builds an enriched games DataFrame of row_count rows shaped like process_game_data_and_save output."""
+    rng = random.Random(seed)
+    symbols = ["BAL", "BOS", "NYY", "TB", "TOR", "CHC", "LAD", "HOU", "SF", "ATL"]
+    rows = []
+    for i in range(row_count):
+        home_score, away_score = rng.randint(0, 12), rng.randint(0, 12)
+        rows.append({
+            'Date': f"April {1 + i % 30:02d}, 2023", 'Time': f"{1 + i % 12}:05:00PM", 'Venue': f"Venue:Park {i % 30}",
+            'Home Team Score': home_score, 'Away Team Score': away_score, 'Total Runs Scored': home_score + away_score,
+            'Time Zone': "+04:00", 'Latitude': "40N49", 'Longitude': "73W55",
+            # A few incomplete rows, like games whose team was missing from the lookup.
+            'Home Team Symbol': rng.choice(symbols) if i % 97 else None, 'Away Team Symbol': rng.choice(symbols),
+        })
+    return pd.DataFrame(rows)
+
+
+def benchmark_text_export(row_counts=(10_000, 100_000)):
+    """Times the original iterrows text export against format_games_text and checks the output is byte-identical."""
+    results = {}
+    for row_count in row_counts:
+        df = _synthetic_games_frame(row_count)
+        start_time = time.perf_counter()
+        legacy_text = _legacy_format_games_text(df)
+        legacy_seconds = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        vectorized_text = mlb.format_games_text(df)
+        vectorized_seconds = time.perf_counter() - start_time
+        identical = legacy_text.encode("utf-8") == vectorized_text.encode("utf-8")
+        results[row_count] = {"legacy_seconds": legacy_seconds, "vectorized_seconds": vectorized_seconds, "identical": identical}
+        print(f"Text export {row_count:>7} rows: iterrows {legacy_seconds:8.3f}s   vectorized {vectorized_seconds:8.3f}s   "
+              f"speed-up {legacy_seconds / vectorized_seconds if vectorized_seconds else float('inf'):6.1f}x   byte-identical: {identical}")
+    return results
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class FixtureServer:
+    """
+    Local stand-in for baseball-reference.com that serves the recorded fixtures in FIXTURE_DIR:
+    season schedules (the 2023 page with its year rewritten, optionally trimmed to games_per_season games),
+    daily /boxes/ pages (re-dated) and box scores (one of the recorded pages, picked by the link).
+    Each response is delayed by `latency` seconds, fails with a 503 with probability `error_rate` and is
+    refused with a 429 (Retry-After: 1) with probability `rate_limit_rate`.
+    """
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, latency=0.0, error_rate=0.0, games_per_season=None, seed=0, rate_limit_rate=0.0):
+        with open(os.path.join(fixture_dir, "schedule", "2023-schedule.shtml"), "r", encoding="utf-8") as fixture_file:
+            self.schedule_html = fixture_file.read()
+        with open(os.path.join(fixture_dir, "daily", "boxes-2023-04-01.shtml"), "r", encoding="utf-8") as fixture_file:
+            self.daily_html = fixture_file.read()
+        self.box_pages = []
+        for path in sorted(glob.glob(os.path.join(fixture_dir, "boxes", "*.shtml"))):
+            with open(path, "r", encoding="utf-8") as fixture_file:
+                self.box_pages.append(fixture_file.read())
+        if games_per_season:
+            head, *games = self.schedule_html.split('<p class="game">')
+            self.schedule_html = head + "".join('<p class="game">' + game for game in games[:games_per_season])
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.request_count = 0
+        self.error_count = 0
+        self.rate_limited_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def response_for(self, path):
+        """Returns (status_code, html) for a request path, without latency or injected errors."""
+        parsed = urlparse(path)
+        schedule_match = mlb.SCHEDULE_LINK_PATTERN.search(parsed.path)
+        if schedule_match:
+            return 200, self.schedule_html.replace("2023", schedule_match.group(1))
+        if parsed.path.rstrip("/") == "/boxes" and parsed.query:
+            query = parse_qs(parsed.query)
+            day = date(int(query["year"][0]), int(query["month"][0]), int(query["day"][0]))
+            return 200, (self.daily_html.replace("20230401", day.strftime("%Y%m%d"))
+                         .replace("Saturday, April 1, 2023", f"{day.strftime('%A, %B')} {day.day}, {day.year}"))
+        if mlb.BOX_SCORE_LINK_PATTERN.search(parsed.path) and self.box_pages:
+            page_index = int(hashlib.md5(parsed.path.encode("utf-8")).hexdigest(), 16) % len(self.box_pages)
+            return 200, self.box_pages[page_index]
+        return 404, "<html><body><h1>Page Not Found (404 error)</h1></body></html>"
+
+    def _handle(self, path):
+        """Returns (status_code, html, extra headers) for a request, with latency and injected failures applied."""
+        with self._lock:
+            self.request_count += 1
+            roll = self._random.random()
+            failed = roll < self.error_rate
+            rate_limited = not failed and roll < self.error_rate + self.rate_limit_rate
+            self.error_count += failed
+            self.rate_limited_count += rate_limited
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return 503, "<html><body>Service Unavailable</body></html>", {}
+        if rate_limited:
+            return 429, "<html><body>Too Many Requests</body></html>", {"Retry-After": "1"}
+        return (*self.response_for(path), {})
+
+    def start(self):
+        fixture_server = self
+
+        class FixtureRequestHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status_code, html, headers = fixture_server._handle(self.path)
+                body = html.encode("utf-8")
+                self.send_response(status_code)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureRequestHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+@contextlib.contextmanager
+def _config_overrides(**settings):
+    """Temporarily replaces configuration constants of the scraper module (restored on exit)."""
+    previous = {name: getattr(mlb, name) for name in settings}
+    for name, value in settings.items():
+        setattr(mlb, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(mlb, name, value)
+
+
+def _timed(function, *args, **kwargs):
+    """Calls function with its console output suppressed and returns (seconds, result)."""
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(*args, **kwargs)
+    return time.perf_counter() - start_time, result
+
+
+def _stored_game_count(output_dir, year_identifiers):
+    return sum(len(mlb.stored_game_links(output_dir, str(year_identifier))) for year_identifier in year_identifiers)
+
+
+def _selenium_available():
+    """Returns None when a pooled Chrome driver can be started, otherwise the reason it cannot."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            mlb.get_driver_pool()._create_driver().quit()
+        return None
+    except Exception as e:
+        return str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+
+
+BENCHMARK_MODES = ("sequential", "concurrent", "multi-process", "selenium")
+
+
+def benchmark_suite(latency=0.02, error_rate=0.0, games_per_season=240, repeat=3, modes=BENCHMARK_MODES,
+                    lookup_file=None, throttle=False, json_path=None, rate_limit_rate=0.0):
+    """
+    Offline benchmark of the whole pipeline against FixtureServer: link discovery, per-page extraction,
+    lookup merge, export per output format and end-to-end games per second for each scrape mode.
+    The per-host politeness delay is disabled unless `throttle` is set, so results reflect our own code.
+    Results are printed, returned and optionally written to json_path for comparing runs.
+    """
+    lookup_file = lookup_file or os.path.join(os.path.dirname(os.path.abspath(__file__)), "Stadium Info Hist Gm Lookup with TZ Abb.xlsx")
+    server = FixtureServer(latency=latency, error_rate=error_rate, games_per_season=games_per_season, rate_limit_rate=rate_limit_rate).start()
+    results = {"config": {"latency": latency, "error_rate": error_rate, "rate_limit_rate": rate_limit_rate,
+                          "games_per_season": games_per_season, "repeat": repeat,
+                          "throttle": throttle, "html_parser": mlb.resolve_html_parser(), "max_in_flight": mlb.MAX_IN_FLIGHT}}
+    overrides = {"BASE_SITE": server.base_url, "SELENIUM_FALLBACK": False}
+    if not throttle:
+        overrides["PER_HOST_MIN_INTERVAL"] = 0.0
+    try:
+        with tempfile.TemporaryDirectory() as work_dir, _config_overrides(**overrides):
+            scraper = mlb.GameScraper()
+            scraper.init() # no output dir, so nothing is served from the HTTP cache
+
+            # Link discovery: one season schedule, and the daily /boxes/ pages used as the fallback.
+            schedule_seconds = [_timed(scraper.get_all_games, 2023) for _ in range(repeat)]
+            link_count = len(schedule_seconds[0][1] or [])
+            days = [date(2023, 4, 1) + timedelta(days=offset) for offset in range(30)]
+            with ThreadPoolExecutor(max_workers=mlb.PER_HOST_LIMIT) as executor:
+                daily_seconds, _ = _timed(lambda: list(executor.map(scraper.get_game_links_for_day, days)))
+            results["discovery"] = {
+                "schedule_seconds": min(seconds for seconds, _ in schedule_seconds), "schedule_links": link_count,
+                "links_per_second": link_count / min(seconds for seconds, _ in schedule_seconds),
+                "daily_pages_per_second": len(days) / daily_seconds,
+            }
+
+            # Per-page extraction on the recorded box scores.
+            pages = [(f"{server.base_url}/boxes/{os.path.basename(path)[:3]}/{os.path.basename(path)}", html)
+                     for path, html in zip(sorted(glob.glob(os.path.join(FIXTURE_DIR, "boxes", "*.shtml"))), server.box_pages)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                pages_per_second, peak_bytes, parsed_games = _measure(scraper.parse_game_page, pages, repeat)
+            with contextlib.redirect_stdout(io.StringIO()), _config_overrides(BOX_TABLES_ENABLED=True):
+                box_tables_pages_per_second, _, _ = _measure(scraper.parse_game_page, pages, repeat)
+            with contextlib.redirect_stdout(io.StringIO()), _config_overrides(PLAY_BY_PLAY_ENABLED=True):
+                play_by_play_pages_per_second, _, _ = _measure(scraper.parse_game_page, pages, repeat)
+            results["extraction"] = {"pages_per_second": pages_per_second, "peak_memory_mb": peak_bytes / 1024 ** 2,
+                                     "box_tables_pages_per_second": box_tables_pages_per_second,
+                                     "play_by_play_pages_per_second": play_by_play_pages_per_second}
+
+            # Lookup merge on a season-sized batch, spread over every team in the lookup workbook.
+            teams = sorted(mlb.get_stadium_lookup(os.path.abspath(lookup_file)).merge_rows) if os.path.exists(lookup_file) else []
+            game_data = []
+            for i in range(games_per_season or 2430):
+                record = mlb.GameRecord.from_dict(parsed_games[i % len(parsed_games)].to_dict())
+                if teams:
+                    record.home_team, record.away_team = teams[i % len(teams)], teams[(i * 7 + 3) % len(teams)]
+                record.date = (date(2023, 3, 30) + timedelta(days=i % 186)).strftime("%B %d, %Y")
+                game_data.append(record)
+            cold_seconds, merged_df = _timed(mlb.build_game_dataframe, game_data, lookup_file, "benchmark")
+            warm_seconds = min(_timed(mlb.build_game_dataframe, game_data, lookup_file, "benchmark")[0] for _ in range(repeat))
+            results["lookup_merge"] = {"rows": len(game_data), "cold_seconds": cold_seconds, "warm_seconds": warm_seconds,
+                                       "rows_per_second": len(game_data) / warm_seconds if warm_seconds else float("inf"),
+                                       "frame_memory_mb": merged_df.memory_usage(deep=True).sum() / 1024 ** 2 if merged_df is not None else None}
+
+            # Start time normalization, column-wise against row by row, at the sizes normalize_game_datetimes sees: a small
+            # tail chunk, a full OUTPUT_CHUNK_ROWS chunk and a whole season in one frame (the batch is repeated as needed).
+            datetime_columns = ['Date', 'Time', 'Time Zone', 'TZ Abb']
+            if merged_df is not None and all(col in merged_df.columns for col in datetime_columns):
+                results["datetime_normalize"] = {}
+                for row_count in sorted({40, mlb.OUTPUT_CHUNK_ROWS, 2430}):
+                    datetime_df = pd.concat([merged_df[datetime_columns]] * -(-row_count // len(merged_df)), ignore_index=True).iloc[:row_count]
+                    with _config_overrides(DATETIME_COLUMNWISE_MIN_ROWS=0):
+                        column_seconds, normalized = min((_timed(mlb.normalize_game_datetimes, datetime_df.copy()) for _ in range(repeat)), key=lambda timed: timed[0])
+                    row_seconds, (local_start, utc_start) = min((_timed(mlb.game_datetimes_per_row, datetime_df) for _ in range(repeat)), key=lambda timed: timed[0])
+                    mismatches = sum(int((~(normalized[col].eq(per_row) | (normalized[col].isna() & per_row.isna()))).sum())
+                                     for col, per_row in (('Local Start', local_start), ('UTC Start', utc_start)))
+                    results["datetime_normalize"][row_count] = {"column_seconds": column_seconds, "row_seconds": row_seconds,
+                                                                "speedup": row_seconds / column_seconds if column_seconds else float("inf"),
+                                                                "mismatches": mismatches,
+                                                                "path": "column-wise" if row_count >= mlb.DATETIME_COLUMNWISE_MIN_ROWS else "per-row"}
+
+            # Export, one output backend at a time.
+            results["export"] = {}
+            if merged_df is not None:
+                for output_format in mlb.OUTPUT_BACKENDS:
+                    export_dir = os.path.join(work_dir, f"export_{output_format}")
+                    seconds, _ = _timed(mlb.save_game_outputs, merged_df, export_dir, "benchmark", (output_format,))
+                    results["export"][output_format] = {"seconds": seconds, "rows_per_second": len(merged_df) / seconds if seconds else float("inf")}
+
+            # End to end: discovery, scraping, lookup merge and the default outputs, per scrape mode.
+            results["end_to_end"] = {}
+            for mode in modes:
+                output_dir = os.path.join(work_dir, f"e2e_{mode}")
+                os.makedirs(output_dir, exist_ok=True)
+                years = [2023]
+                if mode == "sequential":
+                    with _config_overrides(MAX_IN_FLIGHT=1):
+                        seconds, _ = _timed(mlb.run_single_season_scrape, "2023", lookup_file, output_dir, False, False)
+                elif mode == "concurrent":
+                    seconds, _ = _timed(mlb.run_single_season_scrape, "2023", lookup_file, output_dir, False, False)
+                elif mode == "multi-process":
+                    years = [2022, 2023]
+                    seconds, _ = _timed(mlb.run_multi_year_scrape, years, lookup_file, output_dir, False, False, num_workers=2)
+                elif mode == "selenium":
+                    reason = _selenium_available()
+                    if reason:
+                        results["end_to_end"][mode] = {"skipped": reason}
+                        continue
+                    seconds, _ = _timed(mlb.run_single_season_scrape, "2023", lookup_file, output_dir, True, False)
+                else:
+                    results["end_to_end"][mode] = {"skipped": "unknown mode"}
+                    continue
+                games = _stored_game_count(output_dir, years)
+                results["end_to_end"][mode] = {"games": games, "seconds": seconds, "games_per_second": games / seconds if seconds else float("inf")}
+    finally:
+        server.stop()
+    results["server"] = {"requests": server.request_count, "injected_errors": server.error_count, "rate_limited": server.rate_limited_count}
+
+    print(f"Offline benchmark: latency {latency * 1000:.0f} ms, error rate {error_rate:.0%}, 429 rate {rate_limit_rate:.0%}, {games_per_season} games per season, "
+          f"parser {results['config']['html_parser']}{'' if throttle else ', per-host throttle off'}")
+    discovery = results["discovery"]
+    print(f"  discovery   schedule {discovery['schedule_links']} links in {discovery['schedule_seconds']:.3f}s "
+          f"({discovery['links_per_second']:.0f} links/s)   daily pages {discovery['daily_pages_per_second']:.1f} pages/s")
+    print(f"  extraction  {results['extraction']['pages_per_second']:.1f} pages/s   peak {results['extraction']['peak_memory_mb']:.2f} MB"
+          f"   with box tables {results['extraction']['box_tables_pages_per_second']:.1f} pages/s"
+          f"   with play-by-play {results['extraction']['play_by_play_pages_per_second']:.1f} pages/s")
+    lookup_merge = results["lookup_merge"]
+    print(f"  lookup      {lookup_merge['rows']} rows   cold {lookup_merge['cold_seconds']:.3f}s   warm {lookup_merge['warm_seconds']:.3f}s"
+          f"   frame {lookup_merge['frame_memory_mb'] or 0:.2f} MB")
+    for row_count, datetimes in results.get("datetime_normalize", {}).items():
+        mismatch_note = f"   {datetimes['mismatches']} values differ" if datetimes['mismatches'] else ""
+        print(f"  datetimes   {row_count:>5} rows   column-wise {datetimes['column_seconds']:.4f}s   per-row {datetimes['row_seconds']:.4f}s"
+              f" (column-wise {datetimes['speedup']:.1f}x, uses {datetimes['path']}){mismatch_note}")
+    for output_format, result in results["export"].items():
+        print(f"  export      {output_format:<8} {result['seconds']:.3f}s ({result['rows_per_second']:.0f} rows/s)")
+    for mode, result in results["end_to_end"].items():
+        if "skipped" in result:
+            print(f"  end-to-end  {mode:<14} skipped: {result['skipped']}")
+        else:
+            print(f"  end-to-end  {mode:<14} {result['games']} games in {result['seconds']:.2f}s ({result['games_per_second']:.1f} games/s)")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+        print(f"Benchmark results written to {json_path}")
+    return results
+
+
+def build_benchmark_arg_parser():
+    parser = argparse.ArgumentParser(prog="benchmarks.py suite",
+                                     description="Offline benchmark against a local fixture server.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every response (default: 0.02).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 503 (default: 0).")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with a 429 and Retry-After: 1 (default: 0).")
+    parser.add_argument("--games", dest="games_per_season", type=int, default=240, help="Games per season schedule (default: 240; 2430 is a full season).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--modes", nargs="+", choices=BENCHMARK_MODES, default=list(BENCHMARK_MODES))
+    parser.add_argument("--lookup-file", default=None, help="Stadium lookup workbook (default: the one next to this script).")
+    parser.add_argument("--throttle", action="store_true", help="Keep the PER_HOST_MIN_INTERVAL politeness delay.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the results to this JSON file.")
+    return parser
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    command = sys.argv[1] if len(sys.argv) > 1 else "suite"
+    if command == "extraction":
+        benchmark_extraction(sys.argv[2] if len(sys.argv) > 2 else os.path.join(FIXTURE_DIR, "boxes"))
+    elif command == "text-export":
+        benchmark_text_export()
+    elif command == "suite":
+        # Spawned workers, so the multi-process mode runs them the same way real scrapes do.
+        multiprocessing.set_start_method("spawn", force=True)
+        benchmark_suite(**vars(build_benchmark_arg_parser().parse_args(sys.argv[2:])))
+    else:
+        print(f"Unknown benchmark '{command}'. Available: suite, extraction, text-export.")
+        sys.exit(2)
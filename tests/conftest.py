@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import benchmarks  # noqa: E402 (loads MLB Data Scraper.py as mlb_data_scraper)
+
+LOOKUP_FILE = os.path.join(REPO_DIR, "Stadium Info Hist Gm Lookup with TZ Abb.xlsx")
+
+
+@pytest.fixture(scope="session")
+def mlb():
+    return benchmarks.mlb
+
+
+@pytest.fixture
+def fixture_site(mlb, monkeypatch):
+    """
+    Points the scraper at a FixtureServer serving a 2023 schedule trimmed to 24 games, with no request spacing,
+    no Selenium fallback and no response cache. Yields the server.
+    """
+    server = benchmarks.FixtureServer(games_per_season=24).start()
+    monkeypatch.setattr(mlb, "BASE_SITE", server.base_url)
+    monkeypatch.setattr(mlb, "PER_HOST_MIN_INTERVAL", 0)
+    monkeypatch.setattr(mlb, "SELENIUM_FALLBACK", False)
+    monkeypatch.setattr(mlb, "HTTP_CACHE_ENABLED", False)
+    yield server
+    server.stop()
+
+
+
+def checkpoint_season(mlb, output_dir):
+    """
+    Scrapes the fixture 2023 season into output_dir's checkpoint (and play-by-play parts) without saving it, like a
+    run that stopped just before its save. Returns the GameRecords.
+    """
+    scraper = mlb.GameScraper()
+    scraper.init(output_dir, "2023")
+    return scraper.scrape_game_data(scraper.get_all_games("2023"))
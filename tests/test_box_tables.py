@@ -0,0 +1,141 @@
+import glob
+import os
+
+import bs4
+import pytest
+
+import benchmarks
+from conftest import LOOKUP_FILE, checkpoint_season
+
+BOX_SCORE_FIXTURES = sorted(glob.glob(os.path.join(benchmarks.FIXTURE_DIR, "boxes", "*.shtml")))
+
+
+def read_fixture(path):
+    with open(path, encoding="utf-8") as fixture_file:
+        return fixture_file.read()
+
+
+def cell_text(cell):
+    return " ".join(cell.get_text(" ").split())
+
+
+def columns(rows):
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def soup_box_tables(html):
+    """An independent reading of the page's tables with a full BeautifulSoup tree, in extract_box_tables() form."""
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    tables = [soup] + [bs4.BeautifulSoup(comment, "html.parser") for comment in soup.find_all(string=lambda text: isinstance(text, bs4.Comment))]
+    line_score, stats = [], {"batting": [], "pitching": []}
+    play_by_play = []
+    for fragment in tables:
+        for table in fragment.find_all("table"):
+            table_id = table.get("id") or ""
+            if "linescore" in (table.get("class") or []):
+                header = [cell_text(cell) for cell in table.thead.find_all(["th", "td"])]
+                for side, row in zip(("away", "home"), table.tbody.find_all("tr")):
+                    values = dict(zip(header, (cell_text(cell) for cell in row.find_all(["th", "td"]))))
+                    line_score.append({"Team": cell_text(row.find_all(["th", "td"])[1]),
+                                       "Innings": [None if values[label] == "X" else int(values[label]) for label in header if label.isdigit()],
+                                       "R": int(values["R"]), "H": int(values["H"]), "E": int(values["E"]), "Side": side})
+            elif table_id.endswith(("batting", "pitching")):
+                table_name = "batting" if table_id.endswith("batting") else "pitching"
+                team = table.caption.get_text().strip().removesuffix(" Table")
+                side = "home" if any(row["Side"] == "away" for row in stats[table_name]) else "away"
+                for row in table.tbody.find_all("tr"):
+                    if {"thead", "spacer"} & set(row.get("class") or []):
+                        continue
+                    player_cell = row.find(attrs={"data-stat": "player"})
+                    player = {"Team": team, "Player": cell_text(player_cell), "Player ID": player_cell.get("data-append-csv")}
+                    for cell in player_cell.find_next_siblings(["th", "td"]):
+                        player[cell["data-stat"]] = cell_text(cell) or None
+                    player["Side"] = side
+                    stats[table_name].append(player)
+            elif table_id == "play_by_play":
+                for row in table.tbody.find_all("tr"):
+                    if set(row.get("class") or []) & benchmarks.mlb.PLAY_BY_PLAY_SKIPPED_ROW_CLASSES:
+                        continue
+                    values = {cell.get("data-stat"): cell_text(cell) or None for cell in row.find_all(["th", "td"])}
+                    if values.get("inning"):
+                        play_by_play.append({"Event": len(play_by_play), "Inning": int(values["inning"][1:]),
+                                             "Half": {"t": "top", "b": "bottom"}[values["inning"][0]], **values})
+    return {"line_score": columns(line_score), "batting": columns(stats["batting"]), "pitching": columns(stats["pitching"]),
+            "play_by_play": columns(play_by_play)}
+
+
+@pytest.mark.parametrize("path", BOX_SCORE_FIXTURES, ids=os.path.basename)
+def test_box_tables_match_a_full_parse(mlb, path):
+    html = read_fixture(path)
+    tables = mlb.extract_box_tables(html, mlb.BOX_TABLE_NAMES + ("play_by_play",))
+    expected = soup_box_tables(html)
+
+    assert len(tables["line_score"]["Team"]) == 2
+    assert tables["batting"]["Player"] and tables["pitching"]["Player"] and tables["play_by_play"]["Event"]
+    for table in tables:
+        assert tables[table] == expected[table], table
+
+
+def test_box_tables_can_be_selected(mlb):
+    html = read_fixture(BOX_SCORE_FIXTURES[0])
+    assert list(mlb.extract_box_tables(html)) == list(mlb.BOX_TABLE_NAMES)
+    only_pitching = mlb.extract_box_tables(html, ("pitching",))
+    assert list(only_pitching) == ["pitching"]
+    assert only_pitching["pitching"] == mlb.extract_box_tables(html)["pitching"]
+
+
+def test_line_score_marks_unplayed_innings(mlb):
+    fragment = ('<table class="linescore"><thead><tr><th></th><th></th><th>1</th><th>2</th><th>R</th><th>H</th><th>E</th></tr></thead>'
+                '<tbody><tr><td></td><td><a href="/teams/SFG/2023.shtml">San Francisco Giants</a></td><td>0</td><td>1</td>'
+                '<td>1</td><td>4</td><td>0</td></tr>'
+                '<tr><td></td><td>New York Yankees</td><td>2</td><td>X</td><td>2</td><td>5</td><td>1</td></tr></tbody></table>')
+    assert mlb.parse_line_score(fragment) == [
+        {"Team": "San Francisco Giants", "Innings": [0, 1], "R": 1, "H": 4, "E": 0},
+        {"Team": "New York Yankees", "Innings": [2, None], "R": 2, "H": 5, "E": 1},
+    ]
+
+
+def test_stats_table_cells(mlb):
+    fragment = ('<table id="NewYorkYankeesbatting"><caption>New York Yankees Table</caption><tbody>'
+                '<tr><th data-stat="player" data-append-csv="judgeaa01"><a href="/players/j/judgeaa01.shtml">Aaron Judge</a>\n RF</th>'
+                '<td data-stat="AB">4</td><td data-stat="details">HR&middot;2B</td><td data-stat="WPA"></td></tr>'
+                '<tr class="thead"><th data-stat="player">Batting</th><td data-stat="AB">AB</td></tr>'
+                '<tr class="spacer"><td colspan="3"></td></tr>'
+                '<tr data-class="thead"><th data-stat="player" data-append-csv="o&#39;neila01">Al O&#39;Neil</th>'
+                '<td data-stat="AB">1</td></tr></tbody></table>')
+    assert mlb.parse_stats_table(fragment) == [
+        {"Team": "New York Yankees", "Player": "Aaron Judge RF", "Player ID": "judgeaa01", "AB": "4", "details": "HR·2B", "WPA": None},
+        {"Team": "New York Yankees", "Player": "Al O'Neil", "Player ID": "o'neila01", "AB": "1"},
+    ]
+
+
+def test_play_by_play_skips_summary_rows(mlb):
+    fragment = ('<table id="play_by_play"><tbody>'
+                '<tr id="event_1"><th data-stat="inning">t1</th><td data-stat="outs">0</td><td data-stat="play_desc">Single to LF</td></tr>'
+                '<tr class="pbp_summary_top"><td colspan="2">Top of the 1st</td></tr>'
+                '<tr class="ingame_substitution"><td data-stat="inning">b1</td><td>Defensive change</td></tr>'
+                '<tr id="event_2"><th data-stat="inning">b1</th><td data-stat="outs">1</td>'
+                '<td data-stat="win_probability_added">3%</td></tr></tbody></table>')
+    assert mlb.parse_play_by_play(fragment) == {
+        "Event": [0, 1], "Inning": [1, 1], "Half": ["top", "bottom"], "inning": ["t1", "b1"], "outs": ["0", "1"],
+        "play_desc": ["Single to LF", None], "win_probability_added": [None, "3%"],
+    }
+    assert mlb.parse_play_by_play('<table id="play_by_play"><tbody></tbody></table>') == {}
+
+
+@pytest.mark.parametrize("checkpointed_with_tables", [False, True])
+def test_resumed_games_get_box_tables(mlb, fixture_site, tmp_path, monkeypatch, checkpointed_with_tables):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(mlb, "BOX_TABLE_FORMAT", "parquet")
+    monkeypatch.setattr(mlb, "BOX_TABLES_ENABLED", checkpointed_with_tables)
+    games = checkpoint_season(mlb, str(tmp_path))
+
+    monkeypatch.setattr(mlb, "BOX_TABLES_ENABLED", True)
+    requests_before = fixture_site.request_count
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("csv",))
+
+    # Games checkpointed without their tables are scraped again; the others are read back with them.
+    assert fixture_site.request_count - requests_before == 1 + (0 if checkpointed_with_tables else len(games))
+    for table in mlb.BOX_TABLE_NAMES:
+        assert set(mlb.load_box_table(str(tmp_path), table)["Game Link"]) == {game.game_link for game in games}
@@ -0,0 +1,86 @@
+import os
+import threading
+
+import pytest
+
+from conftest import LOOKUP_FILE, checkpoint_season
+
+
+def scrape_season(mlb, output_dir):
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, output_dir, output_formats=("csv", "text"))
+
+
+def read(path):
+    with open(path, "rb") as output_file:
+        return output_file.read()
+
+
+def test_checkpoint_round_trip(mlb, tmp_path):
+    checkpoint = mlb.GameCheckpoint(str(tmp_path / "2023_checkpoint.jsonl"))
+    checkpoint.append({"Game Link": "/boxes/NYA/NYA202303300.shtml", "Venue": "Venue:Yankee Stadium III"})
+    checkpoint.append({"Game Link": "/boxes/BOS/BOS202304010.shtml", "Venue": "Venue:Fenway Park"})
+
+    assert list(checkpoint.load()) == ["/boxes/NYA/NYA202303300.shtml", "/boxes/BOS/BOS202304010.shtml"]
+    offsets = checkpoint.index()
+    assert checkpoint.read(offsets["/boxes/BOS/BOS202304010.shtml"])["Venue"] == "Venue:Fenway Park"
+
+
+def test_torn_last_line_is_skipped_and_not_merged_into(mlb, tmp_path):
+    path = tmp_path / "2023_checkpoint.jsonl"
+    path.write_text('{"Game Link": "/boxes/NYA/NYA202303300.shtml"}\n{"Game Link": "/boxes/BO', encoding="utf-8")
+    checkpoint = mlb.GameCheckpoint(str(path))
+    assert list(checkpoint.load()) == ["/boxes/NYA/NYA202303300.shtml"]
+
+    checkpoint.append({"Game Link": "/boxes/HOU/HOU202304020.shtml"})
+    assert list(mlb.GameCheckpoint(str(path)).load()) == ["/boxes/NYA/NYA202303300.shtml", "/boxes/HOU/HOU202304020.shtml"]
+
+
+def test_interrupted_scrape_resumes_from_checkpoint(mlb, fixture_site, tmp_path):
+    complete_dir, resumed_dir = str(tmp_path / "complete"), str(tmp_path / "resumed")
+    scrape_season(mlb, complete_dir)
+    game_count = fixture_site.request_count - 1 # less the schedule page
+    assert game_count == 24
+
+    # A run that crashed after ten games, in the middle of writing the eleventh.
+    checkpoint_season(mlb, resumed_dir)
+    checkpoint_path = os.path.join(resumed_dir, "2023_checkpoint.jsonl")
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        lines = checkpoint_file.readlines()
+    with open(checkpoint_path, "wb") as checkpoint_file:
+        checkpoint_file.writelines(lines[:10])
+        checkpoint_file.write(lines[10][:40])
+
+    requests_before = fixture_site.request_count
+    scrape_season(mlb, resumed_dir)
+
+    assert fixture_site.request_count - requests_before == 1 + game_count - 10
+    for filename in ("2023_games_data.csv", "2023_games_data.txt"):
+        assert read(os.path.join(resumed_dir, filename)) == read(os.path.join(complete_dir, filename))
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_cancelled_run_keeps_its_checkpoint(mlb, fixture_site, tmp_path):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    checkpoint_season(mlb, str(tmp_path))
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("csv",), cancel_event=cancel_event)
+    assert len(mlb.GameCheckpoint.for_run(str(tmp_path), "2023").load()) == 24
+    assert not os.path.exists(tmp_path / "2023_games_data.csv")
+
+
+def test_completed_run_is_scraped_again_with_new_settings(mlb, fixture_site, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    scrape_season(mlb, str(tmp_path))
+    assert not os.path.exists(tmp_path / "2023_checkpoint.jsonl")
+
+    monkeypatch.setattr(mlb, "BOX_TABLES_ENABLED", True)
+    monkeypatch.setattr(mlb, "PLAY_BY_PLAY_ENABLED", True)
+    requests_before = fixture_site.request_count
+    scrape_season(mlb, str(tmp_path))
+
+    assert fixture_site.request_count - requests_before == 1 + 24
+    game_links = mlb.stored_game_links(str(tmp_path), "2023")
+    assert len(game_links) == 24
+    for table in mlb.BOX_TABLE_NAMES:
+        assert set(mlb.load_box_table(str(tmp_path), table)["Game Link"]) == game_links
+    assert set(mlb.load_play_by_play(str(tmp_path))["Game Link"]) == game_links
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from conftest import LOOKUP_FILE, checkpoint_season
+
+OUTPUT_FORMATS = ("excel", "text", "csv", "sqlite")
+
+
+def stored_rows(mlb, output_dir):
+    with sqlite3.connect(os.path.join(output_dir, mlb.SQLITE_DB_FILENAME)) as connection:
+        return connection.execute(f'SELECT COUNT(*), COUNT(DISTINCT "Game Link") FROM {mlb.SQLITE_TABLE}').fetchone()
+
+
+def sorted_lines(path):
+    with open(path, encoding="utf-8") as output_file:
+        return sorted(output_file.read().splitlines())
+
+
+def test_upsert_is_idempotent(mlb, tmp_path):
+    database = mlb.GameDatabase(str(tmp_path / "games.sqlite"))
+    games = pd.DataFrame({
+        "Game Link": ["/boxes/NYA/NYA202303300.shtml", "/boxes/BOS/BOS202304010.shtml", None],
+        "Home Team Score": [5, 3, 1],
+    })
+    try:
+        assert database.upsert_dataframe(games) == 2
+        database.upsert_dataframe(games)
+        first = database.load()
+        assert len(first) == 2
+        assert first["Season"].tolist() == [2023, 2023]
+
+        # A later scrape of the same game replaces its values and may bring new columns.
+        database.upsert_dataframe(games.iloc[:1].assign(**{"Home Team Score": 6, "Venue": "Venue:Yankee Stadium III"}))
+        second = database.load().set_index("Game Link")
+        assert len(second) == 2
+        assert second.loc["/boxes/NYA/NYA202303300.shtml", "Home Team Score"] == 6
+        assert second.loc["/boxes/NYA/NYA202303300.shtml", "Venue"] == "Venue:Yankee Stadium III"
+        assert second.loc["/boxes/BOS/BOS202304010.shtml", "Home Team Score"] == 3
+        assert pd.isna(second.loc["/boxes/BOS/BOS202304010.shtml", "Venue"])
+    finally:
+        database.close()
+
+
+def test_repeated_saves_keep_one_row_per_game(mlb, fixture_site, tmp_path):
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("sqlite",))
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("sqlite",))
+    assert stored_rows(mlb, str(tmp_path)) == (24, 24)
+
+
+def test_update_adds_only_missing_games(mlb, fixture_site, tmp_path):
+    complete_dir, updated_dir = str(tmp_path / "complete"), str(tmp_path / "updated")
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, complete_dir, output_formats=OUTPUT_FORMATS)
+    games = checkpoint_season(mlb, str(tmp_path / "scraped"))
+
+    # The output of an earlier run that saw only the first 15 games of the season.
+    mlb.stream_game_data_and_save(games[:15], LOOKUP_FILE, updated_dir, "2023", OUTPUT_FORMATS)
+    assert len(mlb.stored_game_links(updated_dir, "2023")) == 15
+
+    requests_before = fixture_site.request_count
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, updated_dir, output_formats=OUTPUT_FORMATS)
+    assert fixture_site.request_count - requests_before == 1 + 9
+
+    assert mlb.stored_game_links(updated_dir, "2023") == {game.game_link for game in games}
+    for filename in ("2023_games_data.csv", "2023_games_data.txt"):
+        assert sorted_lines(os.path.join(updated_dir, filename)) == sorted_lines(os.path.join(complete_dir, filename))
+    excel = pd.read_excel(os.path.join(updated_dir, "2023_games_data.xlsx"))
+    assert len(excel) == 24 and excel["Game Link"].is_unique
+    assert stored_rows(mlb, updated_dir) == (24, 24)
+    assert not [filename for filename in os.listdir(updated_dir) if filename.endswith(".partial")]
+
+    requests_before = fixture_site.request_count
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, updated_dir, output_formats=OUTPUT_FORMATS)
+    assert fixture_site.request_count - requests_before == 1
+    assert sorted_lines(os.path.join(updated_dir, "2023_games_data.csv")) == sorted_lines(os.path.join(complete_dir, "2023_games_data.csv"))
+
+
+def test_update_appends_to_columnar_outputs(mlb, fixture_site, tmp_path):
+    pytest.importorskip("pyarrow")
+    complete_dir, updated_dir = str(tmp_path / "complete"), str(tmp_path / "updated")
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, complete_dir, output_formats=("parquet", "feather"))
+    games = checkpoint_season(mlb, str(tmp_path / "scraped"))
+    mlb.stream_game_data_and_save(games[:15], LOOKUP_FILE, updated_dir, "2023", ("parquet", "feather"))
+
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, updated_dir, output_formats=("parquet", "feather"))
+
+    for file_format in ("parquet", "feather"):
+        expected = mlb.load_games(complete_dir, file_format=file_format).sort_values("Game Link", ignore_index=True)
+        updated = mlb.load_games(updated_dir, file_format=file_format).sort_values("Game Link", ignore_index=True)
+        pd.testing.assert_frame_equal(updated, expected)
+
+
+def test_update_of_text_only_output(mlb, fixture_site, tmp_path):
+    complete_dir, updated_dir = str(tmp_path / "complete"), str(tmp_path / "updated")
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, complete_dir, output_formats=("text",))
+    games = checkpoint_season(mlb, str(tmp_path / "scraped"))
+    mlb.stream_game_data_and_save(games[:15], LOOKUP_FILE, updated_dir, "2023", ("text",))
+
+    requests_before = fixture_site.request_count
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, updated_dir, output_formats=("text",))
+    assert fixture_site.request_count - requests_before == 1 + 9
+    assert sorted_lines(os.path.join(updated_dir, "2023_games_data.txt")) == sorted_lines(os.path.join(complete_dir, "2023_games_data.txt"))
+    assert mlb.stored_game_links(updated_dir, "2023") == {game.game_link for game in games}
+
+    requests_before = fixture_site.request_count
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, complete_dir, output_formats=("text",))
+    assert fixture_site.request_count - requests_before == 1
+    assert len(sorted_lines(os.path.join(complete_dir, "2023_games_data.txt"))) == 24
+
+
+def test_update_refuses_text_output_without_links(mlb, fixture_site, tmp_path):
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("text",))
+    os.remove(mlb.game_links_path(str(tmp_path), "2023")) # saved before the text output listed its links
+    text_before = sorted_lines(os.path.join(tmp_path, "2023_games_data.txt"))
+
+    requests_before = fixture_site.request_count
+    mlb.run_incremental_season_update("2023", LOOKUP_FILE, str(tmp_path), output_formats=("text",))
+    assert fixture_site.request_count - requests_before == 1
+    assert sorted_lines(os.path.join(tmp_path, "2023_games_data.txt")) == text_before
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from conftest import LOOKUP_FILE, checkpoint_season
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def play_by_play_site(mlb, fixture_site, monkeypatch):
+    monkeypatch.setattr(mlb, "PLAY_BY_PLAY_ENABLED", True)
+    monkeypatch.setattr(mlb, "PLAY_BY_PLAY_CHUNK_ROWS", 200)
+    monkeypatch.setattr(mlb, "BOX_TABLE_FORMAT", "parquet")
+    return fixture_site
+
+
+def scrape_season(mlb, output_dir):
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, output_dir, output_formats=("csv",))
+
+
+def test_events_are_stored_once_per_game(mlb, play_by_play_site, tmp_path):
+    games = checkpoint_season(mlb, str(tmp_path))
+    events = mlb.load_play_by_play(str(tmp_path))
+    assert set(events["Game Link"]) == {game.game_link for game in games}
+    assert not events.duplicated(["Game Link", "Event"]).any()
+    assert len(mlb.PlayByPlayWriter(str(tmp_path), "2023").part_paths()) > 1
+    # The checkpoint keeps only each game's event count, which the resume check relies on.
+    checkpointed = mlb.GameCheckpoint.for_run(str(tmp_path), "2023").load()
+    assert {link: game["Play-By-Play Events"] for link, game in checkpointed.items()} == events.groupby("Game Link").size().to_dict()
+
+
+def test_games_whose_events_were_lost_are_scraped_again(mlb, play_by_play_site, tmp_path):
+    checkpoint_season(mlb, str(tmp_path))
+    all_events = mlb.load_play_by_play(str(tmp_path))
+
+    # A crash between checkpointing games and flushing their events loses the unwritten part.
+    last_part = mlb.PlayByPlayWriter(str(tmp_path), "2023").part_paths()[-1]
+    lost_links = set(mlb.pd.read_parquet(last_part, columns=["Game Link"])["Game Link"])
+    os.remove(last_part)
+
+    requests_before = play_by_play_site.request_count
+    scrape_season(mlb, str(tmp_path))
+    assert play_by_play_site.request_count - requests_before == 1 + len(lost_links)
+
+    events = mlb.load_play_by_play(str(tmp_path))
+    assert set(events["Game Link"]) == set(all_events["Game Link"])
+    assert len(events) == len(all_events)
+    assert not events.duplicated(["Game Link", "Event"]).any()
+
+
+def test_games_checkpointed_without_play_by_play_are_scraped_again(mlb, fixture_site, tmp_path, monkeypatch):
+    monkeypatch.setattr(mlb, "PLAY_BY_PLAY_ENABLED", False)
+    games = checkpoint_season(mlb, str(tmp_path))
+
+    monkeypatch.setattr(mlb, "PLAY_BY_PLAY_ENABLED", True)
+    monkeypatch.setattr(mlb, "BOX_TABLE_FORMAT", "parquet")
+    requests_before = fixture_site.request_count
+    scrape_season(mlb, str(tmp_path))
+
+    assert fixture_site.request_count - requests_before == 1 + len(games)
+    events = mlb.load_play_by_play(str(tmp_path))
+    assert set(events["Game Link"]) == {game.game_link for game in games}
+    assert not events.duplicated(["Game Link", "Event"]).any()
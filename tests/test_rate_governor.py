@@ -0,0 +1,138 @@
+import email.utils
+import threading
+import time
+
+import pytest
+
+from conftest import LOOKUP_FILE
+
+URL = "https://www.baseball-reference.com/boxes/NYA/NYA202303300.shtml"
+HOST = "www.baseball-reference.com"
+
+
+@pytest.fixture
+def governor(mlb, monkeypatch):
+    monkeypatch.setattr(mlb, "GOVERNOR_ENABLED", True)
+    monkeypatch.setattr(mlb, "GOVERNOR_MAX_CONCURRENCY", 4)
+    monkeypatch.setattr(mlb, "GOVERNOR_MIN_CONCURRENCY", 1)
+    monkeypatch.setattr(mlb, "GOVERNOR_DECREASE_FACTOR", 0.5)
+    monkeypatch.setattr(mlb, "GOVERNOR_BASE_COOLDOWN", 5)
+    monkeypatch.setattr(mlb, "GOVERNOR_MAX_COOLDOWN", 300)
+    monkeypatch.setattr(mlb, "PER_HOST_MIN_INTERVAL", 0)
+    return mlb.RateGovernor()
+
+
+def respond(governor, status_code, retry_after=None):
+    governor.release(governor.acquire(URL), status_code, retry_after)
+
+
+def paused_for(governor):
+    return governor._state(HOST)["paused_until"] - time.monotonic()
+
+
+def test_throttle_halves_limit_and_success_adds_one_per_round(governor):
+    assert governor.limit(URL) == 4
+    respond(governor, 429, retry_after=0)
+    assert governor.limit(URL) == 2
+    respond(governor, 200)
+    assert governor.limit(URL) == 2.5
+    respond(governor, 200)
+    assert governor.limit(URL) == pytest.approx(2.9)
+    for _ in range(20):
+        respond(governor, 200)
+    assert governor.limit(URL) == 4
+
+
+def test_limit_never_drops_below_minimum(governor):
+    for status_code in (429, 503, 500, None, 403):
+        respond(governor, status_code, retry_after=0)
+    assert governor.limit(URL) == 1
+
+
+def test_server_and_network_errors_decrease_without_pausing(governor):
+    respond(governor, 500)
+    respond(governor, None)
+    assert governor.limit(URL) == 1
+    assert paused_for(governor) <= 0
+
+
+def test_retry_after_sets_the_pause(governor):
+    respond(governor, 429, retry_after=30)
+    assert 29 < paused_for(governor) <= 30
+
+
+def test_cooldown_grows_without_retry_after_and_is_capped(mlb, governor, monkeypatch):
+    respond(governor, 503)
+    assert 4 < paused_for(governor) <= 5
+    governor._state(HOST)["paused_until"] = 0.0
+    respond(governor, 503)
+    assert 9 < paused_for(governor) <= 10
+
+    monkeypatch.setattr(mlb, "GOVERNOR_MAX_COOLDOWN", 7)
+    governor._state(HOST)["paused_until"] = 0.0
+    respond(governor, 429, retry_after=3600)
+    assert 6 < paused_for(governor) <= 7
+
+
+def test_disabled_governor_keeps_the_limit(mlb, governor, monkeypatch):
+    monkeypatch.setattr(mlb, "GOVERNOR_ENABLED", False)
+    respond(governor, 429, retry_after=30)
+    assert governor.limit(URL) == 4
+    assert paused_for(governor) <= 0
+
+
+def test_acquire_waits_out_the_pause(governor):
+    respond(governor, 429, retry_after=0.2)
+    start_time = time.monotonic()
+    governor.release(governor.acquire(URL), 200)
+    assert time.monotonic() - start_time >= 0.19
+
+
+def test_acquire_waits_for_a_free_slot(mlb, governor, monkeypatch):
+    monkeypatch.setattr(mlb, "GOVERNOR_MAX_CONCURRENCY", 1)
+    governor = mlb.RateGovernor()
+    host = governor.acquire(URL)
+    acquired = threading.Event()
+
+    def second_request():
+        governor.acquire(URL)
+        acquired.set()
+
+    threading.Thread(target=second_request, daemon=True).start()
+    assert not acquired.wait(0.2)
+    governor.release(host, 200)
+    assert acquired.wait(2)
+
+
+def test_parse_retry_after(mlb):
+    assert mlb.parse_retry_after("120") == 120.0
+    assert mlb.parse_retry_after(" 7 ") == 7.0
+    http_date = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert 55 < mlb.parse_retry_after(http_date) <= 60
+    assert mlb.parse_retry_after(email.utils.formatdate(time.time() - 60, usegmt=True)) == 0.0
+    assert mlb.parse_retry_after("soon") is None
+    assert mlb.parse_retry_after(None) is None
+
+
+def test_next_retry_delay(mlb, monkeypatch):
+    monkeypatch.setattr(mlb, "LINK_MAX_RETRIES", 3)
+    monkeypatch.setattr(mlb, "LINK_RETRY_BASE_DELAY", 2)
+    monkeypatch.setattr(mlb, "LINK_RETRY_MAX_DELAY", 120)
+    assert mlb.next_retry_delay(mlb.FetchError(429, retry_after=7), 1) == 7
+    assert mlb.next_retry_delay(mlb.FetchError(429, retry_after=3600), 1) == 120
+    assert 2 <= mlb.next_retry_delay(mlb.FetchError(503), 3) <= 8
+    assert mlb.next_retry_delay(mlb.FetchError(503), 4) is None
+    assert mlb.next_retry_delay(mlb.FetchError(404), 1) is None
+    assert mlb.next_retry_delay(ValueError("no scorebox"), 1) is None
+
+
+def test_rate_limited_scrape_retries_every_game(mlb, fixture_site, tmp_path, monkeypatch):
+    fixture_site.rate_limit_rate = 0.3
+    monkeypatch.setattr(mlb, "GOVERNOR_MAX_COOLDOWN", 0.05)
+    monkeypatch.setattr(mlb, "LINK_RETRY_MAX_DELAY", 0.05)
+    monkeypatch.setattr(mlb, "LINK_MAX_RETRIES", 10)
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("csv",))
+
+    assert fixture_site.rate_limited_count > 0
+    assert len(mlb.stored_game_links(str(tmp_path), "2023")) == 24
+    assert not mlb.FailedLinkLog.for_run(str(tmp_path), "2023").load()
@@ -0,0 +1,39 @@
+import pytest
+
+import benchmarks
+from conftest import LOOKUP_FILE
+
+
+@pytest.mark.parametrize("compact_dtypes", [False, True])
+def test_text_export_is_byte_identical_to_iterrows(mlb, compact_dtypes):
+    df = benchmarks._synthetic_games_frame(500)
+    if compact_dtypes:
+        df = mlb.apply_game_dtypes(df)
+    assert mlb.format_games_text(df).encode("utf-8") == benchmarks._legacy_format_games_text(df).encode("utf-8")
+
+
+def test_text_export_skips_incomplete_rows(mlb):
+    df = benchmarks._synthetic_games_frame(50)
+    df.loc[3, "Home Team Score"] = None
+    df["Latitude"] = 40.5
+    text = mlb.format_games_text(df)
+    assert text == benchmarks._legacy_format_games_text(df)
+    assert text.count("\n") == df.notna().all(axis=1).sum()
+
+
+def test_text_export_without_rows_or_columns(mlb):
+    df = benchmarks._synthetic_games_frame(10)
+    assert mlb.format_games_text(df.iloc[:0]) == ""
+    assert mlb.format_games_text(df.drop(columns="Venue")) == ""
+    assert mlb.format_games_text(None) == ""
+
+
+def test_chunked_text_file_matches_iterrows_export(mlb, fixture_site, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(mlb, "OUTPUT_CHUNK_ROWS", 7)
+    mlb.run_single_season_scrape("2023", LOOKUP_FILE, str(tmp_path), output_formats=("text", "parquet"))
+
+    games = mlb.load_games(str(tmp_path))
+    assert len(games) == 24
+    with open(tmp_path / "2023_games_data.txt", "rb") as text_file:
+        assert text_file.read() == benchmarks._legacy_format_games_text(games).encode("utf-8")